@@ -1,17 +1,42 @@
 import matplotlib.pyplot as plt
 import pymc3 as pm
+import arviz as az
 import numpy as np
 import theano
 import theano.tensor as tt
-from scipy.optimize import approx_fprime
-
+from functools import partial
+from multiprocessing import Pool
+from scipy.linalg import cho_factor, cho_solve, solve_triangular
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # numba is an optional dependency
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    # do not use parallel=True. The numba workqueue threading layer is not
+    # fork safe and pm.sample forks a process for each chain
+    @njit(cache=True)
+    def gaussian_loglike_diagonal_noise_numba(
+            model_vals, data, noise_covar_inv, vals):
+        """
+        Compute the Gaussian log-likelihood of each row of model_vals when
+        the noise covariance is diagonal. The residuals are never stored.
+        """
+        for ii in range(model_vals.shape[0]):
+            tmp = 0.
+            for jj in range(data.shape[0]):
+                residual = data[jj]-model_vals[ii,jj]
+                tmp += residual*residual*noise_covar_inv[jj]
+            vals[ii] = -0.5*tmp
 
 class GaussianLogLike(object):
     """
     A Gaussian log-likelihood function for a model with parameters given in 
     sample
     """
-    def __init__(self,model,data,noise_covar):
+    def __init__(self,model,data,noise_covar,model_jac=None):
         """
         Initialise the Op with various things that our log-likelihood function
         requires. Below are the things that are needed in this particular
@@ -25,25 +50,58 @@ class GaussianLogLike(object):
         data : np.ndarray (nobs)
             The "observed" data
 
-        noise_covar : float
+        noise_covar : float or np.ndarray (nobs) or np.ndarray (nobs,nobs)
             The noise covariance
+
+        model_jac : callable
+            The Jacobian of the model with signature
+
+            ``model_jac(sample) -> np.ndarray (nobs,nvars)``
+
+            where sample is a np.ndarray (nvars,1). If provided the exact
+            gradient of the log-likelihood is available via ``gradient``
         """
         self.model=model
-        self.data=data
+        self.data=np.ascontiguousarray(data,dtype=float)
         assert self.data.ndim==1
         self.ndata = data.shape[0]
-        self.noise_covar_inv = self.noise_covariance_inverse(noise_covar)
-
-    def noise_covariance_inverse(self,noise_covar):
+        self.set_noise_covariance(noise_covar)
+        self._residuals = None
+        self.model_jac=model_jac
+        if self.model_jac is not None:
+            # only expose a gradient when it can be computed exactly so
+            # LogLikeGrad can fall back to finite differences otherwise
+            self.gradient = self._gradient
+
+    def set_noise_covariance(self,noise_covar):
+        """
+        Precompute the quantities needed to apply the inverse of the noise
+        covariance. Scalar covariances are broadcast to the diagonal of
+        length ndata and the inverse of the diagonal is stored in
+        noise_covar_inv. Dense covariances are never inverted explicitly,
+        instead the lower Cholesky factor is stored in
+        noise_covar_chol_factor.
+
+        The function used to evaluate the log-likelihood from the model
+        values is also chosen here so __call__ does not need to check the
+        type of the noise covariance each time it is called.
+        """
+        self.noise_covar_inv, self.noise_covar_chol_factor = None, None
         if np.isscalar(noise_covar):
-            inv_covar = 1/noise_covar
+            self.noise_covar_inv = np.full(self.ndata,1/noise_covar)
         elif noise_covar.ndim==1:
             assert noise_covar.shape[0]==self.data.shape[0]
-            inv_covar = 1/noise_covar
+            self.noise_covar_inv = 1/noise_covar
         elif noise_covar.ndim==2:
-            assert noise_covar.shape==[self.ndata,self.ndata]
-            inv_covar = np.linalg.inv(noise_covar)
-        return inv_covar
+            assert noise_covar.shape==(self.ndata,self.ndata)
+            self.noise_covar_chol_factor = cho_factor(noise_covar,lower=True)
+
+        if self.noise_covar_chol_factor is not None:
+            self._loglike_from_model_values = self._dense_noise_loglike
+        elif NUMBA_AVAILABLE:
+            self._loglike_from_model_values = self._diagonal_noise_loglike_numba
+        else:
+            self._loglike_from_model_values = self._diagonal_noise_loglike
 
     # def noise_covariance_determinant(self, noise_covar):
     #     """The determinant is only necessary in log likelihood if the noise 
@@ -58,19 +116,70 @@ class GaussianLogLike(object):
     #     return determinant
 
     def __call__(self,samples):
-        model_vals = self.model(samples)
+        # wrapped solvers can return Fortran ordered arrays. Copy once here,
+        # if necessary, so every kernel below accesses rows contiguously
+        model_vals = np.ascontiguousarray(self.model(samples),dtype=float)
         assert model_vals.ndim==2
         assert model_vals.shape[1]==self.ndata
+        return self._loglike_from_model_values(model_vals)
+
+    def compute_residuals(self,model_vals):
+        """
+        Compute the residuals of all samples. The residuals are written into
+        a buffer that is reused by subsequent calls with the same number of
+        samples. The log-likelihood values are always returned in a new
+        array because callers, e.g. PYMC3LogLikeWrapper, store them.
+        """
+        if self._residuals is None or self._residuals.shape!=model_vals.shape:
+            self._residuals = np.empty(model_vals.shape)
+        return np.subtract(self.data,model_vals,out=self._residuals)
+
+    def _diagonal_noise_loglike(self,model_vals):
+        # evaluate the quadratic form of all samples at once
+        residuals = self.compute_residuals(model_vals)
+        vals = np.einsum(
+            'ij,j,ij->i',residuals,self.noise_covar_inv,residuals)
+        return -0.5*vals[:,np.newaxis]
+
+    def _diagonal_noise_loglike_numba(self,model_vals):
         vals = np.empty((model_vals.shape[0],1))
-        for ii in range(model_vals.shape[0]):
-            residual = self.data - model_vals[ii,:]
-            if np.isscalar(self.noise_covar_inv) or self.noise_covar_inv.ndim==1:
-                vals[ii] = (residual.T*self.noise_covar_inv).dot(residual)
-            else:
-                vals[ii] = residual.T.dot(self.noise_covar_inv).dot(residual)
-        vals *= -0.5
+        gaussian_loglike_diagonal_noise_numba(
+            model_vals,self.data,
+            self.noise_covar_inv,vals[:,0])
         return vals
 
+    def _dense_noise_loglike(self,model_vals):
+        residuals = self.compute_residuals(model_vals)
+        # r^TC^{-1}r = ||L^{-1}r||^2 where C=LL^T so only one triangular
+        # solve, with all residuals as right hand sides, is needed
+        tmp = solve_triangular(
+            self.noise_covar_chol_factor[0],residuals.T,lower=True)
+        vals = np.einsum('ij,ij->j',tmp,tmp)
+        return -0.5*vals[:,np.newaxis]
+
+    def _gradient(self,sample):
+        """
+        Compute the gradient of the log-likelihood J^T C^{-1}(d-f(z)) at a
+        single sample z, where J is the Jacobian of the model f.
+
+        Parameters
+        ----------
+        sample : np.ndarray (nvars) or np.ndarray (nvars,1)
+            The sample at which to compute the gradient
+
+        Returns
+        -------
+        grad : np.ndarray (nvars)
+            The gradient of the log-likelihood
+        """
+        sample = sample.reshape(sample.shape[0],1)
+        residual = self.data - self.model(sample)[0,:]
+        jac = self.model_jac(sample)
+        assert jac.shape==(self.ndata,sample.shape[0])
+        if self.noise_covar_chol_factor is None:
+            return jac.T.dot(self.noise_covar_inv*residual)
+        return jac.T.dot(cho_solve(self.noise_covar_chol_factor,residual))
+
 class LogLike(tt.Op):
     """
     Specify what type of object will be passed and returned to the Op when it is
@@ -136,38 +245,55 @@ class LogLikeGrad(tt.Op):
         Parameters
         ----------
         loglike:
-            The log-likelihood (or whatever) function we've defined
+            The log-likelihood (or whatever) function we've defined. It must
+            accept a np.ndarray (nvars,nsamples) and return nsamples values.
+            If loglike has a method ``gradient(sample)`` it is used instead
+            of finite differences
         """
         self.likelihood = loglike
 
     def perform(self, node, inputs, outputs):
         samples,=inputs
-        
-        # define version of likelihood function to pass to derivative function
-        def lnlike(values):
-            return self.likelihood(values)
+        if hasattr(self.likelihood,'gradient'):
+            outputs[0][0] = np.asarray(self.likelihood.gradient(samples))
+            return
+
+        nvars = samples.shape[0]
+        eps = 2*np.sqrt(np.finfo(float).eps)
+
+        # evaluate the likelihood at the sample and at all the forward
+        # difference perturbations with a single call
+        perturbed_samples = np.tile(samples[:,np.newaxis],(1,nvars+1))
+        perturbed_samples[:,1:] += eps*np.eye(nvars)
+        vals = np.asarray(self.likelihood(perturbed_samples)).reshape(nvars+1)
 
         # calculate gradients
-        grads = approx_fprime(samples,lnlike,2*np.sqrt(np.finfo(float).eps))
+        grads = (vals[1:]-vals[0])/eps
         outputs[0][0] = grads
 
 def extract_mcmc_chain_from_pymc3_trace(trace,var_names,ndraws,nburn,njobs):
-    nvars = len(var_names)
-    samples = np.empty((nvars,(ndraws-nburn)*njobs))
-    effective_sample_size = np.empty(nvars)
-    for ii in range(nvars):
-        samples[ii,:]=trace.get_values(
-            var_names[ii],burn=nburn,chains=np.arange(njobs))
-        effective_sample_size[ii]=pm.ess(trace)[var_names[ii]].values
+    nsamples = (ndraws-nburn)*njobs
+    # stack views of the samples of each chain into arrays with shape
+    # (nchains,ndraws-nburn,...). This avoids pm.ess(trace) which converts
+    # the entire trace to an arviz.InferenceData object
+    chains = dict([(name,np.stack(trace.get_values(
+        name,burn=nburn,combine=False,chains=np.arange(njobs),
+        squeeze=False)))
+                   for name in var_names])
+    # vector valued variables contribute one row for each of their entries
+    samples = np.vstack(
+        [chains[name].reshape(nsamples,-1).T for name in var_names])
+    # compute the effective sample size of all variables with one call
+    ess = az.ess(az.convert_to_dataset(chains),var_names=var_names)
+    effective_sample_size = np.hstack(
+        [np.atleast_1d(ess[name].values) for name in var_names])
 
     return samples,effective_sample_size
 
 def extract_map_sample_from_pymc3_dict(map_sample_dict,var_names):
-    nvars = len(var_names)
-    map_sample = np.empty((nvars,1))
-    for ii in range(nvars):
-        map_sample[ii]=map_sample_dict[var_names[ii]]
-    return map_sample
+    map_sample = np.hstack(
+        [np.atleast_1d(map_sample_dict[name]) for name in var_names])
+    return map_sample[:,np.newaxis]
 
 from pyapprox.variables import get_distribution_info
 def get_pymc_variables(variables,pymc_var_names=None):
@@ -181,63 +307,374 @@ def get_pymc_variables(variables,pymc_var_names=None):
     return pymc_vars, pymc_var_names
 
 def get_pymc_variable(rv,pymc_var_name):
-    name, scales, shapes = get_distribution_info(rv)
-    if rv.dist.name=='norm':
-        return pm.Normal(pymc_var_name,mu=scales['loc'],sigma=scales['scale'])
-    if rv.dist.name=='uniform':        
-        return pm.Uniform(pymc_var_name,lower=scales['loc'],
-                          upper=scales['loc']+scales['scale'])
-    msg = f'Variable type: {name} not supported'
-    raise Exception(msg)
+    scales = get_distribution_info(rv)[1]
+    return create_pymc_variable(rv.dist.name,pymc_var_name,scales)
 
-def run_bayesian_inference_gaussian_error_model(
-        loglike,variables,ndraws,nburn,njobs,
-        algorithm='nuts',get_map=False,print_summary=False):
+def get_pymc_vector_variable(variables,pymc_var_name):
+    """
+    Create a single vector valued PyMC3 variable from a list of independent
+    univariate variables from the same family.
+
+    Parameters
+    ----------
+    variables : list
+        List of scipy.stats frozen random variables with the same dist.name
+
+    pymc_var_name : string
+        The name of the PyMC3 variable
+
+    Returns
+    -------
+    pymc_var : pm.Distribution
+        The PyMC3 variable with shape (nvars)
+    """
+    dist_name = variables[0].dist.name
+    assert all([rv.dist.name==dist_name for rv in variables])
+    scales = [get_distribution_info(rv)[1] for rv in variables]
+    scales = dict([(key,np.array([s[key] for s in scales]))
+                   for key in ['loc','scale']])
+    return create_pymc_variable(
+        dist_name,pymc_var_name,scales,shape=len(variables))
+
+# map the scipy.stats name of each supported distribution to a function
+# with signature f(pymc_var_name,scales,shape) that creates the equivalent
+# PyMC3 variable. Add entries to support new distributions
+PYMC_VARIABLE_DISPATCH = {
+    'norm':lambda name,scales,shape: pm.Normal(
+        name,mu=scales['loc'],sigma=scales['scale'],shape=shape),
+    'uniform':lambda name,scales,shape: pm.Uniform(
+        name,lower=scales['loc'],upper=scales['loc']+scales['scale'],
+        shape=shape)}
+
+def create_pymc_variable(dist_name,pymc_var_name,scales,shape=()):
+    if dist_name not in PYMC_VARIABLE_DISPATCH:
+        msg = f'Variable type: {dist_name} not supported'
+        raise Exception(msg)
+    return PYMC_VARIABLE_DISPATCH[dist_name](pymc_var_name,scales,shape)
+
+def setup_pymc_model(loglike,variables,algorithm):
+    """
+    Add the prior variables and the likelihood to a PyMC3 model.
+    Must be called inside a with pm.Model() block.
+
+    When all the variables are from the same family a single vector valued
+    PyMC3 variable is used. Otherwise the scalar variables must be joined
+    into a vector, and the flat parameter vector split back into them, each
+    time the log-probability is evaluated.
+    """
     # create our Op
     if algorithm!='nuts':
         logl = LogLike(loglike)
     else:
         logl = LogLikeWithGrad(loglike)
 
-    # use PyMC3 to sampler from log-likelihood
-    with pm.Model():
-        # must be defined inside with pm.Model() block
+    univariate_variables = variables.all_variables()
+    dist_names = set([rv.dist.name for rv in univariate_variables])
+    if len(dist_names)==1:
+        pymc_var_names = ['z']
+        theta = get_pymc_vector_variable(
+            univariate_variables,pymc_var_names[0])
+        pymc_variables = [theta]
+    else:
         pymc_variables, pymc_var_names = get_pymc_variables(
-            variables.all_variables())
-
+            univariate_variables)
         # convert m and c to a tensor vector
         theta = tt.as_tensor_variable(pymc_variables)
 
-        # use a DensityDist (use a lamdba function to "call" the Op)
-        pm.DensityDist(
-            'likelihood', lambda v: logl(v), observed={'v': theta})
+    # use a DensityDist (use a lamdba function to "call" the Op)
+    pm.DensityDist(
+        'likelihood', lambda v: logl(v), observed={'v': theta})
+    return pymc_variables, pymc_var_names
+
+def get_pymc_model(loglike,variables,algorithm):
+    """
+    Build the PyMC3 model, its variables and the step method used to sample
+    from the posterior.
+
+    Building the model and compiling the theano functions of the step
+    method is slow. Pass the returned tuple to 
+    run_bayesian_inference_gaussian_error_model, via its pymc_model 
+    argument, to sample the same posterior repeatedly without rebuilding 
+    the model.
+
+    Parameters
+    ----------
+    loglike : callable
+        The log-likelihood, e.g. a PYMC3LogLikeWrapper
 
-        if get_map:
-            map_sample_dict = pm.find_MAP()
+    variables : pya.IndependentMultivariateRandomVariable
+        The prior variables
 
-        if algorithm=='smc':
-            assert njobs==1 # njobs is always 1 when using smc
-            trace = pm.sample_smc(ndraws);
+    algorithm : string
+        The sampling algorithm. One of ['nuts','metropolis','smc']
+
+    Returns
+    -------
+    model : pm.Model
+        The PyMC3 model
+
+    pymc_variables : list
+        The PyMC3 variables
+
+    pymc_var_names : list
+        The names of the PyMC3 variables
+
+    step : pm.step_methods.arraystep.BlockedStep
+        The step method. None if algorithm=='smc'
+    """
+    with pm.Model() as model:
+        # must be defined inside with pm.Model() block
+        pymc_variables, pymc_var_names = setup_pymc_model(
+            loglike,variables,algorithm)
+        if algorithm=='metropolis':
+            step=pm.Metropolis(pymc_variables)
+        elif algorithm=='nuts':
+            step=pm.NUTS(pymc_variables)
         else:
-            if algorithm=='metropolis':
-                step=pm.Metropolis(pymc_variables)
-            elif algorithm=='nuts':
-                step=pm.NUTS(pymc_variables)
-            
-            trace = pm.sample(ndraws, tune=nburn, discard_tuned_samples=True,
-                              start=None,cores=njobs,step=step)
+            step=None
+    return model,pymc_variables,pymc_var_names,step
+
+def run_smc_pool_helper(loglike,variables,ndraws,nburn,print_summary,seed):
+    """
+    Run a single SMC chain. Defined at module level so that it can be
+    pickled and used with multiprocessing.Pool
+    """
+    with pm.Model():
+        pymc_variables, pymc_var_names = setup_pymc_model(
+            loglike,variables,'smc')
+        trace = pm.sample_smc(ndraws,random_seed=seed)
 
     if print_summary:
         print(pm.summary(trace))
+
+    return extract_mcmc_chain_from_pymc3_trace(
+        trace,pymc_var_names,ndraws,nburn,1)
+
+def population_metropolis_logpost(loglike,variables,samples):
+    """
+    Evaluate the unnormalized log posterior of a set of samples with one
+    call to the log-likelihood.
+    """
+    nsamples = samples.shape[1]
+    # copy so the prior terms are not added to an array owned by loglike,
+    # e.g. the cached values returned by PYMC3LogLikeWrapper
+    vals = np.array(loglike(samples),dtype=float).reshape(nsamples)
+    for ii in range(variables.nunique_vars):
+        var = variables.unique_variables[ii]
+        indices = variables.unique_variable_indices[ii]
+        vals += var.logpdf(samples[indices,:]).sum(axis=0)
+    return vals
+
+def run_population_metropolis(loglike,variables,ndraws,nburn,nchains,
+                              seed=None):
+    """
+    Run nchains random walk Metropolis chains in lockstep. The proposals of
+    all chains are evaluated with a single call to the log-likelihood and
+    accepted with a single mask so there is no loop over the chains.
+
+    Parameters
+    ----------
+    loglike : callable
+        The log-likelihood with signature
+
+        ``loglike(x) -> np.ndarray (nsamples,1)``
+
+        where x is a np.ndarray (nvars,nsamples)
+
+    variables : pya.IndependentMultivariateRandomVariable
+        The prior variables
+
+    ndraws : integer
+        The number of samples drawn by each chain
+
+    nburn : integer
+        The number of samples discarded from the start of each chain
+
+    nchains : integer
+        The number of chains
+
+    seed : integer
+        The seed of the random number generator
+
+    Returns
+    -------
+    samples : np.ndarray (nvars,(ndraws-nburn)*nchains)
+        The posterior samples of all the chains
+
+    effective_sample_size : np.ndarray (nvars)
+        The effective sample size of each variable
+
+    Notes
+    -----
+    During burn-in the Gaussian proposal covariance is set to
+    2.38**2/nvars times the covariance of the current states of the chains.
+    Adaptation stops after burn-in so the retained samples are drawn from a
+    valid Markov chain. Use enough chains, e.g. more than 2*nvars, to 
+    estimate the covariance.
+    """
+    from pyapprox.probability_measure_sampling import \
+        generate_independent_random_samples
+    random_state = np.random.RandomState(seed)
+    nvars = variables.num_vars()
+    # initialize the chains with independent samples from the prior
+    current = generate_independent_random_samples(
+        variables,nchains,random_state=random_state)
+    current_logpost = population_metropolis_logpost(
+        loglike,variables,current)
+    scale = 2.38**2/nvars
+    proposal_chol_factor = np.sqrt(scale)*np.diag(
+        variables.get_statistics('std')[:,0])
+    chains = np.empty((nchains,ndraws-nburn,nvars))
+    for ii in range(ndraws):
+        if ii<nburn and nchains>nvars:
+            cov = scale*np.atleast_2d(np.cov(current))
+            # jitter the diagonal in case the chains have collapsed
+            cov[np.diag_indices(nvars)] += 1e-12*max(cov.trace(),1)
+            proposal_chol_factor = np.linalg.cholesky(cov)
+        proposal = current+proposal_chol_factor.dot(
+            random_state.normal(0,1,(nvars,nchains)))
+        proposal_logpost = population_metropolis_logpost(
+            loglike,variables,proposal)
+        accept = np.log(random_state.uniform(0,1,nchains))<(
+            proposal_logpost-current_logpost)
+        current = np.where(accept[None,:],proposal,current)
+        current_logpost = np.where(accept,proposal_logpost,current_logpost)
+        if ii>=nburn:
+            chains[:,ii-nburn,:] = current.T
+
+    samples = chains.reshape((ndraws-nburn)*nchains,nvars).T
+    ess = az.ess(az.convert_to_dataset(chains))
+    effective_sample_size = np.atleast_1d(ess['x'].values)
+    return samples,effective_sample_size
+
+def run_bayesian_inference_gaussian_error_model(
+        loglike,variables,ndraws,nburn,njobs,
+        algorithm='nuts',get_map=False,print_summary=False,
+        chain_method='multiprocess',seed=None,pymc_model=None):
+    """
+    Draw samples from the posterior of the variables using PyMC3.
+
+    Parameters
+    ----------
+    loglike : callable
+        The log-likelihood, e.g. a PYMC3LogLikeWrapper
+
+    variables : pya.IndependentMultivariateRandomVariable
+        The prior variables
+
+    ndraws : integer
+        The number of samples drawn by each chain
+
+    nburn : integer
+        The number of samples discarded from the start of each chain
+
+    njobs : integer
+        The number of independent chains
+
+    algorithm : string
+        The sampling algorithm. One of ['nuts','metropolis','smc']
+
+    get_map : boolean
+        True - compute the maximum a posteriori sample
+
+    print_summary : boolean
+        True - print a summary of the trace of each chain
+
+    chain_method : string
+        'sequential' - run the chains one after another.
+        'multiprocess' - run each chain in a separate process
+        'vectorized' - run the chains in lockstep in a single process,
+        evaluating the proposals of all chains with one call to loglike.
+        Only supported when algorithm=='metropolis'. See
+        run_population_metropolis
+
+    seed : integer
+        The seed of the first chain. Chain ii is seeded with seed+ii so each
+        chain uses an independent random stream. If None the chains are
+        seeded by PyMC3
+
+    pymc_model : tuple
+        The output of get_pymc_model(loglike,variables,algorithm). If None
+        the model is built. Passing a previously built model avoids 
+        rebuilding it and recompiling its theano functions. It must be
+        rebuilt if loglike or variables are modified. The step method
+        keeps the tuning parameters adapted by previous runs. The model is
+        only used by the smc and vectorized samplers if get_map is True.
+
+    Returns
+    -------
+    samples : np.ndarray (nvars,(ndraws-nburn)*njobs)
+        The posterior samples of all the chains
+
+    effective_sample_size : np.ndarray (nvars)
+        The effective sample size of each variable
+
+    map_sample : np.ndarray (nvars,1)
+        The maximum a posteriori sample. None if get_map is False
+
+    Notes
+    -----
+    PyMC3's SMC sampler mutates each particle with its own Metropolis 
+    kernel, so the likelihood is evaluated one particle at a time and 
+    cannot be batched. Parallelism for SMC is obtained by running njobs
+    independent chains, see chain_method. The likelihood of all chains is
+    evaluated with one call only when algorithm=='metropolis' and
+    chain_method=='vectorized'.
+    """
+    assert chain_method in ['sequential','multiprocess','vectorized']
+    assert chain_method!='vectorized' or algorithm=='metropolis'
+    if seed is None:
+        # let PyMC3 seed the chains
+        seeds = [None]*njobs
+    else:
+        seeds = [seed+ii for ii in range(njobs)]
+    ncores = njobs if chain_method=='multiprocess' else 1
+
+    # the smc chains and the vectorized chains do not use the model
+    use_pymc_sample = algorithm!='smc' and chain_method!='vectorized'
+    if get_map or use_pymc_sample:
+        # use PyMC3 to sampler from log-likelihood
+        if pymc_model is None:
+            pymc_model = get_pymc_model(loglike,variables,algorithm)
+        model, pymc_variables, pymc_var_names, step = pymc_model
+        with model:
+            if get_map:
+                map_sample_dict = pm.find_MAP()
+
+            if use_pymc_sample:
+                trace = pm.sample(
+                    ndraws, tune=nburn, discard_tuned_samples=True,
+                    start=None,chains=njobs,cores=ncores,step=step,
+                    random_seed=None if seed is None else seeds)
+
+    if algorithm=='smc':
+        # PyMC3 only runs a single SMC chain so run independent chains
+        func = partial(
+            run_smc_pool_helper,loglike,variables,ndraws,nburn,print_summary)
+        if ncores>1:
+            pool = Pool(ncores)
+            result = pool.map(func,seeds)
+            pool.close()
+        else:
+            result = [func(s) for s in seeds]
+        samples = np.hstack([r[0] for r in result])
+        # the chains are independent so their effective sample sizes add
+        effective_sample_size = np.sum([r[1] for r in result],axis=0)
+    elif chain_method=='vectorized':
+        samples, effective_sample_size = run_population_metropolis(
+            loglike,variables,ndraws,nburn,njobs,seed)
+    else:
+        if print_summary:
+            print(pm.summary(trace))
         
-    samples, effective_sample_size = extract_mcmc_chain_from_pymc3_trace(
-        trace,pymc_var_names,ndraws,nburn,njobs)
+        samples, effective_sample_size = extract_mcmc_chain_from_pymc3_trace(
+            trace,pymc_var_names,ndraws,nburn,njobs)
     
     if get_map:
         map_sample = extract_map_sample_from_pymc3_dict(
             map_sample_dict,pymc_var_names)
     else:
-        map_samples = None
+        map_sample = None
         
     return samples, effective_sample_size, map_sample
 
@@ -247,13 +684,55 @@ class PYMC3LogLikeWrapper():
     Main difference is that PYMC3 often passes 1d arrays where as
     Pyapprox assumes 2d arrays.
     """
-    def __init__(self,loglike):
+    def __init__(self,loglike,cache_size=2):
+        """
+        Parameters
+        ----------
+        loglike : callable
+            The log-likelihood with signature
+
+            ``loglike(x) -> np.ndarray (nsamples,1)``
+
+            where x is a np.ndarray (nvars,nsamples)
+
+        cache_size : integer
+            The number of most recent evaluations to store. Metropolis type
+            samplers repeatedly evaluate the current and proposed states so
+            the default of 2 avoids re-evaluating the model at the current
+            state. The cache is keyed only on x so it must be cleared, with
+            clear_cache, if loglike is modified, e.g. its data is changed.
+        """
         self.loglike=loglike
+        self.cache_size=cache_size
+        self.clear_cache()
+        if hasattr(self.loglike,'gradient'):
+            self.gradient = self._gradient
+
+    def clear_cache(self):
+        """
+        Remove all the stored evaluations of the log-likelihood.
+        """
+        self._cache_keys=[None]*self.cache_size
+        self._cache_vals=[None]*self.cache_size
+        self._cache_index=0
+
+    def _gradient(self,x):
+        return np.asarray(self.loglike.gradient(x)).squeeze()
 
     def __call__(self,x):
         if x.ndim==1:
             xr = x[:,np.newaxis]
         else:
             xr=x
-        vals = self.loglike(xr)
-        return vals.squeeze()
+        # numpy arrays are not hashable so use a copy of the raw data as key
+        key = (xr.shape,xr.tobytes())
+        for ii in range(self.cache_size):
+            if self._cache_keys[ii]==key:
+                # return a copy so callers cannot modify the stored values
+                return self._cache_vals[ii].copy()
+        vals = self.loglike(xr).squeeze()
+        if self.cache_size>0:
+            self._cache_keys[self._cache_index]=key
+            self._cache_vals[self._cache_index]=np.array(vals)
+            self._cache_index=(self._cache_index+1)%self.cache_size
+        return vals
@@ -3,6 +3,7 @@ from pyapprox.bayesian_inference.markov_chain_monte_carlo import *
 from functools import partial
 from scipy.stats import norm, uniform
 from pyapprox.variables import IndependentMultivariateRandomVariable
+from pyapprox.optimization import approx_jacobian
 
 class LinearModel(object):
     def __init__(self, Amatrix):
@@ -45,8 +46,138 @@ class ExponentialQuarticLogLikelihoodModel(object):
     def __call__(self,x):
         return np.array([self.loglikelihood_function(x)]).T
 
+class CountingLogLike(object):
+    def __init__(self, loglike):
+        self.loglike = loglike
+        self.nevaluations = 0
+        self.ncalls = 0
+
+    def __call__(self, samples):
+        self.nevaluations += samples.shape[1]
+        self.ncalls += 1
+        return self.loglike(samples)
+
 class TestMCMC(unittest.TestCase):
 
+    @unittest.skipIf(not NUMBA_AVAILABLE, "numba not installed")
+    def test_gaussian_loglike_diagonal_noise_numba(self):
+        np.random.seed(1)
+        nobs, nsamples = 5, 4
+        data = np.random.normal(0,1,nobs)
+        model_vals = np.random.normal(0,1,(nsamples,nobs))
+        noise_covar_inv = 1/np.linspace(0.1,1,nobs)
+        vals = np.empty(nsamples)
+        gaussian_loglike_diagonal_noise_numba(
+            model_vals, data, noise_covar_inv, vals)
+        residuals = data-model_vals
+        true_vals = -0.5*(residuals**2).dot(noise_covar_inv)
+        assert np.allclose(vals, true_vals)
+
+    def test_pymc3_loglike_wrapper_cache(self):
+        loglike = CountingLogLike(ExponentialQuarticLogLikelihoodModel())
+        wrapper = PYMC3LogLikeWrapper(loglike)
+        x0, x1, x2 = np.array([0.1,0.2]), np.array([0.3,0.4]), np.zeros(2)
+        val0 = wrapper(x0)
+        assert np.allclose(val0, loglike.loglike(x0[:,np.newaxis]))
+        wrapper(x1)
+        assert np.allclose(wrapper(x0), val0)
+        assert loglike.nevaluations == 2
+        # x0 is evicted from the cache once two newer states are evaluated
+        wrapper(x2)
+        wrapper(x1)
+        assert loglike.nevaluations == 3
+        wrapper(x0)
+        assert loglike.nevaluations == 4
+
+        # modifying the returned values must not corrupt the cache
+        vals = wrapper(x0)
+        vals += 1
+        assert np.allclose(wrapper(x0), val0)
+        assert loglike.nevaluations == 4
+        wrapper.clear_cache()
+        wrapper(x0)
+        assert loglike.nevaluations == 5
+
+    def test_gaussian_loglike(self):
+        np.random.seed(1)
+        nobs, nvars, nsamples = 5, 2, 4
+        Amatrix = np.random.normal(0,1,(nobs,nvars))
+        model = LinearModel(Amatrix)
+        data = np.random.normal(0,1,nobs)
+        samples = np.random.normal(0,1,(nvars,nsamples))
+        tmp = np.random.normal(0,1,(nobs,nobs))
+        noise_covars = [
+            0.1, np.linspace(0.1,1,nobs), tmp.dot(tmp.T)+np.eye(nobs)]
+        for noise_covar in noise_covars:
+            loglike = GaussianLogLike(model, data, noise_covar)
+            if np.isscalar(noise_covar):
+                noise_covar = noise_covar*np.eye(nobs)
+            elif noise_covar.ndim==1:
+                noise_covar = np.diag(noise_covar)
+            noise_covar_inv = np.linalg.inv(noise_covar)
+            true_vals = np.empty((nsamples,1))
+            for ii in range(nsamples):
+                residual = data-model(samples[:,ii:ii+1])[0,:]
+                true_vals[ii] = -0.5*residual.dot(noise_covar_inv).dot(residual)
+            vals = loglike(samples)
+            assert np.allclose(vals,true_vals)
+            # LinearModel returns Fortran ordered values so also check
+            # C ordered model values
+            assert np.allclose(GaussianLogLike(
+                lambda x: np.ascontiguousarray(model(x)),data,noise_covar)(
+                    samples),true_vals)
+            # check the values are not overwritten by subsequent calls
+            loglike(samples[:,::-1])
+            assert np.allclose(vals,true_vals)
+            if loglike.noise_covar_chol_factor is None:
+                # check numpy implementation when numba is available
+                assert np.allclose(loglike._diagonal_noise_loglike(
+                    model(samples)),true_vals)
+
+    def test_loglike_grad(self):
+        model = ExponentialQuarticLogLikelihoodModel()
+        # remove the exact gradient to test the finite difference gradient
+        loglike = PYMC3LogLikeWrapper(model.__call__)
+        sample = np.array([0.5,-0.25])
+        outputs = [[None]]
+        LogLikeGrad(loglike).perform(None, [sample], outputs)
+        assert np.allclose(outputs[0][0], model.gradient(sample), atol=1e-6)
+
+        loglike = PYMC3LogLikeWrapper(model)
+        LogLikeGrad(loglike).perform(None, [sample], outputs)
+        assert np.allclose(outputs[0][0], model.gradient(sample))
+
+    def test_gaussian_loglike_gradient(self):
+        np.random.seed(1)
+        nobs, nvars = 5, 2
+        Amatrix = np.random.normal(0,1,(nobs,nvars))
+        model = LinearModel(Amatrix)
+        data = np.random.normal(0,1,nobs)
+        sample = np.random.normal(0,1,(nvars))
+        tmp = np.random.normal(0,1,(nobs,nobs))
+        noise_covars = [
+            0.1, np.linspace(0.1,1,nobs), tmp.dot(tmp.T)+np.eye(nobs)]
+        for noise_covar in noise_covars:
+            loglike = GaussianLogLike(
+                model, data, noise_covar, lambda x: Amatrix)
+            loglike = PYMC3LogLikeWrapper(loglike)
+            fd_grad = approx_jacobian(loglike, sample)[0,:]
+            assert np.allclose(loglike.gradient(sample), fd_grad, atol=1e-6)
+
+    def test_reuse_pymc_model(self):
+        univariate_variables = [uniform(-2,4),uniform(-2,4)]
+        variables = IndependentMultivariateRandomVariable(univariate_variables)
+        loglike = PYMC3LogLikeWrapper(ExponentialQuarticLogLikelihoodModel())
+        pymc_model = get_pymc_model(loglike,variables,'metropolis')
+        model1, __, __, step1 = get_pymc_model(loglike,variables,'metropolis')
+        assert model1 is not pymc_model[0] and step1 is not pymc_model[3]
+        ndraws, nburn, njobs = 100, 10, 1
+        for ii in range(2):
+            samples = run_bayesian_inference_gaussian_error_model(
+                loglike,variables,ndraws,nburn,njobs,algorithm='metropolis',
+                chain_method='sequential',seed=1,pymc_model=pymc_model)[0]
+            assert samples.shape==(2,(ndraws-nburn)*njobs)
+
     def test_linear_gaussian_inference(self):
         # set random seed, so the data is reproducible each time
         np.random.seed(1)  
@@ -111,6 +242,94 @@ class TestMCMC(unittest.TestCase):
         # _ = pm.traceplot(trace)
         # plt.show()
 
+    def test_population_metropolis(self):
+        np.random.seed(1)
+        nobs, noise_stdev = 10, .1
+        x = np.linspace(0., 9., nobs)
+        Amatrix = np.hstack([np.ones((nobs,1)),x[:,np.newaxis]])
+        variables = IndependentMultivariateRandomVariable(
+            [norm(1,1),norm(0,4)])
+        prior_mean = np.asarray([rv.mean() for rv in variables.all_variables()])
+        prior_hessian = np.diag(
+            [1./rv.var() for rv in variables.all_variables()])
+
+        model = LinearModel(Amatrix)
+        true_sample = np.array([[2.,0.4]]).T
+        data = noise_stdev*np.random.randn(nobs)+model(true_sample)[0,:]
+        loglike = CountingLogLike(GaussianLogLike(model, data, noise_stdev**2))
+
+        ndraws, nburn, nchains = 1000, 200, 64
+        samples, effective_sample_size = run_population_metropolis(
+            loglike,variables,ndraws,nburn,nchains,seed=2)
+        assert samples.shape==(2,(ndraws-nburn)*nchains)
+        assert effective_sample_size.shape==(2,)
+        # one batched evaluation for the initial states and each draw
+        assert loglike.ncalls==ndraws+1
+        assert loglike.nevaluations==(ndraws+1)*nchains
+
+        from pyapprox.bayesian_inference.laplace import \
+                laplace_posterior_approximation_for_linear_models
+        exact_mean, exact_covariance = \
+            laplace_posterior_approximation_for_linear_models(
+                Amatrix, prior_mean, prior_hessian,
+                np.eye(nobs)/noise_stdev**2, data)
+        assert np.allclose(
+            exact_mean.squeeze(), samples.mean(axis=1),atol=1e-2)
+        assert np.allclose(exact_covariance, np.cov(samples), atol=1e-3)
+
+    def test_unseeded_vectorized_chains(self):
+        variables = IndependentMultivariateRandomVariable(
+            [uniform(-2,4),uniform(-2,4)])
+        loglike = PYMC3LogLikeWrapper(ExponentialQuarticLogLikelihoodModel())
+        np.random.seed(1)
+        state = np.random.get_state()
+        ndraws, nburn, njobs = 20, 10, 4
+        samples = run_bayesian_inference_gaussian_error_model(
+            loglike,variables,ndraws,nburn,njobs,algorithm='metropolis',
+            chain_method='vectorized')[0]
+        assert samples.shape==(2,(ndraws-nburn)*njobs)
+        # the global random stream of the caller is not modified
+        assert np.allclose(np.random.get_state()[1],state[1])
+
+    def test_population_metropolis_logpost(self):
+        variables = IndependentMultivariateRandomVariable(
+            [norm(1,1),norm(0,4)])
+        samples = np.random.normal(0,1,(2,3))
+        # mimic a loglike that returns an array it stores, e.g. a cache
+        loglike_vals = np.random.normal(0,1,(3,1))
+        loglike = lambda x: loglike_vals
+        stored_vals = loglike_vals.copy()
+        vals = population_metropolis_logpost(loglike,variables,samples)
+        true_vals = stored_vals[:,0]+sum(
+            [rv.logpdf(samples[ii]) for ii,rv in enumerate(
+                variables.all_variables())])
+        assert np.allclose(vals,true_vals)
+        assert np.allclose(loglike_vals,stored_vals)
+
+    def test_single_chain_effective_sample_size(self):
+        np.random.seed(1)
+        nobs, noise_stdev = 10, .1
+        x = np.linspace(0., 9., nobs)
+        Amatrix = np.hstack([np.ones((nobs,1)),x[:,np.newaxis]])
+        variables = IndependentMultivariateRandomVariable(
+            [norm(1,1),norm(0,4)])
+        model = LinearModel(Amatrix)
+        true_sample = np.array([[2.,0.4]]).T
+        data = noise_stdev*np.random.randn(nobs)+model(true_sample)[0,:]
+        loglike = PYMC3LogLikeWrapper(
+            GaussianLogLike(model, data, noise_stdev**2))
+
+        # pymc3 squeezes the chain axis of traces with a single chain and
+        # the smc sampler always runs a single chain per job
+        ndraws, nburn, njobs = 500, 100, 1
+        for algorithm in ['metropolis','smc']:
+            samples, effective_sample_size, map_sample = \
+                run_bayesian_inference_gaussian_error_model(
+                    loglike,variables,ndraws,nburn,njobs,
+                    algorithm=algorithm,chain_method='sequential',seed=1)
+            assert effective_sample_size.shape==(variables.num_vars(),)
+            assert np.all(np.isfinite(effective_sample_size))
+
     def test_exponential_quartic(self):
         # set random seed, so the data is reproducible each time
         np.random.seed(1)  
@@ -2,7 +2,7 @@
 import numpy as np
 import matplotlib.pyplot as plt
 from scipy import stats
-from functools import partial
+from functools import partial, lru_cache
 
 import pyapprox as pya
 from pyapprox.benchmarks.sensitivity_benchmarks import *
@@ -85,8 +85,8 @@ def setup_sobol_g_function(nvars):
     .. [Saltelli1995] `Saltelli, A., & Sobol, I. M. About the use of rank transformation in sensitivity analysis of model output. Reliability Engineering & System Safety, 50(3), 225-239, 1995. <https://doi.org/10.1016/0951-8320(95)00099-2>`_
     """
     
-    univariate_variables = [stats.uniform(0,1)]*nvars
-    variable=pya.IndependentMultivariateRandomVariable(univariate_variables)
+    variable=pya.IndependentMultivariateRandomVariable(
+        [stats.uniform(0,1)],[np.arange(nvars)])
     a = (np.arange(1,nvars+1)-2)/2
     mean, variance, main_effects, total_effects = \
         get_sobol_g_function_statistics(a)
@@ -124,8 +124,8 @@ def setup_ishigami_function(a,b):
     ----------
     .. [Ishigami1990] `T. Ishigami and T. Homma, "An importance quantification technique in uncertainty analysis for computer models," [1990] Proceedings. First International Symposium on Uncertainty Modeling and Analysis, College Park, MD, USA, 1990, pp. 398-403 <https://doi.org/10.1109/ISUMA.1990.151285>`_
     """
-    univariate_variables = [stats.uniform(-np.pi,2*np.pi)]*3
-    variable=pya.IndependentMultivariateRandomVariable(univariate_variables)
+    variable=pya.IndependentMultivariateRandomVariable(
+        [stats.uniform(-np.pi,2*np.pi)],[np.arange(3)])
     mean, variance, main_effects, total_effects, sobol_indices = \
         get_ishigami_funciton_statistics()
     return Benchmark(
@@ -158,8 +158,8 @@ def setup_oakley_function():
     ----------
     .. [OakelyOJRSB2004] `Oakley, J.E. and O'Hagan, A. (2004), Probabilistic sensitivity analysis of complex models: a Bayesian approach. Journal of the Royal Statistical Society: Series B (Statistical Methodology), 66: 751-769. <https://doi.org/10.1111/j.1467-9868.2004.05304.x>`_
     """
-    univariate_variables = [stats.norm()]*15
-    variable=pya.IndependentMultivariateRandomVariable(univariate_variables)
+    variable=pya.IndependentMultivariateRandomVariable(
+        [stats.norm()],[np.arange(15)])
     mean, variance, main_effects = oakley_function_statistics()
     return Benchmark(
         {'fun':oakley_function,
@@ -193,13 +193,33 @@ def setup_rosenbrock_function(nvars):
     ----------
     .. [DixonSzego1990] `Dixon, L. C. W.; Mills, D. J. "Effect of Rounding Errors on the Variable Metric Method". Journal of Optimization Theory and Applications. 80: 175–179. 1994 <https://doi.org/10.1007%2FBF02196600>`_
     """
-    univariate_variables = [stats.uniform(-2,4)]*nvars
-    variable=pya.IndependentMultivariateRandomVariable(univariate_variables)
+    variable=pya.IndependentMultivariateRandomVariable(
+        [stats.uniform(-2,4)],[np.arange(nvars)])
     
     return Benchmark(
         {'fun':rosenbrock_function,'jac':rosenbrock_function_jacobian,
          'hessp':rosenbrock_function_hessian_prod,'variable':variable})
 
+def compute_genz_statistics(genz):
+    """
+    Compute the mean of a Genz function and, for the corner-peak function,
+    its variance. The variance is None for all other functions.
+    """
+    variance = None
+    if genz.func_type=='corner-peak':
+        variance = genz.variance()
+    return genz.integrate(), variance
+
+@lru_cache(maxsize=128)
+def get_default_genz_statistics(nvars,test_name):
+    """
+    Compute the statistics of a Genz function with the default coefficients.
+    The recursive integration costs O(2^nvars) so the statistics are cached.
+    """
+    genz = GenzFunction(test_name,nvars)
+    genz.set_coefficients(1,'squared-exponential-decay',0)
+    return compute_genz_statistics(genz)
+
 def setup_genz_function(nvars,test_name,coefficients=None):
     r"""
     Setup the Genz Benchmarks.
@@ -266,15 +286,17 @@ def setup_genz_function(nvars,test_name,coefficients=None):
     
     """
     genz = GenzFunction(test_name,nvars)
-    univariate_variables = [stats.uniform(0,1)]*nvars
-    variable=pya.IndependentMultivariateRandomVariable(univariate_variables)
+    variable=pya.IndependentMultivariateRandomVariable(
+        [stats.uniform(0,1)],[np.arange(nvars)])
     if coefficients is None:
         genz.set_coefficients(1,'squared-exponential-decay',0)
+        mean, variance = get_default_genz_statistics(nvars,test_name)
     else:
         genz.c,genz.w = coefficients
-    attributes = {'fun':genz,'mean':genz.integrate(),'variable':variable}
+        mean, variance = compute_genz_statistics(genz)
+    attributes = {'fun':genz,'mean':mean,'variable':variable}
     if test_name=='corner-peak':
-        attributes['variance']=genz.variance()
+        attributes['variance']=variance
         from scipy.optimize import OptimizeResult
     return Benchmark(attributes)
 
@@ -285,6 +307,22 @@ except:
     pass
 
 def setup_benchmark(name,**kwargs):
+    """
+    Setup a benchmark.
+
+    Parameters
+    ----------
+    name : string
+        The name of the benchmark
+
+    kwargs : kwargs
+        The keyword arguments of the function that sets up the benchmark
+
+    Returns
+    -------
+    benchmark : pya.Benchmark
+       Object containing the benchmark attributes
+    """
     benchmarks = {'sobol_g':setup_sobol_g_function,
                   'ishigami':setup_ishigami_function,
                   'oakley':setup_oakley_function,
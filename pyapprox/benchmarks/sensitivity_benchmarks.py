@@ -1,6 +1,35 @@
 import numpy as np
 
 from pyapprox.utilities import evaluate_quadratic_form
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # numba is an optional dependency
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    # The kernels are only used when requested with use_numba=True because
+    # they are compiled on the first call in each process. They are not
+    # cached on disk so that read-only installations are supported.
+    # The kernels are serial because numba's default threading layer is not
+    # fork safe and the benchmarks are often evaluated inside forked
+    # processes, e.g. by pm.sample and multiprocessing.Pool
+    @njit
+    def ishigami_function_numba(samples,a,b,vals):
+        for ii in range(samples.shape[1]):
+            sin_z0 = np.sin(samples[0,ii])
+            vals[ii] = sin_z0+a*np.sin(samples[1,ii])**2+\
+                b*samples[2,ii]**4*sin_z0
+
+    @njit
+    def sobol_g_function_numba(coefficients,samples,vals):
+        vals[:] = 1.
+        # loop over samples in the inner loop to access memory contiguously
+        for jj in range(samples.shape[0]):
+            for ii in range(samples.shape[1]):
+                vals[ii] *= (abs(4*samples[jj,ii]-2)+coefficients[jj])/(
+                    1+coefficients[jj])
 def variance_linear_combination_of_indendent_variables(coef,variances):
     assert coef.shape[0]==variances.shape[0]
     return np.sum(coef**2*variances)
@@ -109,8 +138,11 @@ def get_oakley_function_data():
          [4.1494323e-002,-2.5980564e-001,4.6402128e-001,-3.6112127e-001,-9.4980789e-001,-1.6504063e-001,3.0943325e-003,5.2792942e-002,2.2523648e-001,3.8390366e-001,4.5562427e-001,-1.8631744e-001,8.2333995e-003,1.6670803e-001,1.6045688e-001]])
     return a1,a2,a3,M
 
+# the data is constant so only construct it once
+OAKLEY_FUNCTION_DATA = get_oakley_function_data()
+
 def oakley_function(samples):
-    a1,a2,a3,M = get_oakley_function_data()
+    a1,a2,a3,M = OAKLEY_FUNCTION_DATA
     term1,term2 = a1.T.dot(samples),a2.T.dot(np.sin(samples))
     term3,term4 = a3.T.dot(np.cos(samples)),evaluate_quadratic_form(M,samples)
     vals = term1+term2+term3+term4
@@ -152,9 +184,24 @@ def oakley_function_statistics():
     
     return mean, variance, main_effects/variance
 
-def ishigami_function(samples,a=7,b=0.1):
+def check_numba_available():
+    if not NUMBA_AVAILABLE:
+        raise Exception('use_numba=True requires numba to be installed')
+
+def ishigami_function(samples,a=7,b=0.1,use_numba=False):
+    """
+    use_numba=True evaluates the samples with a compiled kernel. The kernel
+    is compiled on the first call in each process so it is only worthwhile
+    when the function is evaluated at many samples.
+    """
     if samples.ndim==1:
         samples = samples[:,np.newaxis]
+    if use_numba:
+        check_numba_available()
+        vals = np.empty((samples.shape[1],1))
+        ishigami_function_numba(
+            np.asarray(samples,dtype=float),a,b,vals[:,0])
+        return vals
     vals = np.sin(samples[0,:])+a*np.sin(samples[1,:])**2+\
         b*samples[2,:]**4*np.sin(samples[0,:])
     return vals[:,np.newaxis]
@@ -204,14 +251,24 @@ def get_ishigami_funciton_statistics(a=7,b=0.1):
     sobol_indices = np.array([D_1,D_2,D_3,D_12,D_13,D_23,D_123])/variance
     return mean, variance, main_effects[:,np.newaxis], total_effects[:,np.newaxis], sobol_indices[:,np.newaxis]
 
-def sobol_g_function(coefficients,samples):
+def sobol_g_function(coefficients,samples,use_numba=False):
     """
     The coefficients control the sensitivity of each variable. Specifically
     they limit the range of the outputs, i.e.
     1-1/(1+a_i) <= (abs(4*x-2)+a_i)/(a_i+1) <= 1-1/(1+a_i)
+
+    use_numba=True evaluates the samples with a compiled kernel, see
+    ishigami_function.
     """
     nvars,nsamples = samples.shape
     assert coefficients.shape[0]==nvars
+    if use_numba:
+        check_numba_available()
+        vals = np.empty((nsamples,1))
+        sobol_g_function_numba(
+            np.asarray(coefficients,dtype=float),
+            np.asarray(samples,dtype=float),vals[:,0])
+        return vals
     vals = np.prod((np.absolute(4*samples-2)+coefficients[:,np.newaxis])/
                    (1+coefficients[:,np.newaxis]),axis=0)[:,np.newaxis]
     assert vals.shape[0]==nsamples
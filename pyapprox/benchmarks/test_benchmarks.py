@@ -31,6 +31,51 @@ class TestBenchmarks(unittest.TestCase):
             benchmark.jac,benchmark.hessp,init_guess,disp=False)
         assert errors.min()<1e-5
 
+    def test_genz_statistics_cache(self):
+        get_default_genz_statistics.cache_clear()
+        benchmark1 = setup_benchmark('genz',nvars=2,test_name='corner-peak')
+        benchmark2 = setup_benchmark('genz',nvars=2,test_name='corner-peak')
+        assert get_default_genz_statistics.cache_info().hits==1
+        assert benchmark1.fun is not benchmark2.fun
+        genz = GenzFunction('corner-peak',2)
+        genz.set_coefficients(1,'squared-exponential-decay',0)
+        assert np.allclose(benchmark2.mean,genz.integrate())
+        assert np.allclose(benchmark2.variance,genz.variance())
+
+        # modifying a benchmark does not modify those set up later
+        benchmark2.fun.set_coefficients(2,'no-decay',0.3)
+        benchmark3 = setup_benchmark('genz',nvars=2,test_name='corner-peak')
+        assert np.allclose(benchmark3.fun.c,benchmark1.fun.c)
+
+        coefficients = (np.ones(2),np.zeros(2))
+        benchmark4 = setup_benchmark(
+            'genz',nvars=2,test_name='corner-peak',coefficients=coefficients)
+        assert np.allclose(benchmark4.fun.c,coefficients[0])
+        assert not np.allclose(benchmark4.mean,benchmark1.mean)
+        assert get_default_genz_statistics.cache_info().misses==1
+
+    @unittest.skipIf(not NUMBA_AVAILABLE, "numba not installed")
+    def test_numba_kernels(self):
+        np.random.seed(1)
+        samples = np.random.uniform(0,1,(3,10))
+        vals = np.empty(samples.shape[1])
+        ishigami_function_numba(samples,7,0.1,vals)
+        true_vals = np.sin(samples[0,:])+7*np.sin(samples[1,:])**2+\
+            0.1*samples[2,:]**4*np.sin(samples[0,:])
+        assert np.allclose(vals,true_vals)
+        assert np.allclose(
+            ishigami_function(samples,use_numba=True),
+            ishigami_function(samples))
+
+        a = (np.arange(1,4)-2)/2
+        sobol_g_function_numba(a,samples,vals)
+        true_vals = np.prod((np.absolute(4*samples-2)+a[:,np.newaxis])/
+                            (1+a[:,np.newaxis]),axis=0)
+        assert np.allclose(vals,true_vals)
+        assert np.allclose(
+            sobol_g_function(a,samples,use_numba=True),
+            sobol_g_function(a,samples))
+
     def test_incorrect_benchmark_name(self):
         self.assertRaises(Exception,setup_benchmark,"missing",a=7,b=0.1)
         benchmark = Benchmark({'fun':rosenbrock_function,'jac':rosenbrock_function_jacobian,
@@ -1271,7 +1271,7 @@ class ModelEnsemble(object):
         for ii in range(1,active_model_ids.shape[0]):
             active_model_id=active_model_ids[ii]
             I = np.where(model_ids==active_model_id)[0]
-            values[I] = f(samples[:-1,I])
+            values[I] = self.functions[active_model_id](samples[:-1,I])
         return values
 
 def estimate_model_ensemble_covariance(npilot_samples,generate_samples,
@@ -1449,14 +1449,19 @@ class MLMC(ACVMF):
 def compute_single_fidelity_and_approximate_control_variate_mean_estimates(
         nhf_samples,nsample_ratios,
         model_ensemble,generate_samples,
-        generate_samples_and_values,cov,
-        get_cv_weights,seed):
+        generate_samples_and_values,cv_weights,seed):
     """
     Compute the approximate control variate estimate of a high-fidelity
     model from using it and a set of lower fidelity models. 
     Also compute the single fidelity Monte Carlo estimate of the mean from
     only the high-fidelity data.
 
+    Parameters
+    ----------
+    cv_weights : np.ndarray (nmodels-1)
+        The control variate weights. These do not depend on the samples
+        so are computed once for all realizations of the estimators
+
     Notes
     -----
     To create reproducible results when running numpy.random in parallel
@@ -1481,8 +1486,8 @@ def compute_single_fidelity_and_approximate_control_variate_mean_estimates(
     # compute mean using only hf data
     hf_mean = values[0][0].mean()
     # compute ACV mean
-    eta = get_cv_weights(cov,nsample_ratios)
-    acv_mean = compute_approximate_control_variate_mean_estimate(eta,values)
+    acv_mean = compute_approximate_control_variate_mean_estimate(
+        cv_weights,values)
     return hf_mean, acv_mean
 
 def estimate_variance_reduction(model_ensemble, cov, generate_samples,
@@ -1514,13 +1519,15 @@ def estimate_variance_reduction(model_ensemble, cov, generate_samples,
     nhf_samples,nsample_ratios = allocate_samples(
         cov, costs, target_cost)[:2]
 
+    cv_weights = get_cv_weights(cov,nsample_ratios)
+
     ntrials = int(ntrials)
     from multiprocessing import Pool
     pool = Pool(max_eval_concurrency)
     func = partial(
         compute_single_fidelity_and_approximate_control_variate_mean_estimates,
         nhf_samples,nsample_ratios,model_ensemble,generate_samples,
-        generate_samples_and_values,cov,get_cv_weights)
+        generate_samples_and_values,cv_weights)
     if max_eval_concurrency>1:
         assert int(os.environ['OMP_NUM_THREADS'])==1
         means = np.asarray(pool.map(func,[ii for ii in range(ntrials)]))
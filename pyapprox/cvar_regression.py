@@ -1,13 +1,35 @@
 import numpy as np
 from cvxopt import matrix, solvers, spmatrix
-from matplotlib import pyplot as plt
-
-from scipy.stats.mstats import mquantiles as quantile
-from scipy.stats import norm as normal_rv
-from scipy.special import erfinv
 from scipy import sparse
 from functools import partial
 from scipy import integrate
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # numba is an optional dependency
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def conditional_value_at_risk_sorted_numba(xx,ww,alpha):
+        """
+        Compute the conditional value at risk and value at risk from sorted
+        samples xx with weights ww in a single pass without temporaries.
+        """
+        num_samples = xx.shape[0]
+        index = num_samples-1
+        ecdf = 0.
+        for ii in range(num_samples):
+            ecdf += ww[ii]
+            if ecdf>=alpha:
+                index = ii
+                break
+        VaR = xx[index]
+        tail = 0.
+        for ii in range(index+1,num_samples):
+            tail += (xx[ii]-VaR)*ww[ii]
+        return VaR+tail/(1-alpha),VaR
 
 def value_at_risk(samples,alpha,weights=None,samples_sorted=False):
     """
@@ -35,18 +57,29 @@ def value_at_risk(samples,alpha,weights=None,samples_sorted=False):
     assert alpha>=0 and alpha<1
     assert samples.ndim==1
     num_samples = samples.shape[0]
-    if weights is None:
+    unweighted = weights is None
+    if unweighted:
         weights = np.ones(num_samples)/num_samples
     assert np.allclose(weights.sum(),1)
     assert weights.ndim==1 or weights.shape[1]==1
     assert samples.ndim==1 or samples.shape[1]==1
+    if unweighted and not samples_sorted:
+        # the weights are all equal so the index of VaR in the sorted samples
+        # does not depend on the samples. Use a partial sort, O(num_samples),
+        # to find the sample at that index
+        index = min(np.searchsorted(weights.cumsum(),alpha,side='left'),
+                    num_samples-1)
+        index = np.argpartition(samples,index)[index]
+        return samples[index],index
     if not samples_sorted:
         I = np.argsort(samples)
         xx,ww = samples[I],weights[I]
     else:
         xx,ww = samples,weights
     ecdf = ww.cumsum()
-    index = np.arange(num_samples)[ecdf>=alpha][0]
+    # the ecdf is sorted so use a binary search to find the first index
+    # with ecdf>=alpha
+    index = min(np.searchsorted(ecdf,alpha,side='left'),num_samples-1)
     VaR = xx[index]
     if not samples_sorted:
         index = I[index]
@@ -83,17 +116,36 @@ def conditional_value_at_risk(samples,alpha,weights=None,samples_sorted=False,re
     assert samples.ndim==1 or samples.shape[1]==1
     samples = samples.squeeze()
     num_samples = samples.shape[0]
-    if weights is None:
+    unweighted = weights is None
+    if unweighted:
         weights = np.ones(num_samples)/num_samples
     assert np.allclose(weights.sum(),1)
     assert weights.ndim==1 or weights.shape[1]==1
-    if not samples_sorted:
-        I = np.argsort(samples)
-        xx,ww = samples[I],weights[I]
+    if unweighted and not samples_sorted:
+        # the weights are all equal so the index of VaR in the sorted
+        # samples does not depend on the samples. Use a partial sort,
+        # O(num_samples), to find VaR and the samples above it
+        index = min(np.searchsorted(weights.cumsum(),alpha,side='left'),
+                    num_samples-1)
+        xx = np.partition(samples,index)
+        VaR = xx[index]
+        CVaR = VaR+(xx[index+1:].sum()-VaR*(num_samples-index-1))/(
+            num_samples*(1-alpha))
     else:
-        xx,ww=samples,weights
-    VaR,index = value_at_risk(xx,alpha,ww,samples_sorted=True)
-    CVaR=VaR+1/((1-alpha))*np.sum((xx[index+1:]-VaR)*ww[index+1:])
+        if not samples_sorted:
+            I = np.argsort(samples)
+            xx,ww = samples[I],weights[I]
+        else:
+            xx,ww=samples,weights
+        if NUMBA_AVAILABLE:
+            CVaR,VaR = conditional_value_at_risk_sorted_numba(
+                np.asarray(xx,dtype=float),np.asarray(ww,dtype=float).ravel(),
+                alpha)
+        else:
+            VaR,index = value_at_risk(xx,alpha,ww,samples_sorted=True)
+            # avoid forming the temporary (xx-VaR)*ww
+            CVaR = VaR+1/((1-alpha))*(
+                xx[index+1:].dot(ww[index+1:])-VaR*ww[index+1:].sum())
     #The above one line can be used instead of the following
     # # number of support points above VaR
     # n_plus = num_samples-index-1
@@ -137,22 +189,166 @@ def conditional_value_at_risk_gradient(samples,alpha,weights=None,samples_sorted
         
 
 def cvar_smoothing_function_I(samples,eps):
-    return (samples + eps*np.log(1+np.exp(-samples/eps)))
+    # samples+eps*log(1+exp(-samples/eps)) = eps*log(exp(0)+exp(samples/eps))
+    # logaddexp does not overflow for large negative samples/eps
+    return eps*np.logaddexp(0.,samples/eps)
 
 def smoothed_conditional_value_at_risk(samples,alpha,eps):
     assert samples.ndim==1
     num_samples = samples.shape[0]
-    q = quantile(samples,alpha)
+    q = np.quantile(samples,alpha)
     cvar_eps = cvar_smoothing_function_I(samples-q,eps).sum()
     cvar_eps /= ((1-alpha)*num_samples)
-    return cvar_eps + np.asscalar(q)
+    return cvar_eps + float(q)
+
+def get_cvar_regression_constraints(basis_matrix,nuvars):
+    """
+    Get the sparse constraint matrix G of the linear programs, Gx<=h, used
+    by cvar_regression and the trapezoid rule of cvar_regression_quadrature
+    without forming any dense intermediate matrices.
+
+    Parameters
+    ----------
+    basis_matrix : np.ndarray (nsamples,nbasis)
+        The basis evaluated at the samples (excluding the constant basis)
+
+    nuvars : integer
+        The number of quantile variables u_i
+
+    Returns
+    -------
+    G : scipy.sparse.coo_matrix (2*nvconstraints+nsamples,num_opt_vars)
+        The constraint matrix. The design variables are ordered
+        [c_1,...,c_nbasis,u_1,...,u_nuvars,v_1,...,v_nvconstraints,w]
+        where nvconstraints=nuvars*nsamples
+    """
+    nsamples,nbasis = basis_matrix.shape
+    nvconstraints = nsamples*nuvars
+    num_opt_vars = nbasis + nuvars + nvconstraints + 1
+    num_constraints = 2*nvconstraints+nsamples
+    vindices = np.arange(nvconstraints)
+    
+    # the basis matrix block of the constraints v_ij+h'c+u_i <=y_j
+    # and W+h'c<=y_j is the basis matrix repeated nuvars+1 times vertically,
+    # i.e. kron(ones((nuvars+1,1)),basis_matrix)
+    constraints_a = sparse.kron(
+        np.ones((nuvars+1,1)),sparse.coo_matrix(basis_matrix),format='coo')
+
+    # v_ij variables ordering: loop through j fastest, e.g. v_11,v_{12} etc
+    # v_ij+h'c+u_i <=y_j
+    constraints_1b_I = vindices
+    constraints_1b_J = np.repeat(np.arange(nuvars),nsamples)+nbasis
+
+    constraints_1c_I = vindices
+    constraints_1c_J = vindices+nbasis+nuvars
+
+    # W+h'c<=y_j
+    constraints_2b_I = np.arange(nsamples)+nvconstraints
+    constraints_2b_J = np.full(nsamples,num_opt_vars-1)
+
+    # v_ij >=0
+    constraints_3_I = vindices+nvconstraints+nsamples
+    constraints_3_J = constraints_1c_J
+
+    # all entries that are not basis values are -1
+    nones = 3*nvconstraints+nsamples
+    constraints_I = np.hstack((
+        constraints_a.row,constraints_1b_I,constraints_1c_I,
+        constraints_2b_I,constraints_3_I))
+    constraints_J = np.hstack((
+        constraints_a.col,constraints_1b_J,constraints_1c_J,
+        constraints_2b_J,constraints_3_J))
+    constraints_data = np.hstack((constraints_a.data,np.ones(nones)))
+    # all entries of G are negated so only flip the sign once
+    np.negative(constraints_data,out=constraints_data)
+    G = sparse.coo_matrix(
+        (constraints_data,(constraints_I,constraints_J)),
+        shape=(num_constraints,num_opt_vars))
+    return G
+
+def solve_cvar_linear_program(c_arr,G,h_arr,solver_name,verbosity):
+    """
+    Solve the linear program min c^Tx subject to Gx<=h, x free.
+
+    Parameters
+    ----------
+    c_arr : np.ndarray (num_opt_vars)
+        The coefficients of the objective
+
+    G : scipy.sparse.coo_matrix (num_constraints,num_opt_vars)
+        The constraint matrix
+
+    h_arr : np.ndarray (num_constraints)
+        The constraint upper bounds
+
+    solver_name : string
+        'cvxopt' - the CVXOPT interior point solver
+        'glpk' - the GLPK simplex solver called via CVXOPT
+        'highs', 'highs-ds', 'highs-ipm' - the HiGHS solvers called via
+        scipy.optimize.linprog. Requires scipy>=1.6. The dual simplex
+        method 'highs-ds' returns a vertex (sparse) solution
+
+    verbosity : integer
+        Print solver progress if verbosity>0
+
+    Returns
+    -------
+    x : np.ndarray (num_opt_vars)
+        The optimal design variables
+
+    Notes
+    -----
+    The LP is solved for the scaled variables y=Dx, where D is diagonal 
+    with entries max(max_i |G_ij|,1), i.e. G and c are replaced by GD^{-1} 
+    and D^{-1}c. This improves the conditioning of the LP when the basis
+    takes large values.
+    """
+    G = G.tocoo()
+    col_scale = np.maximum(
+        np.asarray(abs(G).max(axis=0).todense()).ravel(),1.)
+    if verbosity>1:
+        # only use for small problems
+        print('LP condition number',np.linalg.cond(G.toarray()))
+    G = sparse.coo_matrix(
+        (G.data/col_scale[G.col],(G.row,G.col)),shape=G.shape)
+    c_arr = c_arr/col_scale
+    if verbosity>1:
+        print('Scaled LP condition number',np.linalg.cond(G.toarray()))
+
+    if solver_name in ['highs','highs-ds','highs-ipm']:
+        from scipy.optimize import linprog
+        result = linprog(
+            c_arr,A_ub=G.tocsr(),b_ub=h_arr,bounds=(None,None),
+            method=solver_name,options={'disp':verbosity>0})
+        if not result.success:
+            raise Exception(result.message)
+        return result.x/col_scale
+
+    if verbosity<1:
+        solvers.options['show_progress'] = False
+    else:
+        solvers.options['show_progress'] = True
+
+    # solvers.options['abstol'] = 1e-10
+    # solvers.options['reltol'] = 1e-10
+    # solvers.options['feastol'] = 1e-10
+
+    # build the spmatrix from cvxopt matrices that wrap contiguous double
+    # and integer buffers so the COO triplets are passed without conversion
+    G = spmatrix(
+        matrix(np.ascontiguousarray(G.data,dtype=float)),
+        matrix(np.ascontiguousarray(G.row,dtype=int)),
+        matrix(np.ascontiguousarray(G.col,dtype=int)),size=G.shape)
+    return np.asarray(solvers.lp(
+        c=matrix(c_arr),G=G,h=matrix(h_arr),solver=solver_name)['x'])[:,0]/(
+            col_scale)
 
 def cvar_regression_quadrature(basis_matrix,values,alpha,nquad_intervals,
                                verbosity=1,trapezoid_rule=False,
                                solver_name='cvxopt'):
     """
-    solver_name = 'cvxopt'
-    solver_name='glpk'
+    solver_name : string
+        The linear program solver. See solve_cvar_linear_program
 
     trapezoid works but default option is better.
     """
@@ -163,6 +359,7 @@ def cvar_regression_quadrature(basis_matrix,values,alpha,nquad_intervals,
     assert values.ndim==1
     nsamples,nbasis = basis_matrix.shape
     assert values.shape[0]==nsamples
+    basis_mean = basis_matrix.mean(axis=0)
 
     if not trapezoid_rule:
         # left-hand piecewise constant quadrature rule
@@ -190,9 +387,6 @@ def cvar_regression_quadrature(basis_matrix,values,alpha,nquad_intervals,
     #print (weights
     #print (v_coef
 
-    Iquad = np.identity(nuvars)
-    Iv  = np.identity(nvconstraints)
-
     # num_quad_point = mu
     # nsamples = nu
     # nbasis = m
@@ -201,64 +395,51 @@ def cvar_regression_quadrature(basis_matrix,values,alpha,nquad_intervals,
     # v_ij variables ordering: loop through j fastest, e.g. v_11,v_{12} etc
 
     if not trapezoid_rule:
-        c_arr = np.hstack((
-            basis_matrix.sum(axis=0)/nsamples,
-            1/(1-alpha)*weights,
-            np.repeat(v_coef,nsamples)))
-
-        # # v_ij+h'c+u_i <=y_j
-        # constraints_1 = np.hstack((
-        #     -np.tile(basis_matrix,(nuvars,1)),
-        #     -np.repeat(Iquad,nsamples,axis=0),-Iv))
-        # # v_ij >=0
-        # constraints_3 = np.hstack((
-        #    np.zeros((nvconstraints,nbasis+nuvars)),-Iv))
-
-        # G_arr = np.vstack((constraints_1,constraints_3))
-        # assert G_arr.shape[0]==num_constraints
-        # assert G_arr.shape[1]==num_opt_vars
-        # assert c_arr.shape[0]==num_opt_vars
-        # I,J,data = sparse.find(G_arr)
-        # G = spmatrix(data,I,J,size=G_arr.shape)
+        c_arr = np.empty(num_opt_vars)
+        c_arr[:nbasis] = basis_mean
+        c_arr[nbasis:nbasis+nuvars] = weights/(1-alpha)
+        # equivalent to np.repeat(v_coef,nsamples) without a temporary
+        c_arr[nbasis+nuvars:].reshape(nuvars,nsamples)[:] = v_coef[:,None]
 
         #v_ij+h'c+u_i <=y_j
         constraints_1_shape = (nvconstraints,num_opt_vars)
-        constraints_1a_I = np.repeat(np.arange(nvconstraints),nbasis)
-        constraints_1a_J = np.tile(np.arange(nbasis),nvconstraints)
-        constraints_1a_data = -np.tile(basis_matrix,(nquad_intervals+1,1))
+        constraints_1a = sparse.kron(
+            np.ones((nquad_intervals+1,1)),sparse.coo_matrix(basis_matrix),
+            format='coo')
 
         constraints_1b_I = np.arange(nvconstraints)
         constraints_1b_J = np.repeat(
             np.arange(nquad_intervals+1),nsamples)+nbasis
-        constraints_1b_data = -np.repeat(np.ones(nquad_intervals+1),nsamples)
+        constraints_1b_data = np.ones(nvconstraints)
 
         ii = nbasis+nquad_intervals+1; jj = ii+nvconstraints
         constraints_1c_I = np.arange(nvconstraints)
         constraints_1c_J = np.arange(ii,jj)
-        constraints_1c_data = -np.ones((nquad_intervals+1)*nsamples)
+        constraints_1c_data = np.ones((nquad_intervals+1)*nsamples)
 
         constraints_1_data = np.hstack((
-            constraints_1a_data.flatten(),constraints_1b_data,
-            constraints_1c_data))
+            constraints_1a.data,constraints_1b_data,constraints_1c_data))
         constraints_1_I = np.hstack(
-            (constraints_1a_I,constraints_1b_I,constraints_1c_I))
+            (constraints_1a.row,constraints_1b_I,constraints_1c_I))
         constraints_1_J = np.hstack(
-            (constraints_1a_J,constraints_1b_J,constraints_1c_J))
+            (constraints_1a.col,constraints_1b_J,constraints_1c_J))
 
         # v_ij >=0
         constraints_3_I = np.arange(
             constraints_1_shape[0],constraints_1_shape[0]+nvconstraints)
         constraints_3_J = np.arange(
             nbasis+nquad_intervals+1,nbasis+nquad_intervals+1+nvconstraints)
-        constraints_3_data = -np.ones(nvconstraints)
+        constraints_3_data = np.ones(nvconstraints)
 
         constraints_shape=(num_constraints,num_opt_vars)
         constraints_I = np.hstack((constraints_1_I,constraints_3_I))
         constraints_J = np.hstack((constraints_1_J,constraints_3_J))
         constraints_data = np.hstack((constraints_1_data,constraints_3_data))
-        G = spmatrix(
-            constraints_data,constraints_I,constraints_J,size=constraints_shape)
-        # assert np.allclose(np.asarray(matrix(G)),G_arr)
+        # all entries of G are negated so only flip the sign once
+        np.negative(constraints_data,out=constraints_data)
+        G = sparse.coo_matrix(
+            (constraints_data,(constraints_I,constraints_J)),
+            shape=constraints_shape)
 
         # print (constraints_shape
         # print (np.asarray(matrix(G))
@@ -266,66 +447,36 @@ def cvar_regression_quadrature(basis_matrix,values,alpha,nquad_intervals,
         h_arr = np.hstack((
             -np.tile(values,nuvars),
             np.zeros(nvconstraints)))
-        #print (G_arr
         #print (c_arr
         #print (h_arr
 
     else:
-        c_arr = np.hstack((
-            basis_matrix.sum(axis=0)/nsamples,
-            1/(1-alpha)*weights,
-            np.repeat(v_coef,nsamples),
-            1/(nsamples*(1-alpha))*np.ones(1)))
-
-        # v_ij+h'c+u_i <=y_j
-        constraints_1 = np.hstack((
-            -np.tile(basis_matrix,(nquad_intervals,1)),
-            -np.repeat(Iquad,nsamples,axis=0),
-            -Iv,np.zeros((nvconstraints,1))))
-
-        #W+h'c<=y_j
-        constraints_2 = np.hstack((
-            -basis_matrix,
-            np.zeros((nsamples,nuvars)),
-            np.zeros((nsamples,nvconstraints)),
-            -np.ones((nsamples,1))))
-        
-        # v_ij >=0
-        constraints_3 = np.hstack((
-            np.zeros((nvconstraints,nbasis+nquad_intervals)),-Iv,
-            np.zeros((nvconstraints,1))))
-        
-        G_arr = np.vstack((constraints_1,constraints_2,constraints_3))
+        c_arr = np.empty(num_opt_vars)
+        c_arr[:nbasis] = basis_mean
+        c_arr[nbasis:nbasis+nuvars] = weights/(1-alpha)
+        # equivalent to np.repeat(v_coef,nsamples) without a temporary
+        c_arr[nbasis+nuvars:-1].reshape(nuvars,nsamples)[:] = v_coef[:,None]
+        c_arr[-1] = 1/(nsamples*(1-alpha))
+
+        G = get_cvar_regression_constraints(basis_matrix,nuvars)
 
         h_arr = np.hstack((
             -np.tile(values,nuvars),
             -values,
             np.zeros(nvconstraints)))
 
-        assert G_arr.shape[0]==num_constraints
-        assert G_arr.shape[1]==num_opt_vars
+        assert G.shape[0]==num_constraints
+        assert G.shape[1]==num_opt_vars
         assert c_arr.shape[0]==num_opt_vars
-        I,J,data = sparse.find(G_arr)
-        G = spmatrix(data,I,J,size=G_arr.shape)
 
-    c = matrix(c_arr)
-    h = matrix(h_arr)
-    if verbosity<1:
-        solvers.options['show_progress'] = False
-    else:
-        solvers.options['show_progress'] = True
-
-    # solvers.options['abstol'] = 1e-10
-    # solvers.options['reltol'] = 1e-10
-    # solvers.options['feastol'] = 1e-10
-        
-    sol = np.asarray(
-        solvers.lp(c=c, G=G, h=h, solver=solver_name)['x'])[:nbasis]
-    residuals = values-basis_matrix.dot(sol)[:,0]
+    sol = solve_cvar_linear_program(
+        c_arr,G,h_arr,solver_name,verbosity)[:nbasis]
+    residuals = values-basis_matrix.dot(sol)
     coef = np.append(conditional_value_at_risk(residuals,alpha),sol)
     return coef
 
-def cvar_regression(basis_matrix, values, alpha,verbosity=1):
+def cvar_regression(basis_matrix, values, alpha,verbosity=1,
+                    solver_name='cvxopt'):
     # do not include constant basis in optimization
     assert alpha<1 and alpha>0
     basis_matrix=basis_matrix[:,1:]
@@ -333,6 +484,7 @@ def cvar_regression(basis_matrix, values, alpha,verbosity=1):
     assert values.ndim==1
     nsamples,nbasis = basis_matrix.shape
     assert values.shape[0]==nsamples
+    basis_mean = basis_matrix.mean(axis=0)
 
     active_index = int(np.ceil(alpha*nsamples))-1# 0 based index 0,...,nsamples-1
     nactive_samples = nsamples-(active_index+1)
@@ -355,9 +507,6 @@ def cvar_regression(basis_matrix, values, alpha,verbosity=1):
     #print (v_coef
 
     nvconstraints = nsamples*nactive_samples
-    Iv  = np.identity(nvconstraints)
-    Isamp = np.identity(nsamples)
-    Iactsamp = np.identity(nactive_samples)
 
     # nactive_samples = p
     # nsamples = m
@@ -372,82 +521,105 @@ def cvar_regression(basis_matrix, values, alpha,verbosity=1):
     #     np.repeat(v_coef,nsamples).shape, # repeat([1,2],2) = [1,1,2,2]
     #     np.ones(1).shape,v_coef.shape,nactive_samples,nsamples)
     
-    c_arr = np.hstack((
-        basis_matrix.sum(axis=0)/nsamples,
-        1/(1-alpha)*beta_diff,
-        #np.tile(v_coef,nsamples),  # tile([1,2],2)   = [1,2,1,2] 
-        np.repeat(v_coef,nsamples), # repeat([1,2],2) = [1,1,2,2]
-        1./(nsamples*(1-alpha))*np.ones(1)))
-
-    #print (basis_matrix.sum(axis=0).shape,nsamples,nactive_samples
-    # print ((
-    #     np.tile(basis_matrix,(nactive_samples,1)).shape,
-    #     np.repeat(Iactsamp,nsamples,axis=0).shape,
-    #     Iv.shape,
-    #     np.zeros((nvconstraints,1)).shape)
-
     num_opt_vars = nbasis + nactive_samples + nvconstraints + 1
-    # v_ij variables ordering: loop through j fastest, e.g. v_11,v_{12} etc
-    
-    #v_ij+h'c+u_i <=y_j
-    constraints_1 = np.hstack((
-        -np.tile(basis_matrix,(nactive_samples,1)),
-        -np.repeat(Iactsamp,nsamples,axis=0),
-        -Iv,
-        np.zeros((nvconstraints,1))))
-    
-    #W+h'c<=y_j
-    constraints_2 = np.hstack((
-        -basis_matrix,
-        np.zeros((nsamples,nactive_samples)),
-        np.zeros((nsamples,nvconstraints)),
-        -np.ones((nsamples,1))))
-
-    # v_ij >=0
-    constraints_3 = np.hstack((
-            np.zeros((nvconstraints,nbasis+nactive_samples)),
-            -Iv,np.zeros((nvconstraints,1))))
-    
-    #print ((constraints_1.shape, constraints_2.shape, constraints_3.shape)
-    G_arr = np.vstack((constraints_1,constraints_2,constraints_3))
+    c_arr = np.empty(num_opt_vars)
+    c_arr[:nbasis] = basis_mean
+    c_arr[nbasis:nbasis+nactive_samples] = beta_diff/(1-alpha)
+    # equivalent to np.repeat(v_coef,nsamples) without a temporary
+    # repeat([1,2],2) = [1,1,2,2]
+    c_arr[nbasis+nactive_samples:-1].reshape(nactive_samples,nsamples)[:] = \
+        v_coef[:,None]
+    c_arr[-1] = 1./(nsamples*(1-alpha))
+    G = get_cvar_regression_constraints(basis_matrix,nactive_samples)
     
     h_arr = np.hstack((
         -np.tile(values,nactive_samples),
         -values,np.zeros(nvconstraints)))
 
-    # print (G_arr
-    # print (c_arr
-    # print (h_arr
-
-    assert G_arr.shape[1]==num_opt_vars
-    assert G_arr.shape[0]==h_arr.shape[0]
+    assert G.shape[1]==num_opt_vars
+    assert G.shape[0]==h_arr.shape[0]
     assert c_arr.shape[0]==num_opt_vars
 
+    sol = solve_cvar_linear_program(
+        c_arr,G,h_arr,solver_name,verbosity)[:nbasis]
+    residuals = values-basis_matrix.dot(sol)
+    coef = np.append(conditional_value_at_risk(residuals,alpha),sol)
+    return coef
 
-    #print (c_arr
-    # print (G_arr
-    # print (h_arr
-    # print ('rank',np.linalg.matrix_rank(G_arr), G_arr.shape
-    # print (h_arr.shape
-    
-    c = matrix(c_arr)
-    #G = matrix(G_arr)
-    h = matrix(h_arr)
+def cvar_regression_ru(basis_matrix,values,alpha,verbosity=1,
+                       solver_name='cvxopt'):
+    """
+    Compute the coefficients of a regression model that minimize the 
+    CVaR deviation CVaR_alpha(Z)-E[Z] of the residuals Z=y-h'c using the 
+    Rockafellar-Uryasev formulation of CVaR. The resulting linear program 
 
-    from scipy import sparse
-    I,J,data = sparse.find(G_arr)
-    G = spmatrix(data,I,J,size=G_arr.shape)    
-    if verbosity<1:
-        solvers.options['show_progress'] = False
-    else:
-        solvers.options['show_progress'] = True
+    min_{c,w,u} E[h'c] + w + 1/((1-alpha)*nsamples)*sum(u)
+    s.t. w+u_j >= y_j-h_j'c, u_j>=0
 
-    # solvers.options['abstol'] = 1e-10
-    # solvers.options['reltol'] = 1e-10
-    # solvers.options['feastol'] = 1e-10
-        
-    sol = np.asarray(solvers.lp(c=c, G=G, h=h)['x'])[:nbasis]
-    residuals = values-basis_matrix.dot(sol)[:,0]
+    has only nbasis+1+nsamples variables and 2*nsamples constraints, 
+    unlike the linear programs of the superquantile regressions solved 
+    by cvar_regression and cvar_regression_quadrature.
+
+    Parameters
+    ----------
+    basis_matrix : np.ndarray (nsamples,nbasis+1)
+        The basis evaluated at the samples. The first column must be the
+        constant basis
+
+    values : np.ndarray (nsamples)
+        The values of the function at the samples
+
+    alpha : float
+        The quantile of CVaR
+
+    verbosity : integer
+        Print solver progress if verbosity>0
+
+    solver_name : string
+        The linear program solver. See solve_cvar_linear_program
+
+    Returns
+    -------
+    coef : np.ndarray (nbasis+1)
+        The regression coefficients. The coefficient of the constant basis
+        is the CVaR of the residuals
+    """
+    # do not include constant basis in optimization
+    assert alpha<1 and alpha>0
+    basis_matrix=basis_matrix[:,1:]
+    assert basis_matrix.ndim==2
+    assert values.ndim==1
+    nsamples,nbasis = basis_matrix.shape
+    assert values.shape[0]==nsamples
+
+    # design vars [c_1,...,c_n,w,u_1,...,u_m]
+    num_opt_vars = nbasis+1+nsamples
+    c_arr = np.empty(num_opt_vars)
+    c_arr[:nbasis] = basis_matrix.mean(axis=0)
+    c_arr[nbasis] = 1
+    c_arr[nbasis+1:] = 1/((1-alpha)*nsamples)
+
+    # w+u_j+h_j'c >= y_j
+    basis_block = sparse.coo_matrix(basis_matrix)
+    sample_indices = np.arange(nsamples)
+    uindices = sample_indices+nbasis+1
+    constraints_I = np.hstack((
+        basis_block.row,sample_indices,sample_indices,
+        # u_j >= 0
+        sample_indices+nsamples))
+    constraints_J = np.hstack((
+        basis_block.col,np.full(nsamples,nbasis),uindices,uindices))
+    constraints_data = np.hstack((basis_block.data,np.ones(3*nsamples)))
+    # all entries of G are negated so only flip the sign once
+    np.negative(constraints_data,out=constraints_data)
+    G = sparse.coo_matrix(
+        (constraints_data,(constraints_I,constraints_J)),
+        shape=(2*nsamples,num_opt_vars))
+    h_arr = np.hstack((-values,np.zeros(nsamples)))
+
+    sol = solve_cvar_linear_program(
+        c_arr,G,h_arr,solver_name,verbosity)[:nbasis]
+    residuals = values-basis_matrix.dot(sol)
     coef = np.append(conditional_value_at_risk(residuals,alpha),sol)
     return coef
 
@@ -461,31 +633,88 @@ def cvar_univariate_integrand(f,pdf,t,x):
         vals[I] = np.maximum(f(x[:,I])[:,0]-t,0)*pdf_vals[I]
     return vals
 
+def cached_cvar_univariate_integrand(f,pdf,t,cache,x):
+    """
+    Evaluate cvar_univariate_integrand at a scalar x. The values of f and
+    pdf are stored in the dictionary cache and reused by subsequent calls 
+    with the same x, e.g. by the integrals evaluated for different t which
+    share most of their quadrature points.
+    """
+    if x not in cache:
+        xx = np.array([[x]])
+        pdf_val = pdf(xx[0,:])[0]
+        # avoid evaluating f where the integrand is zero
+        fval = f(xx)[0,0] if pdf_val>0 else 0.
+        cache[x] = (fval,pdf_val)
+    fval,pdf_val = cache[x]
+    return max(fval-t,0)*pdf_val
+
 def compute_cvar_objective_from_univariate_function_quadpack(
-        f,pdf,lbx,ubx,alpha,t,tol=4*np.finfo(float).eps):
+        f,pdf,lbx,ubx,alpha,t,tol=4*np.finfo(float).eps,cache=None):
     import warnings
     #warnings.simplefilter("ignore")
+    if cache is None:
+        integrand = partial(cvar_univariate_integrand,f,pdf,t)
+    else:
+        integrand = partial(cached_cvar_univariate_integrand,f,pdf,t,cache)
     integral,err = integrate.quad(
-        partial(cvar_univariate_integrand,f,pdf,t),lbx,ubx,
-        epsrel=tol,epsabs=tol,limit=100)
+        integrand,lbx,ubx,epsrel=tol,epsabs=tol,limit=100)
     #warnings.simplefilter("default")
     #assert err<1e-13,err
     val = t+1./(1.-alpha)*integral
     return val
 
+def estimate_value_at_risk_of_univariate_function(
+        f,pdf,lbx,ubx,alpha,ngrid=1000):
+    """
+    Estimate the value at risk of Y=f(X) using a weighted grid of ngrid 
+    points. Infinite bounds are mapped to a finite interval, e.g. 
+    x=t/(1-t^2) for t in (-1,1) when both bounds are infinite.
+    """
+    if np.isfinite(lbx) and np.isfinite(ubx):
+        transform = lambda t: (lbx+(ubx-lbx)*t,(ubx-lbx)*np.ones_like(t))
+        tlb,tub = 0,1
+    elif np.isfinite(lbx):
+        transform = lambda t: (lbx+t/(1-t),1/(1-t)**2)
+        tlb,tub = 0,1
+    elif np.isfinite(ubx):
+        transform = lambda t: (ubx-t/(1-t),1/(1-t)**2)
+        tlb,tub = 0,1
+    else:
+        transform = lambda t: (t/(1-t**2),(1+t**2)/(1-t**2)**2)
+        tlb,tub = -1,1
+    # use the midpoints of a uniform grid to avoid the singular end points
+    dt = (tub-tlb)/ngrid
+    xx,jacobian = transform(np.linspace(tlb+dt/2,tub-dt/2,ngrid))
+    weights = pdf(xx)*jacobian
+    II = np.where(weights>0)[0]
+    fvals = f(xx[np.newaxis,II])[:,0]
+    return value_at_risk(fvals,alpha,weights[II]/weights[II].sum())[0]
+
 from scipy.optimize import minimize
-def compute_cvar_from_univariate_function(f,pdf,lbx,ubx,alpha,init_guess,
+def compute_cvar_from_univariate_function(f,pdf,lbx,ubx,alpha,init_guess=None,
                                           tol=1e-7):
+    """
+    Compute the CVaR of Y=f(X) by minimizing the Rockafellar-Uryasev 
+    objective t+1/(1-alpha)E[max(Y-t,0)] whose minimizer is the VaR of Y.
+    If init_guess is None the optimizer is started at an estimate of 
+    the VaR, see estimate_value_at_risk_of_univariate_function.
+    """
+    if init_guess is None:
+        init_guess = estimate_value_at_risk_of_univariate_function(
+            f,pdf,lbx,ubx,alpha)
     # tolerance used to compute integral should be more accurate than
     # optimization tolerance
+    # the values of f and pdf at the quadrature points are reused by each
+    # evaluation of the objective
     obj = partial(compute_cvar_objective_from_univariate_function_quadpack,
-                  f,pdf,lbx,ubx,alpha)
+                  f,pdf,lbx,ubx,alpha,cache=dict())
     method='L-BFGS-B'; options={'disp':False,'gtol':tol,'ftol':tol}
     result=minimize(obj,init_guess,method=method,
                     options=options)
-    value_at_risk = result['x']
+    VaR = result['x']
     cvar = result['fun']
-    return value_at_risk, cvar
+    return VaR, cvar
 
 def cvar_importance_sampling_biasing_density(pdf,function,beta,VaR,tau,x):
     """
@@ -537,10 +766,8 @@ def cvar_importance_sampling_biasing_density(pdf,function,beta,VaR,tau,x):
     assert vals.ndim==1 or vals.shape[1]==1
     y = function(x)
     assert y.ndim==1 or y.shape[1]==1
-    I = np.where(y<VaR)[0]
-    J = np.where(y>=VaR)[0]
-    vals[I]*=beta/tau
-    vals[J]*=(1-beta)/(1-tau)
+    # scale all values in a single pass
+    vals *= np.where(y<VaR,beta/tau,(1-beta)/(1-tau)).reshape(vals.shape)
     return vals
 
 def generate_samples_from_cvar_importance_sampling_biasing_density(
@@ -587,24 +814,44 @@ def generate_samples_from_cvar_importance_sampling_biasing_density(
     nvars = candidate_samples.shape[0]
     samples = np.empty((nvars,nsamples))
     r = np.random.uniform(0,1,nsamples)
-    Ir = np.where(r<beta)[0]
-    Jr = np.where(r>=beta)[0]
+    Ir = np.flatnonzero(r<beta)
+    Jr = np.flatnonzero(r>=beta)
+    nIr,nJr = Ir.shape[0],Jr.shape[0]
     Icnt=0
     Jcnt=0
+    # the number of candidates evaluated and the number with values below VaR
+    ncandidates,nbelow = 0,0
+    # masks reused by every iteration. Only reallocated if a batch is larger
+    # than all previous batches
+    below = np.empty(nsamples,dtype=bool)
+    above = np.empty(nsamples,dtype=bool)
     while True:
         vals = function(candidate_samples)
         assert vals.ndim==1 or vals.shape[1]==1
-        I = np.where(vals<VaR)[0]
-        J = np.where(vals>=VaR)[0]
-        Iend = min(I.shape[0],Ir.shape[0]-Icnt)
-        Jend = min(J.shape[0],Jr.shape[0]-Jcnt)
+        vals = vals.ravel()
+        nbatch = vals.shape[0]
+        if nbatch>below.shape[0]:
+            below = np.empty(nbatch,dtype=bool)
+            above = np.empty(nbatch,dtype=bool)
+        I = np.flatnonzero(np.less(vals,VaR,out=below[:nbatch]))
+        J = np.flatnonzero(np.greater_equal(vals,VaR,out=above[:nbatch]))
+        Iend = min(I.shape[0],nIr-Icnt)
+        Jend = min(J.shape[0],nJr-Jcnt)
         samples[:,Ir[Icnt:Icnt+Iend]]=candidate_samples[:,I[:Iend]]
         samples[:,Jr[Jcnt:Jcnt+Jend]]=candidate_samples[:,J[:Jend]]
         Icnt+=Iend
         Jcnt+=Jend
-        if Icnt==Ir.shape[0] and Jcnt==Jr.shape[0]:
+        if Icnt==nIr and Jcnt==nJr:
             break
-        candidate_samples = generate_candidate_samples(nsamples)
+        # only draw the number of candidates expected, with a 10% margin, to
+        # fill the remaining samples, using the fraction of all candidates
+        # drawn so far that were below VaR
+        ncandidates += nbatch
+        nbelow += I.shape[0]
+        p_below = nbelow/ncandidates
+        nbatch = int(np.ceil(1.1*max(
+            (nIr-Icnt)/max(p_below,1e-3),(nJr-Jcnt)/max(1-p_below,1e-3))))
+        candidate_samples = generate_candidate_samples(nbatch)
     assert Icnt+Jcnt==nsamples
     #print(Icnt/nsamples,1-beta)
     #print(Jcnt/nsamples,beta)
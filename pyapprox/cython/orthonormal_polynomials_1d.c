@@ -972,6 +972,78 @@ struct __pyx_array_obj;
 struct __pyx_MemviewEnum_obj;
 struct __pyx_memoryview_obj;
 struct __pyx_memoryviewslice_obj;
+struct __pyx_fuse_0__pyx_opt_args_5scipy_7special_14cython_special_spherical_jn;
+struct __pyx_fuse_1__pyx_opt_args_5scipy_7special_14cython_special_spherical_jn;
+struct __pyx_fuse_0__pyx_opt_args_5scipy_7special_14cython_special_spherical_yn;
+struct __pyx_fuse_1__pyx_opt_args_5scipy_7special_14cython_special_spherical_yn;
+struct __pyx_fuse_0__pyx_opt_args_5scipy_7special_14cython_special_spherical_in;
+struct __pyx_fuse_1__pyx_opt_args_5scipy_7special_14cython_special_spherical_in;
+struct __pyx_fuse_0__pyx_opt_args_5scipy_7special_14cython_special_spherical_kn;
+struct __pyx_fuse_1__pyx_opt_args_5scipy_7special_14cython_special_spherical_kn;
+
+/* "scipy/special/cython_special.pxd":8
+ *     double
+ * 
+ * cpdef number_t spherical_jn(long n, number_t z, bint derivative=*) nogil             # <<<<<<<<<<<<<<
+ * cpdef number_t spherical_yn(long n, number_t z, bint derivative=*) nogil
+ * cpdef number_t spherical_in(long n, number_t z, bint derivative=*) nogil
+ */
+struct __pyx_fuse_0__pyx_opt_args_5scipy_7special_14cython_special_spherical_jn {
+  int __pyx_n;
+  int derivative;
+};
+struct __pyx_fuse_1__pyx_opt_args_5scipy_7special_14cython_special_spherical_jn {
+  int __pyx_n;
+  int derivative;
+};
+
+/* "scipy/special/cython_special.pxd":9
+ * 
+ * cpdef number_t spherical_jn(long n, number_t z, bint derivative=*) nogil
+ * cpdef number_t spherical_yn(long n, number_t z, bint derivative=*) nogil             # <<<<<<<<<<<<<<
+ * cpdef number_t spherical_in(long n, number_t z, bint derivative=*) nogil
+ * cpdef number_t spherical_kn(long n, number_t z, bint derivative=*) nogil
+ */
+struct __pyx_fuse_0__pyx_opt_args_5scipy_7special_14cython_special_spherical_yn {
+  int __pyx_n;
+  int derivative;
+};
+struct __pyx_fuse_1__pyx_opt_args_5scipy_7special_14cython_special_spherical_yn {
+  int __pyx_n;
+  int derivative;
+};
+
+/* "scipy/special/cython_special.pxd":10
+ * cpdef number_t spherical_jn(long n, number_t z, bint derivative=*) nogil
+ * cpdef number_t spherical_yn(long n, number_t z, bint derivative=*) nogil
+ * cpdef number_t spherical_in(long n, number_t z, bint derivative=*) nogil             # <<<<<<<<<<<<<<
+ * cpdef number_t spherical_kn(long n, number_t z, bint derivative=*) nogil
+ * 
+ */
+struct __pyx_fuse_0__pyx_opt_args_5scipy_7special_14cython_special_spherical_in {
+  int __pyx_n;
+  int derivative;
+};
+struct __pyx_fuse_1__pyx_opt_args_5scipy_7special_14cython_special_spherical_in {
+  int __pyx_n;
+  int derivative;
+};
+
+/* "scipy/special/cython_special.pxd":11
+ * cpdef number_t spherical_yn(long n, number_t z, bint derivative=*) nogil
+ * cpdef number_t spherical_in(long n, number_t z, bint derivative=*) nogil
+ * cpdef number_t spherical_kn(long n, number_t z, bint derivative=*) nogil             # <<<<<<<<<<<<<<
+ * 
+ * ctypedef fused Dd_number_t:
+ */
+struct __pyx_fuse_0__pyx_opt_args_5scipy_7special_14cython_special_spherical_kn {
+  int __pyx_n;
+  int derivative;
+};
+struct __pyx_fuse_1__pyx_opt_args_5scipy_7special_14cython_special_spherical_kn {
+  int __pyx_n;
+  int derivative;
+};
 
 /* "View.MemoryView":105
  * 
@@ -2180,6 +2252,7 @@ static PyObject *__pyx_f_8pyapprox_6cython_26orthonormal_polynomials_1d_evaluate
   int __pyx_v_npoints;
   PyObject *__pyx_v_p = NULL;
   __Pyx_memviewslice __pyx_v_p_view = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_inv_b = { 0, 0, { 0 }, { 0 }, { 0 } };
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -2188,29 +2261,31 @@ static PyObject *__pyx_f_8pyapprox_6cython_26orthonormal_polynomials_1d_evaluate
   PyObject *__pyx_t_4 = NULL;
   PyObject *__pyx_t_5 = NULL;
   __Pyx_memviewslice __pyx_t_6 = { 0, 0, { 0 }, { 0 }, { 0 } };
-  Py_ssize_t __pyx_t_7;
-  Py_ssize_t __pyx_t_8;
-  __Pyx_memviewslice __pyx_t_9 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_t_7 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  long __pyx_t_8;
+  long __pyx_t_9;
   int __pyx_t_10;
-  int __pyx_t_11;
-  int __pyx_t_12;
-  int __pyx_t_13;
-  Py_ssize_t __pyx_t_14;
-  Py_ssize_t __pyx_t_15;
+  Py_ssize_t __pyx_t_11;
+  Py_ssize_t __pyx_t_12;
+  Py_ssize_t __pyx_t_13;
+  int __pyx_t_14;
+  int __pyx_t_15;
   Py_ssize_t __pyx_t_16;
-  Py_ssize_t __pyx_t_17;
+  int __pyx_t_17;
   Py_ssize_t __pyx_t_18;
   Py_ssize_t __pyx_t_19;
   Py_ssize_t __pyx_t_20;
-  long __pyx_t_21;
-  long __pyx_t_22;
-  int __pyx_t_23;
+  Py_ssize_t __pyx_t_21;
+  Py_ssize_t __pyx_t_22;
+  Py_ssize_t __pyx_t_23;
   Py_ssize_t __pyx_t_24;
-  Py_ssize_t __pyx_t_25;
+  int __pyx_t_25;
   Py_ssize_t __pyx_t_26;
   Py_ssize_t __pyx_t_27;
   Py_ssize_t __pyx_t_28;
   Py_ssize_t __pyx_t_29;
+  Py_ssize_t __pyx_t_30;
+  Py_ssize_t __pyx_t_31;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -2276,153 +2351,174 @@ static PyObject *__pyx_f_8pyapprox_6cython_26orthonormal_polynomials_1d_evaluate
  *     p = np.zeros((x.shape[0],nmax+1),dtype=np.double)
  *     cdef double [:,:] p_view = p             # <<<<<<<<<<<<<<
  * 
- *     p_view[:,0] = 1/ab[0,1]
+ *     # compute the divisions once instead of once per sample
  */
   __pyx_t_6 = __Pyx_PyObject_to_MemoryviewSlice_dsds_double(__pyx_v_p, PyBUF_WRITABLE); if (unlikely(!__pyx_t_6.memview)) __PYX_ERR(0, 46, __pyx_L1_error)
   __pyx_v_p_view = __pyx_t_6;
   __pyx_t_6.memview = NULL;
   __pyx_t_6.data = NULL;
 
-  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":48
- *     cdef double [:,:] p_view = p
+  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":49
  * 
- *     p_view[:,0] = 1/ab[0,1]             # <<<<<<<<<<<<<<
- * 
- *     if nmax > 0:
+ *     # compute the divisions once instead of once per sample
+ *     cdef double [:] inv_b = np.empty((nmax+1),dtype=np.double)             # <<<<<<<<<<<<<<
+ *     for jj in range(nmax+1):
+ *         inv_b[jj] = 1.0/ab[jj,1]
  */
-  __pyx_t_7 = 0;
-  __pyx_t_8 = 1;
-  __pyx_t_9.data = __pyx_v_p_view.data;
-  __pyx_t_9.memview = __pyx_v_p_view.memview;
-  __PYX_INC_MEMVIEW(&__pyx_t_9, 0);
-  __pyx_t_9.shape[0] = __pyx_v_p_view.shape[0];
-__pyx_t_9.strides[0] = __pyx_v_p_view.strides[0];
-    __pyx_t_9.suboffsets[0] = -1;
-
-{
-    Py_ssize_t __pyx_tmp_idx = 0;
-    Py_ssize_t __pyx_tmp_stride = __pyx_v_p_view.strides[1];
-        __pyx_t_9.data += __pyx_tmp_idx * __pyx_tmp_stride;
-}
-
-{
-      double __pyx_temp_scalar = (1.0 / (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_ab.data + __pyx_t_7 * __pyx_v_ab.strides[0]) ) + __pyx_t_8 * __pyx_v_ab.strides[1]) ))));
-      {
-          Py_ssize_t __pyx_temp_extent_0 = __pyx_t_9.shape[0];
-          Py_ssize_t __pyx_temp_stride_0 = __pyx_t_9.strides[0];
-          char *__pyx_temp_pointer_0;
-          Py_ssize_t __pyx_temp_idx_0;
-          __pyx_temp_pointer_0 = __pyx_t_9.data;
-          for (__pyx_temp_idx_0 = 0; __pyx_temp_idx_0 < __pyx_temp_extent_0; __pyx_temp_idx_0++) {
-            *((double *) __pyx_temp_pointer_0) = __pyx_temp_scalar;
-            __pyx_temp_pointer_0 += __pyx_temp_stride_0;
-          }
-      }
-  }
-  __PYX_XDEC_MEMVIEW(&__pyx_t_9, 1);
-  __pyx_t_9.memview = NULL;
-  __pyx_t_9.data = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 49, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_empty); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 49, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyInt_From_long((__pyx_v_nmax + 1)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 49, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 49, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_5);
+  __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 49, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 49, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_double); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 49, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (PyDict_SetItem(__pyx_t_5, __pyx_n_s_dtype, __pyx_t_1) < 0) __PYX_ERR(0, 49, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_3, __pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 49, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_7 = __Pyx_PyObject_to_MemoryviewSlice_ds_double(__pyx_t_1, PyBUF_WRITABLE); if (unlikely(!__pyx_t_7.memview)) __PYX_ERR(0, 49, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_inv_b = __pyx_t_7;
+  __pyx_t_7.memview = NULL;
+  __pyx_t_7.data = NULL;
 
   /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":50
- *     p_view[:,0] = 1/ab[0,1]
+ *     # compute the divisions once instead of once per sample
+ *     cdef double [:] inv_b = np.empty((nmax+1),dtype=np.double)
+ *     for jj in range(nmax+1):             # <<<<<<<<<<<<<<
+ *         inv_b[jj] = 1.0/ab[jj,1]
  * 
- *     if nmax > 0:             # <<<<<<<<<<<<<<
- *         for ii in range(npoints):
- *             p_view[ii,1] = 1/ab[1,1] * ( (x[ii] - ab[0,0])*p_view[ii,0] )
  */
-  __pyx_t_10 = ((__pyx_v_nmax > 0) != 0);
-  if (__pyx_t_10) {
+  __pyx_t_8 = (__pyx_v_nmax + 1);
+  __pyx_t_9 = __pyx_t_8;
+  for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+    __pyx_v_jj = __pyx_t_10;
 
     /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":51
+ *     cdef double [:] inv_b = np.empty((nmax+1),dtype=np.double)
+ *     for jj in range(nmax+1):
+ *         inv_b[jj] = 1.0/ab[jj,1]             # <<<<<<<<<<<<<<
  * 
- *     if nmax > 0:
- *         for ii in range(npoints):             # <<<<<<<<<<<<<<
- *             p_view[ii,1] = 1/ab[1,1] * ( (x[ii] - ab[0,0])*p_view[ii,0] )
+ *     # p is stored in row major order so run the entire recurrence for
+ */
+    __pyx_t_11 = __pyx_v_jj;
+    __pyx_t_12 = 1;
+    __pyx_t_13 = __pyx_v_jj;
+    *((double *) ( /* dim=0 */ (__pyx_v_inv_b.data + __pyx_t_13 * __pyx_v_inv_b.strides[0]) )) = (1.0 / (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_ab.data + __pyx_t_11 * __pyx_v_ab.strides[0]) ) + __pyx_t_12 * __pyx_v_ab.strides[1]) ))));
+  }
+
+  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":55
+ *     # p is stored in row major order so run the entire recurrence for
+ *     # one sample before moving to the next. This accesses p contiguously
+ *     for ii in range(npoints):             # <<<<<<<<<<<<<<
+ *         p_view[ii,0] = inv_b[0]
  * 
  */
-    __pyx_t_11 = __pyx_v_npoints;
-    __pyx_t_12 = __pyx_t_11;
-    for (__pyx_t_13 = 0; __pyx_t_13 < __pyx_t_12; __pyx_t_13+=1) {
-      __pyx_v_ii = __pyx_t_13;
+  __pyx_t_10 = __pyx_v_npoints;
+  __pyx_t_14 = __pyx_t_10;
+  for (__pyx_t_15 = 0; __pyx_t_15 < __pyx_t_14; __pyx_t_15+=1) {
+    __pyx_v_ii = __pyx_t_15;
 
-      /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":52
- *     if nmax > 0:
- *         for ii in range(npoints):
- *             p_view[ii,1] = 1/ab[1,1] * ( (x[ii] - ab[0,0])*p_view[ii,0] )             # <<<<<<<<<<<<<<
+    /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":56
+ *     # one sample before moving to the next. This accesses p contiguously
+ *     for ii in range(npoints):
+ *         p_view[ii,0] = inv_b[0]             # <<<<<<<<<<<<<<
  * 
- *     for jj in range(2, nmax+1):
+ *         if nmax > 0:
  */
-      __pyx_t_8 = 1;
-      __pyx_t_7 = 1;
-      __pyx_t_14 = __pyx_v_ii;
-      __pyx_t_15 = 0;
-      __pyx_t_16 = 0;
-      __pyx_t_17 = __pyx_v_ii;
-      __pyx_t_18 = 0;
-      __pyx_t_19 = __pyx_v_ii;
-      __pyx_t_20 = 1;
-      *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_p_view.data + __pyx_t_19 * __pyx_v_p_view.strides[0]) ) + __pyx_t_20 * __pyx_v_p_view.strides[1]) )) = ((1.0 / (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_ab.data + __pyx_t_8 * __pyx_v_ab.strides[0]) ) + __pyx_t_7 * __pyx_v_ab.strides[1]) )))) * (((*((double *) ( /* dim=0 */ (__pyx_v_x.data + __pyx_t_14 * __pyx_v_x.strides[0]) ))) - (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_ab.data + __pyx_t_15 * __pyx_v_ab.strides[0]) ) + __pyx_t_16 * __pyx_v_ab.strides[1]) )))) * (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_p_view.data + __pyx_t_17 * __pyx_v_p_view.strides[0]) ) + __pyx_t_18 * __pyx_v_p_view.strides[1]) )))));
-    }
+    __pyx_t_12 = 0;
+    __pyx_t_11 = __pyx_v_ii;
+    __pyx_t_16 = 0;
+    *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_p_view.data + __pyx_t_11 * __pyx_v_p_view.strides[0]) ) + __pyx_t_16 * __pyx_v_p_view.strides[1]) )) = (*((double *) ( /* dim=0 */ (__pyx_v_inv_b.data + __pyx_t_12 * __pyx_v_inv_b.strides[0]) )));
 
-    /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":50
- *     p_view[:,0] = 1/ab[0,1]
+    /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":58
+ *         p_view[ii,0] = inv_b[0]
+ * 
+ *         if nmax > 0:             # <<<<<<<<<<<<<<
+ *             p_view[ii,1] = inv_b[1] * ( (x[ii] - ab[0,0])*p_view[ii,0] )
  * 
- *     if nmax > 0:             # <<<<<<<<<<<<<<
- *         for ii in range(npoints):
- *             p_view[ii,1] = 1/ab[1,1] * ( (x[ii] - ab[0,0])*p_view[ii,0] )
  */
-  }
+    __pyx_t_17 = ((__pyx_v_nmax > 0) != 0);
+    if (__pyx_t_17) {
 
-  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":54
- *             p_view[ii,1] = 1/ab[1,1] * ( (x[ii] - ab[0,0])*p_view[ii,0] )
+      /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":59
  * 
- *     for jj in range(2, nmax+1):             # <<<<<<<<<<<<<<
- *         for ii in range(npoints):
- *             p_view[ii,jj] = 1.0/ab[jj,1]*((x[ii]-ab[jj-1,0])*p_view[ii,jj-1]-ab[jj-1,1]*p_view[ii,jj-2])
+ *         if nmax > 0:
+ *             p_view[ii,1] = inv_b[1] * ( (x[ii] - ab[0,0])*p_view[ii,0] )             # <<<<<<<<<<<<<<
+ * 
+ *         for jj in range(2, nmax+1):
  */
-  __pyx_t_21 = (__pyx_v_nmax + 1);
-  __pyx_t_22 = __pyx_t_21;
-  for (__pyx_t_11 = 2; __pyx_t_11 < __pyx_t_22; __pyx_t_11+=1) {
-    __pyx_v_jj = __pyx_t_11;
+      __pyx_t_12 = 1;
+      __pyx_t_18 = __pyx_v_ii;
+      __pyx_t_19 = 0;
+      __pyx_t_20 = 0;
+      __pyx_t_21 = __pyx_v_ii;
+      __pyx_t_22 = 0;
+      __pyx_t_23 = __pyx_v_ii;
+      __pyx_t_24 = 1;
+      *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_p_view.data + __pyx_t_23 * __pyx_v_p_view.strides[0]) ) + __pyx_t_24 * __pyx_v_p_view.strides[1]) )) = ((*((double *) ( /* dim=0 */ (__pyx_v_inv_b.data + __pyx_t_12 * __pyx_v_inv_b.strides[0]) ))) * (((*((double *) ( /* dim=0 */ (__pyx_v_x.data + __pyx_t_18 * __pyx_v_x.strides[0]) ))) - (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_ab.data + __pyx_t_19 * __pyx_v_ab.strides[0]) ) + __pyx_t_20 * __pyx_v_ab.strides[1]) )))) * (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_p_view.data + __pyx_t_21 * __pyx_v_p_view.strides[0]) ) + __pyx_t_22 * __pyx_v_p_view.strides[1]) )))));
 
-    /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":55
+      /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":58
+ *         p_view[ii,0] = inv_b[0]
  * 
- *     for jj in range(2, nmax+1):
- *         for ii in range(npoints):             # <<<<<<<<<<<<<<
- *             p_view[ii,jj] = 1.0/ab[jj,1]*((x[ii]-ab[jj-1,0])*p_view[ii,jj-1]-ab[jj-1,1]*p_view[ii,jj-2])
+ *         if nmax > 0:             # <<<<<<<<<<<<<<
+ *             p_view[ii,1] = inv_b[1] * ( (x[ii] - ab[0,0])*p_view[ii,0] )
  * 
  */
-    __pyx_t_12 = __pyx_v_npoints;
-    __pyx_t_13 = __pyx_t_12;
-    for (__pyx_t_23 = 0; __pyx_t_23 < __pyx_t_13; __pyx_t_23+=1) {
-      __pyx_v_ii = __pyx_t_23;
+    }
 
-      /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":56
- *     for jj in range(2, nmax+1):
- *         for ii in range(npoints):
- *             p_view[ii,jj] = 1.0/ab[jj,1]*((x[ii]-ab[jj-1,0])*p_view[ii,jj-1]-ab[jj-1,1]*p_view[ii,jj-2])             # <<<<<<<<<<<<<<
+    /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":61
+ *             p_view[ii,1] = inv_b[1] * ( (x[ii] - ab[0,0])*p_view[ii,0] )
+ * 
+ *         for jj in range(2, nmax+1):             # <<<<<<<<<<<<<<
+ *             p_view[ii,jj] = inv_b[jj]*((x[ii]-ab[jj-1,0])*p_view[ii,jj-1]-ab[jj-1,1]*p_view[ii,jj-2])
+ * 
+ */
+    __pyx_t_8 = (__pyx_v_nmax + 1);
+    __pyx_t_9 = __pyx_t_8;
+    for (__pyx_t_25 = 2; __pyx_t_25 < __pyx_t_9; __pyx_t_25+=1) {
+      __pyx_v_jj = __pyx_t_25;
+
+      /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":62
+ * 
+ *         for jj in range(2, nmax+1):
+ *             p_view[ii,jj] = inv_b[jj]*((x[ii]-ab[jj-1,0])*p_view[ii,jj-1]-ab[jj-1,1]*p_view[ii,jj-2])             # <<<<<<<<<<<<<<
  * 
  *     return p
  */
-      __pyx_t_18 = __pyx_v_jj;
-      __pyx_t_17 = 1;
-      __pyx_t_16 = __pyx_v_ii;
-      __pyx_t_15 = (__pyx_v_jj - 1);
-      __pyx_t_14 = 0;
-      __pyx_t_7 = __pyx_v_ii;
-      __pyx_t_8 = (__pyx_v_jj - 1);
-      __pyx_t_24 = (__pyx_v_jj - 1);
-      __pyx_t_25 = 1;
-      __pyx_t_26 = __pyx_v_ii;
-      __pyx_t_27 = (__pyx_v_jj - 2);
+      __pyx_t_22 = __pyx_v_jj;
+      __pyx_t_21 = __pyx_v_ii;
+      __pyx_t_20 = (__pyx_v_jj - 1);
+      __pyx_t_19 = 0;
+      __pyx_t_18 = __pyx_v_ii;
+      __pyx_t_12 = (__pyx_v_jj - 1);
+      __pyx_t_26 = (__pyx_v_jj - 1);
+      __pyx_t_27 = 1;
       __pyx_t_28 = __pyx_v_ii;
-      __pyx_t_29 = __pyx_v_jj;
-      *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_p_view.data + __pyx_t_28 * __pyx_v_p_view.strides[0]) ) + __pyx_t_29 * __pyx_v_p_view.strides[1]) )) = ((1.0 / (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_ab.data + __pyx_t_18 * __pyx_v_ab.strides[0]) ) + __pyx_t_17 * __pyx_v_ab.strides[1]) )))) * ((((*((double *) ( /* dim=0 */ (__pyx_v_x.data + __pyx_t_16 * __pyx_v_x.strides[0]) ))) - (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_ab.data + __pyx_t_15 * __pyx_v_ab.strides[0]) ) + __pyx_t_14 * __pyx_v_ab.strides[1]) )))) * (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_p_view.data + __pyx_t_7 * __pyx_v_p_view.strides[0]) ) + __pyx_t_8 * __pyx_v_p_view.strides[1]) )))) - ((*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_ab.data + __pyx_t_24 * __pyx_v_ab.strides[0]) ) + __pyx_t_25 * __pyx_v_ab.strides[1]) ))) * (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_p_view.data + __pyx_t_26 * __pyx_v_p_view.strides[0]) ) + __pyx_t_27 * __pyx_v_p_view.strides[1]) ))))));
+      __pyx_t_29 = (__pyx_v_jj - 2);
+      __pyx_t_30 = __pyx_v_ii;
+      __pyx_t_31 = __pyx_v_jj;
+      *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_p_view.data + __pyx_t_30 * __pyx_v_p_view.strides[0]) ) + __pyx_t_31 * __pyx_v_p_view.strides[1]) )) = ((*((double *) ( /* dim=0 */ (__pyx_v_inv_b.data + __pyx_t_22 * __pyx_v_inv_b.strides[0]) ))) * ((((*((double *) ( /* dim=0 */ (__pyx_v_x.data + __pyx_t_21 * __pyx_v_x.strides[0]) ))) - (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_ab.data + __pyx_t_20 * __pyx_v_ab.strides[0]) ) + __pyx_t_19 * __pyx_v_ab.strides[1]) )))) * (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_p_view.data + __pyx_t_18 * __pyx_v_p_view.strides[0]) ) + __pyx_t_12 * __pyx_v_p_view.strides[1]) )))) - ((*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_ab.data + __pyx_t_26 * __pyx_v_ab.strides[0]) ) + __pyx_t_27 * __pyx_v_ab.strides[1]) ))) * (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_p_view.data + __pyx_t_28 * __pyx_v_p_view.strides[0]) ) + __pyx_t_29 * __pyx_v_p_view.strides[1]) ))))));
     }
   }
 
-  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":58
- *             p_view[ii,jj] = 1.0/ab[jj,1]*((x[ii]-ab[jj-1,0])*p_view[ii,jj-1]-ab[jj-1,1]*p_view[ii,jj-2])
+  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":64
+ *             p_view[ii,jj] = inv_b[jj]*((x[ii]-ab[jj-1,0])*p_view[ii,jj-1]-ab[jj-1,1]*p_view[ii,jj-2])
  * 
  *     return p             # <<<<<<<<<<<<<<
  * 
@@ -2449,12 +2545,13 @@ __pyx_t_9.strides[0] = __pyx_v_p_view.strides[0];
   __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
   __PYX_XDEC_MEMVIEW(&__pyx_t_6, 1);
-  __PYX_XDEC_MEMVIEW(&__pyx_t_9, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_t_7, 1);
   __Pyx_AddTraceback("pyapprox.cython.orthonormal_polynomials_1d.evaluate_orthonormal_polynomial_1d_pyx", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
   __Pyx_XDECREF(__pyx_v_p);
   __PYX_XDEC_MEMVIEW(&__pyx_v_p_view, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_inv_b, 1);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
@@ -2566,7 +2663,7 @@ static PyObject *__pyx_pf_8pyapprox_6cython_26orthonormal_polynomials_1d_evaluat
   return __pyx_r;
 }
 
-/* "pyapprox/cython/orthonormal_polynomials_1d.pyx":64
+/* "pyapprox/cython/orthonormal_polynomials_1d.pyx":70
  * @cython.boundscheck(False)  # Deactivate bounds checking
  * @cython.wraparound(False)   # Deactivate negative indexing.
  * cpdef evaluate_orthonormal_polynomial_deriv_1d_pyx(double [:] x, int nmax, double [:,:] ab, int deriv_order):             # <<<<<<<<<<<<<<
@@ -2579,13 +2676,15 @@ static PyObject *__pyx_f_8pyapprox_6cython_26orthonormal_polynomials_1d_evaluate
   int __pyx_v_ii;
   int __pyx_v_jj;
   int __pyx_v_deriv_num;
+  int __pyx_v_offset;
   int __pyx_v_num_samples;
   int __pyx_v_num_indices;
   PyObject *__pyx_v_result = NULL;
   __Pyx_memviewslice __pyx_v_result_view = { 0, 0, { 0 }, { 0 }, { 0 } };
-  __Pyx_memviewslice __pyx_v_pd = { 0, 0, { 0 }, { 0 }, { 0 } };
   double __pyx_v_bsum;
+  double __pyx_v_pd_init;
   __Pyx_memviewslice __pyx_v_p = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_inv_b = { 0, 0, { 0 }, { 0 }, { 0 } };
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -2595,18 +2694,18 @@ static PyObject *__pyx_f_8pyapprox_6cython_26orthonormal_polynomials_1d_evaluate
   PyObject *__pyx_t_5 = NULL;
   __Pyx_memviewslice __pyx_t_6 = { 0, 0, { 0 }, { 0 }, { 0 } };
   int __pyx_t_7;
-  long __pyx_t_8;
-  long __pyx_t_9;
+  __Pyx_memviewslice __pyx_t_8 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  int __pyx_t_9;
   int __pyx_t_10;
-  int __pyx_t_11;
-  int __pyx_t_12;
-  int __pyx_t_13;
+  Py_ssize_t __pyx_t_11;
+  Py_ssize_t __pyx_t_12;
+  Py_ssize_t __pyx_t_13;
   long __pyx_t_14;
   long __pyx_t_15;
   int __pyx_t_16;
-  Py_ssize_t __pyx_t_17;
-  Py_ssize_t __pyx_t_18;
-  __Pyx_memviewslice __pyx_t_19 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_t_17 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  int __pyx_t_18;
+  int __pyx_t_19;
   int __pyx_t_20;
   int __pyx_t_21;
   Py_ssize_t __pyx_t_22;
@@ -2620,23 +2719,24 @@ static PyObject *__pyx_f_8pyapprox_6cython_26orthonormal_polynomials_1d_evaluate
   Py_ssize_t __pyx_t_30;
   Py_ssize_t __pyx_t_31;
   Py_ssize_t __pyx_t_32;
-  __Pyx_memviewslice __pyx_t_33 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  Py_ssize_t __pyx_t_33;
+  Py_ssize_t __pyx_t_34;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("evaluate_orthonormal_polynomial_deriv_1d_pyx", 0);
 
-  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":102
+  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":108
  * 
- *     cdef int ii,jj,deriv_num
+ *     cdef int ii,jj,deriv_num,offset
  *     cdef int num_samples = x.shape[0]             # <<<<<<<<<<<<<<
  *     cdef int num_indices = nmax+1
  *     result = np.empty((num_samples,num_indices*(deriv_order+1)))
  */
   __pyx_v_num_samples = (__pyx_v_x.shape[0]);
 
-  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":103
- *     cdef int ii,jj,deriv_num
+  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":109
+ *     cdef int ii,jj,deriv_num,offset
  *     cdef int num_samples = x.shape[0]
  *     cdef int num_indices = nmax+1             # <<<<<<<<<<<<<<
  *     result = np.empty((num_samples,num_indices*(deriv_order+1)))
@@ -2644,23 +2744,23 @@ static PyObject *__pyx_f_8pyapprox_6cython_26orthonormal_polynomials_1d_evaluate
  */
   __pyx_v_num_indices = (__pyx_v_nmax + 1);
 
-  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":104
+  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":110
  *     cdef int num_samples = x.shape[0]
  *     cdef int num_indices = nmax+1
  *     result = np.empty((num_samples,num_indices*(deriv_order+1)))             # <<<<<<<<<<<<<<
  *     cdef double [:,:] result_view = result
- *     cdef double [:,:] pd = np.zeros((num_samples,num_indices),dtype=float)
+ *     cdef double bsum=0, pd_init
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 104, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 110, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 104, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 110, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_num_samples); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 104, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_num_samples); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 110, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_4 = __Pyx_PyInt_From_long((__pyx_v_num_indices * (__pyx_v_deriv_order + 1))); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 104, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyInt_From_long((__pyx_v_num_indices * (__pyx_v_deriv_order + 1))); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 110, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 104, __pyx_L1_error)
+  __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 110, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_GIVEREF(__pyx_t_2);
   PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_2);
@@ -2681,97 +2781,54 @@ static PyObject *__pyx_f_8pyapprox_6cython_26orthonormal_polynomials_1d_evaluate
   __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_t_5) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_5);
   __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 104, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 110, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __pyx_v_result = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":105
+  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":111
  *     cdef int num_indices = nmax+1
  *     result = np.empty((num_samples,num_indices*(deriv_order+1)))
  *     cdef double [:,:] result_view = result             # <<<<<<<<<<<<<<
- *     cdef double [:,:] pd = np.zeros((num_samples,num_indices),dtype=float)
- *     cdef double bsum=0
+ *     cdef double bsum=0, pd_init
+ * 
  */
-  __pyx_t_6 = __Pyx_PyObject_to_MemoryviewSlice_dsds_double(__pyx_v_result, PyBUF_WRITABLE); if (unlikely(!__pyx_t_6.memview)) __PYX_ERR(0, 105, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_to_MemoryviewSlice_dsds_double(__pyx_v_result, PyBUF_WRITABLE); if (unlikely(!__pyx_t_6.memview)) __PYX_ERR(0, 111, __pyx_L1_error)
   __pyx_v_result_view = __pyx_t_6;
   __pyx_t_6.memview = NULL;
   __pyx_t_6.data = NULL;
 
-  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":106
+  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":112
  *     result = np.empty((num_samples,num_indices*(deriv_order+1)))
  *     cdef double [:,:] result_view = result
- *     cdef double [:,:] pd = np.zeros((num_samples,num_indices),dtype=float)             # <<<<<<<<<<<<<<
- *     cdef double bsum=0
- * 
- */
-  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 106, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_zeros); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 106, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_num_samples); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 106, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_num_indices); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 106, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 106, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_GIVEREF(__pyx_t_1);
-  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_5);
-  PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_5);
-  __pyx_t_1 = 0;
-  __pyx_t_5 = 0;
-  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 106, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_GIVEREF(__pyx_t_4);
-  PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4);
-  __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 106, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_dtype, ((PyObject *)(&PyFloat_Type))) < 0) __PYX_ERR(0, 106, __pyx_L1_error)
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_5, __pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 106, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_6 = __Pyx_PyObject_to_MemoryviewSlice_dsds_double(__pyx_t_1, PyBUF_WRITABLE); if (unlikely(!__pyx_t_6.memview)) __PYX_ERR(0, 106, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_v_pd = __pyx_t_6;
-  __pyx_t_6.memview = NULL;
-  __pyx_t_6.data = NULL;
-
-  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":107
- *     cdef double [:,:] result_view = result
- *     cdef double [:,:] pd = np.zeros((num_samples,num_indices),dtype=float)
- *     cdef double bsum=0             # <<<<<<<<<<<<<<
+ *     cdef double bsum=0, pd_init             # <<<<<<<<<<<<<<
  * 
  *     cdef double [:,:] p = evaluate_orthonormal_polynomial_1d_pyx(x, nmax, ab)
  */
   __pyx_v_bsum = 0.0;
 
-  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":109
- *     cdef double bsum=0
+  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":114
+ *     cdef double bsum=0, pd_init
  * 
  *     cdef double [:,:] p = evaluate_orthonormal_polynomial_1d_pyx(x, nmax, ab)             # <<<<<<<<<<<<<<
  *     result_view[:,:num_indices] = p
  * 
  */
-  __pyx_t_1 = __pyx_f_8pyapprox_6cython_26orthonormal_polynomials_1d_evaluate_orthonormal_polynomial_1d_pyx(__pyx_v_x, __pyx_v_nmax, __pyx_v_ab, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 109, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_8pyapprox_6cython_26orthonormal_polynomials_1d_evaluate_orthonormal_polynomial_1d_pyx(__pyx_v_x, __pyx_v_nmax, __pyx_v_ab, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 114, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_6 = __Pyx_PyObject_to_MemoryviewSlice_dsds_double(__pyx_t_1, PyBUF_WRITABLE); if (unlikely(!__pyx_t_6.memview)) __PYX_ERR(0, 109, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_to_MemoryviewSlice_dsds_double(__pyx_t_1, PyBUF_WRITABLE); if (unlikely(!__pyx_t_6.memview)) __PYX_ERR(0, 114, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_v_p = __pyx_t_6;
   __pyx_t_6.memview = NULL;
   __pyx_t_6.data = NULL;
 
-  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":110
+  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":115
  * 
  *     cdef double [:,:] p = evaluate_orthonormal_polynomial_1d_pyx(x, nmax, ab)
  *     result_view[:,:num_indices] = p             # <<<<<<<<<<<<<<
  * 
- *     for deriv_num in range(1,deriv_order+1):
+ *     cdef double [:] inv_b = np.empty((num_indices),dtype=np.double)
  */
   __pyx_t_6.data = __pyx_v_result_view.data;
   __pyx_t_6.memview = __pyx_v_result_view.memview;
@@ -2795,45 +2852,161 @@ __pyx_t_7 = -1;
     0,
     1) < 0))
 {
-    __PYX_ERR(0, 110, __pyx_L1_error)
+    __PYX_ERR(0, 115, __pyx_L1_error)
 }
 
-if (unlikely(__pyx_memoryview_copy_contents(__pyx_v_p, __pyx_t_6, 2, 2, 0) < 0)) __PYX_ERR(0, 110, __pyx_L1_error)
+if (unlikely(__pyx_memoryview_copy_contents(__pyx_v_p, __pyx_t_6, 2, 2, 0) < 0)) __PYX_ERR(0, 115, __pyx_L1_error)
   __PYX_XDEC_MEMVIEW(&__pyx_t_6, 1);
   __pyx_t_6.memview = NULL;
   __pyx_t_6.data = NULL;
 
-  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":112
+  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":117
  *     result_view[:,:num_indices] = p
  * 
+ *     cdef double [:] inv_b = np.empty((num_indices),dtype=np.double)             # <<<<<<<<<<<<<<
+ *     for jj in range(num_indices):
+ *         inv_b[jj] = 1.0/ab[jj,1]
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 117, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 117, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_num_indices); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 117, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 117, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_1);
+  __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 117, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 117, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_double); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 117, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_dtype, __pyx_t_2) < 0) __PYX_ERR(0, 117, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_5, __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 117, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_8 = __Pyx_PyObject_to_MemoryviewSlice_ds_double(__pyx_t_2, PyBUF_WRITABLE); if (unlikely(!__pyx_t_8.memview)) __PYX_ERR(0, 117, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_inv_b = __pyx_t_8;
+  __pyx_t_8.memview = NULL;
+  __pyx_t_8.data = NULL;
+
+  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":118
+ * 
+ *     cdef double [:] inv_b = np.empty((num_indices),dtype=np.double)
+ *     for jj in range(num_indices):             # <<<<<<<<<<<<<<
+ *         inv_b[jj] = 1.0/ab[jj,1]
+ * 
+ */
+  __pyx_t_7 = __pyx_v_num_indices;
+  __pyx_t_9 = __pyx_t_7;
+  for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+    __pyx_v_jj = __pyx_t_10;
+
+    /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":119
+ *     cdef double [:] inv_b = np.empty((num_indices),dtype=np.double)
+ *     for jj in range(num_indices):
+ *         inv_b[jj] = 1.0/ab[jj,1]             # <<<<<<<<<<<<<<
+ * 
+ *     # the derivatives are written directly into result and the derivatives
+ */
+    __pyx_t_11 = __pyx_v_jj;
+    __pyx_t_12 = 1;
+    __pyx_t_13 = __pyx_v_jj;
+    *((double *) ( /* dim=0 */ (__pyx_v_inv_b.data + __pyx_t_13 * __pyx_v_inv_b.strides[0]) )) = (1.0 / (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_ab.data + __pyx_t_11 * __pyx_v_ab.strides[0]) ) + __pyx_t_12 * __pyx_v_ab.strides[1]) ))));
+  }
+
+  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":124
+ *     # of the previous order are read from result
+ *     # bsum is the running sum of log(b_j**2) for j<=deriv_num
+ *     bsum = log(ab[0,1]**2)             # <<<<<<<<<<<<<<
+ *     for deriv_num in range(1,deriv_order+1):
+ *         offset = deriv_num*num_indices
+ */
+  __pyx_t_12 = 0;
+  __pyx_t_11 = 1;
+  __pyx_v_bsum = log(pow((*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_ab.data + __pyx_t_12 * __pyx_v_ab.strides[0]) ) + __pyx_t_11 * __pyx_v_ab.strides[1]) ))), 2.0));
+
+  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":125
+ *     # bsum is the running sum of log(b_j**2) for j<=deriv_num
+ *     bsum = log(ab[0,1]**2)
  *     for deriv_num in range(1,deriv_order+1):             # <<<<<<<<<<<<<<
- *         pd[:,:] = 0
- *         for jj in range(deriv_num,num_indices):
+ *         offset = deriv_num*num_indices
+ *         result_view[:,offset:offset+min(deriv_num,num_indices)] = 0
  */
-  __pyx_t_8 = (__pyx_v_deriv_order + 1);
-  __pyx_t_9 = __pyx_t_8;
-  for (__pyx_t_7 = 1; __pyx_t_7 < __pyx_t_9; __pyx_t_7+=1) {
+  __pyx_t_14 = (__pyx_v_deriv_order + 1);
+  __pyx_t_15 = __pyx_t_14;
+  for (__pyx_t_7 = 1; __pyx_t_7 < __pyx_t_15; __pyx_t_7+=1) {
     __pyx_v_deriv_num = __pyx_t_7;
 
-    /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":113
- * 
+    /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":126
+ *     bsum = log(ab[0,1]**2)
  *     for deriv_num in range(1,deriv_order+1):
- *         pd[:,:] = 0             # <<<<<<<<<<<<<<
- *         for jj in range(deriv_num,num_indices):
- *             if (jj == deriv_num):
+ *         offset = deriv_num*num_indices             # <<<<<<<<<<<<<<
+ *         result_view[:,offset:offset+min(deriv_num,num_indices)] = 0
+ *         if deriv_num >= num_indices:
  */
-    {
+    __pyx_v_offset = (__pyx_v_deriv_num * __pyx_v_num_indices);
+
+    /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":127
+ *     for deriv_num in range(1,deriv_order+1):
+ *         offset = deriv_num*num_indices
+ *         result_view[:,offset:offset+min(deriv_num,num_indices)] = 0             # <<<<<<<<<<<<<<
+ *         if deriv_num >= num_indices:
+ *             continue
+ */
+    __pyx_t_9 = __pyx_v_num_indices;
+    __pyx_t_10 = __pyx_v_deriv_num;
+    if (((__pyx_t_9 < __pyx_t_10) != 0)) {
+      __pyx_t_16 = __pyx_t_9;
+    } else {
+      __pyx_t_16 = __pyx_t_10;
+    }
+    __pyx_t_17.data = __pyx_v_result_view.data;
+    __pyx_t_17.memview = __pyx_v_result_view.memview;
+    __PYX_INC_MEMVIEW(&__pyx_t_17, 0);
+    __pyx_t_17.shape[0] = __pyx_v_result_view.shape[0];
+__pyx_t_17.strides[0] = __pyx_v_result_view.strides[0];
+    __pyx_t_17.suboffsets[0] = -1;
+
+__pyx_t_9 = -1;
+    if (unlikely(__pyx_memoryview_slice_memviewslice(
+    &__pyx_t_17,
+    __pyx_v_result_view.shape[1], __pyx_v_result_view.strides[1], __pyx_v_result_view.suboffsets[1],
+    1,
+    1,
+    &__pyx_t_9,
+    __pyx_v_offset,
+    (__pyx_v_offset + __pyx_t_16),
+    0,
+    1,
+    1,
+    0,
+    1) < 0))
+{
+    __PYX_ERR(0, 127, __pyx_L1_error)
+}
+
+{
         double __pyx_temp_scalar = 0.0;
         {
-            Py_ssize_t __pyx_temp_extent_0 = __pyx_v_pd.shape[0];
-            Py_ssize_t __pyx_temp_stride_0 = __pyx_v_pd.strides[0];
+            Py_ssize_t __pyx_temp_extent_0 = __pyx_t_17.shape[0];
+            Py_ssize_t __pyx_temp_stride_0 = __pyx_t_17.strides[0];
             char *__pyx_temp_pointer_0;
             Py_ssize_t __pyx_temp_idx_0;
-            Py_ssize_t __pyx_temp_extent_1 = __pyx_v_pd.shape[1];
-            Py_ssize_t __pyx_temp_stride_1 = __pyx_v_pd.strides[1];
+            Py_ssize_t __pyx_temp_extent_1 = __pyx_t_17.shape[1];
+            Py_ssize_t __pyx_temp_stride_1 = __pyx_t_17.strides[1];
             char *__pyx_temp_pointer_1;
             Py_ssize_t __pyx_temp_idx_1;
-            __pyx_temp_pointer_0 = __pyx_v_pd.data;
+            __pyx_temp_pointer_0 = __pyx_t_17.data;
             for (__pyx_temp_idx_0 = 0; __pyx_temp_idx_0 < __pyx_temp_extent_0; __pyx_temp_idx_0++) {
               __pyx_temp_pointer_1 = __pyx_temp_pointer_0;
               for (__pyx_temp_idx_1 = 0; __pyx_temp_idx_1 < __pyx_temp_extent_1; __pyx_temp_idx_1++) {
@@ -2844,236 +3017,158 @@ if (unlikely(__pyx_memoryview_copy_contents(__pyx_v_p, __pyx_t_6, 2, 2, 0) < 0))
             }
         }
     }
+    __PYX_XDEC_MEMVIEW(&__pyx_t_17, 1);
+    __pyx_t_17.memview = NULL;
+    __pyx_t_17.data = NULL;
 
-    /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":114
- *     for deriv_num in range(1,deriv_order+1):
- *         pd[:,:] = 0
- *         for jj in range(deriv_num,num_indices):             # <<<<<<<<<<<<<<
- *             if (jj == deriv_num):
- *                 bsum = 0
- */
-    __pyx_t_10 = __pyx_v_num_indices;
-    __pyx_t_11 = __pyx_t_10;
-    for (__pyx_t_12 = __pyx_v_deriv_num; __pyx_t_12 < __pyx_t_11; __pyx_t_12+=1) {
-      __pyx_v_jj = __pyx_t_12;
-
-      /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":115
- *         pd[:,:] = 0
- *         for jj in range(deriv_num,num_indices):
- *             if (jj == deriv_num):             # <<<<<<<<<<<<<<
- *                 bsum = 0
- *                 for ii in range(jj+1):
- */
-      __pyx_t_13 = ((__pyx_v_jj == __pyx_v_deriv_num) != 0);
-      if (__pyx_t_13) {
-
-        /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":116
- *         for jj in range(deriv_num,num_indices):
- *             if (jj == deriv_num):
- *                 bsum = 0             # <<<<<<<<<<<<<<
- *                 for ii in range(jj+1):
- *                     bsum += log(ab[ii,1]**2)
- */
-        __pyx_v_bsum = 0.0;
-
-        /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":117
- *             if (jj == deriv_num):
- *                 bsum = 0
- *                 for ii in range(jj+1):             # <<<<<<<<<<<<<<
- *                     bsum += log(ab[ii,1]**2)
- *                 # use following expression to avoid overflow issues when
- */
-        __pyx_t_14 = (__pyx_v_jj + 1);
-        __pyx_t_15 = __pyx_t_14;
-        for (__pyx_t_16 = 0; __pyx_t_16 < __pyx_t_15; __pyx_t_16+=1) {
-          __pyx_v_ii = __pyx_t_16;
-
-          /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":118
- *                 bsum = 0
- *                 for ii in range(jj+1):
- *                     bsum += log(ab[ii,1]**2)             # <<<<<<<<<<<<<<
- *                 # use following expression to avoid overflow issues when
- *                 # computing oveflow
- */
-          __pyx_t_17 = __pyx_v_ii;
-          __pyx_t_18 = 1;
-          __pyx_v_bsum = (__pyx_v_bsum + log(pow((*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_ab.data + __pyx_t_17 * __pyx_v_ab.strides[0]) ) + __pyx_t_18 * __pyx_v_ab.strides[1]) ))), 2.0)));
-        }
-
-        /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":121
- *                 # use following expression to avoid overflow issues when
- *                 # computing oveflow
- *                 pd[:,jj] = exp(gammaln(deriv_num+1)-0.5*bsum)             # <<<<<<<<<<<<<<
- *             else:
- *                 for ii in range(num_samples):
+    /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":128
+ *         offset = deriv_num*num_indices
+ *         result_view[:,offset:offset+min(deriv_num,num_indices)] = 0
+ *         if deriv_num >= num_indices:             # <<<<<<<<<<<<<<
+ *             continue
+ *         bsum += log(ab[deriv_num,1]**2)
  */
-        __pyx_t_19.data = __pyx_v_pd.data;
-        __pyx_t_19.memview = __pyx_v_pd.memview;
-        __PYX_INC_MEMVIEW(&__pyx_t_19, 0);
-        __pyx_t_19.shape[0] = __pyx_v_pd.shape[0];
-__pyx_t_19.strides[0] = __pyx_v_pd.strides[0];
-    __pyx_t_19.suboffsets[0] = -1;
-
-{
-    Py_ssize_t __pyx_tmp_idx = __pyx_v_jj;
-    Py_ssize_t __pyx_tmp_stride = __pyx_v_pd.strides[1];
-        __pyx_t_19.data += __pyx_tmp_idx * __pyx_tmp_stride;
-}
+    __pyx_t_18 = ((__pyx_v_deriv_num >= __pyx_v_num_indices) != 0);
+    if (__pyx_t_18) {
 
-{
-            double __pyx_temp_scalar = exp((__pyx_f_5scipy_7special_14cython_special_gammaln((__pyx_v_deriv_num + 1), 0) - (0.5 * __pyx_v_bsum)));
-            {
-                Py_ssize_t __pyx_temp_extent_0 = __pyx_t_19.shape[0];
-                Py_ssize_t __pyx_temp_stride_0 = __pyx_t_19.strides[0];
-                char *__pyx_temp_pointer_0;
-                Py_ssize_t __pyx_temp_idx_0;
-                __pyx_temp_pointer_0 = __pyx_t_19.data;
-                for (__pyx_temp_idx_0 = 0; __pyx_temp_idx_0 < __pyx_temp_extent_0; __pyx_temp_idx_0++) {
-                  *((double *) __pyx_temp_pointer_0) = __pyx_temp_scalar;
-                  __pyx_temp_pointer_0 += __pyx_temp_stride_0;
-                }
-            }
-        }
-        __PYX_XDEC_MEMVIEW(&__pyx_t_19, 1);
-        __pyx_t_19.memview = NULL;
-        __pyx_t_19.data = NULL;
-
-        /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":115
- *         pd[:,:] = 0
- *         for jj in range(deriv_num,num_indices):
- *             if (jj == deriv_num):             # <<<<<<<<<<<<<<
- *                 bsum = 0
- *                 for ii in range(jj+1):
+      /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":129
+ *         result_view[:,offset:offset+min(deriv_num,num_indices)] = 0
+ *         if deriv_num >= num_indices:
+ *             continue             # <<<<<<<<<<<<<<
+ *         bsum += log(ab[deriv_num,1]**2)
+ *         # use following expression to avoid overflow issues when
  */
-        goto __pyx_L7;
-      }
+      goto __pyx_L5_continue;
 
-      /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":123
- *                 pd[:,jj] = exp(gammaln(deriv_num+1)-0.5*bsum)
- *             else:
- *                 for ii in range(num_samples):             # <<<<<<<<<<<<<<
- *                     pd[ii,jj]=\
- * 			(x[ii]-ab[jj-1,0])*pd[ii,jj-1]-\
+      /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":128
+ *         offset = deriv_num*num_indices
+ *         result_view[:,offset:offset+min(deriv_num,num_indices)] = 0
+ *         if deriv_num >= num_indices:             # <<<<<<<<<<<<<<
+ *             continue
+ *         bsum += log(ab[deriv_num,1]**2)
  */
-      /*else*/ {
-        __pyx_t_16 = __pyx_v_num_samples;
-        __pyx_t_20 = __pyx_t_16;
-        for (__pyx_t_21 = 0; __pyx_t_21 < __pyx_t_20; __pyx_t_21+=1) {
-          __pyx_v_ii = __pyx_t_21;
-
-          /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":125
- *                 for ii in range(num_samples):
- *                     pd[ii,jj]=\
- * 			(x[ii]-ab[jj-1,0])*pd[ii,jj-1]-\             # <<<<<<<<<<<<<<
- * 			ab[jj-1,1]*pd[ii,jj-2]+deriv_num*p[ii,jj-1]
- *                     pd[ii,jj] *= 1.0/ab[jj,1]
- */
-          __pyx_t_18 = __pyx_v_ii;
-          __pyx_t_17 = (__pyx_v_jj - 1);
-          __pyx_t_22 = 0;
-          __pyx_t_23 = __pyx_v_ii;
-          __pyx_t_24 = (__pyx_v_jj - 1);
-
-          /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":126
- *                     pd[ii,jj]=\
- * 			(x[ii]-ab[jj-1,0])*pd[ii,jj-1]-\
- * 			ab[jj-1,1]*pd[ii,jj-2]+deriv_num*p[ii,jj-1]             # <<<<<<<<<<<<<<
- *                     pd[ii,jj] *= 1.0/ab[jj,1]
- *         # p = pd # does not work
- */
-          __pyx_t_25 = (__pyx_v_jj - 1);
-          __pyx_t_26 = 1;
-          __pyx_t_27 = __pyx_v_ii;
-          __pyx_t_28 = (__pyx_v_jj - 2);
-
-          /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":125
- *                 for ii in range(num_samples):
- *                     pd[ii,jj]=\
- * 			(x[ii]-ab[jj-1,0])*pd[ii,jj-1]-\             # <<<<<<<<<<<<<<
- * 			ab[jj-1,1]*pd[ii,jj-2]+deriv_num*p[ii,jj-1]
- *                     pd[ii,jj] *= 1.0/ab[jj,1]
- */
-          __pyx_t_29 = __pyx_v_ii;
-          __pyx_t_30 = (__pyx_v_jj - 1);
-
-          /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":124
- *             else:
- *                 for ii in range(num_samples):
- *                     pd[ii,jj]=\             # <<<<<<<<<<<<<<
- * 			(x[ii]-ab[jj-1,0])*pd[ii,jj-1]-\
- * 			ab[jj-1,1]*pd[ii,jj-2]+deriv_num*p[ii,jj-1]
- */
-          __pyx_t_31 = __pyx_v_ii;
-          __pyx_t_32 = __pyx_v_jj;
-          *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_pd.data + __pyx_t_31 * __pyx_v_pd.strides[0]) ) + __pyx_t_32 * __pyx_v_pd.strides[1]) )) = (((((*((double *) ( /* dim=0 */ (__pyx_v_x.data + __pyx_t_18 * __pyx_v_x.strides[0]) ))) - (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_ab.data + __pyx_t_17 * __pyx_v_ab.strides[0]) ) + __pyx_t_22 * __pyx_v_ab.strides[1]) )))) * (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_pd.data + __pyx_t_23 * __pyx_v_pd.strides[0]) ) + __pyx_t_24 * __pyx_v_pd.strides[1]) )))) - ((*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_ab.data + __pyx_t_25 * __pyx_v_ab.strides[0]) ) + __pyx_t_26 * __pyx_v_ab.strides[1]) ))) * (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_pd.data + __pyx_t_27 * __pyx_v_pd.strides[0]) ) + __pyx_t_28 * __pyx_v_pd.strides[1]) ))))) + (__pyx_v_deriv_num * (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_p.data + __pyx_t_29 * __pyx_v_p.strides[0]) ) + __pyx_t_30 * __pyx_v_p.strides[1]) )))));
-
-          /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":127
- * 			(x[ii]-ab[jj-1,0])*pd[ii,jj-1]-\
- * 			ab[jj-1,1]*pd[ii,jj-2]+deriv_num*p[ii,jj-1]
- *                     pd[ii,jj] *= 1.0/ab[jj,1]             # <<<<<<<<<<<<<<
- *         # p = pd # does not work
- *         p[:,:] = pd[:,:]
- */
-          __pyx_t_30 = __pyx_v_jj;
-          __pyx_t_29 = 1;
-          __pyx_t_28 = __pyx_v_ii;
-          __pyx_t_27 = __pyx_v_jj;
-          *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_pd.data + __pyx_t_28 * __pyx_v_pd.strides[0]) ) + __pyx_t_27 * __pyx_v_pd.strides[1]) )) *= (1.0 / (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_ab.data + __pyx_t_30 * __pyx_v_ab.strides[0]) ) + __pyx_t_29 * __pyx_v_ab.strides[1]) ))));
-        }
-      }
-      __pyx_L7:;
     }
 
-    /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":129
- *                     pd[ii,jj] *= 1.0/ab[jj,1]
- *         # p = pd # does not work
- *         p[:,:] = pd[:,:]             # <<<<<<<<<<<<<<
- *         result_view[:,deriv_num*num_indices:(deriv_num+1)*num_indices] = p
+    /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":130
+ *         if deriv_num >= num_indices:
+ *             continue
+ *         bsum += log(ab[deriv_num,1]**2)             # <<<<<<<<<<<<<<
+ *         # use following expression to avoid overflow issues when
+ *         # computing oveflow
+ */
+    __pyx_t_11 = __pyx_v_deriv_num;
+    __pyx_t_12 = 1;
+    __pyx_v_bsum = (__pyx_v_bsum + log(pow((*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_ab.data + __pyx_t_11 * __pyx_v_ab.strides[0]) ) + __pyx_t_12 * __pyx_v_ab.strides[1]) ))), 2.0)));
+
+    /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":133
+ *         # use following expression to avoid overflow issues when
+ *         # computing oveflow
+ *         pd_init = exp(gammaln(deriv_num+1)-0.5*bsum)             # <<<<<<<<<<<<<<
+ *         for ii in range(num_samples):
+ *             result_view[ii,offset+deriv_num] = pd_init
+ */
+    __pyx_v_pd_init = exp((__pyx_f_5scipy_7special_14cython_special_gammaln((__pyx_v_deriv_num + 1), 0) - (0.5 * __pyx_v_bsum)));
+
+    /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":134
+ *         # computing oveflow
+ *         pd_init = exp(gammaln(deriv_num+1)-0.5*bsum)
+ *         for ii in range(num_samples):             # <<<<<<<<<<<<<<
+ *             result_view[ii,offset+deriv_num] = pd_init
+ *             for jj in range(deriv_num+1,num_indices):
+ */
+    __pyx_t_16 = __pyx_v_num_samples;
+    __pyx_t_9 = __pyx_t_16;
+    for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+      __pyx_v_ii = __pyx_t_10;
+
+      /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":135
+ *         pd_init = exp(gammaln(deriv_num+1)-0.5*bsum)
+ *         for ii in range(num_samples):
+ *             result_view[ii,offset+deriv_num] = pd_init             # <<<<<<<<<<<<<<
+ *             for jj in range(deriv_num+1,num_indices):
+ *                 result_view[ii,offset+jj]=\
+ */
+      __pyx_t_12 = __pyx_v_ii;
+      __pyx_t_11 = (__pyx_v_offset + __pyx_v_deriv_num);
+      *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_result_view.data + __pyx_t_12 * __pyx_v_result_view.strides[0]) ) + __pyx_t_11 * __pyx_v_result_view.strides[1]) )) = __pyx_v_pd_init;
+
+      /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":136
+ *         for ii in range(num_samples):
+ *             result_view[ii,offset+deriv_num] = pd_init
+ *             for jj in range(deriv_num+1,num_indices):             # <<<<<<<<<<<<<<
+ *                 result_view[ii,offset+jj]=\
+ *                     (x[ii]-ab[jj-1,0])*result_view[ii,offset+jj-1]-\
+ */
+      __pyx_t_19 = __pyx_v_num_indices;
+      __pyx_t_20 = __pyx_t_19;
+      for (__pyx_t_21 = (__pyx_v_deriv_num + 1); __pyx_t_21 < __pyx_t_20; __pyx_t_21+=1) {
+        __pyx_v_jj = __pyx_t_21;
+
+        /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":138
+ *             for jj in range(deriv_num+1,num_indices):
+ *                 result_view[ii,offset+jj]=\
+ *                     (x[ii]-ab[jj-1,0])*result_view[ii,offset+jj-1]-\             # <<<<<<<<<<<<<<
+ *                     ab[jj-1,1]*result_view[ii,offset+jj-2]+\
+ *                     deriv_num*result_view[ii,offset-num_indices+jj-1]
+ */
+        __pyx_t_22 = __pyx_v_ii;
+        __pyx_t_23 = (__pyx_v_jj - 1);
+        __pyx_t_24 = 0;
+        __pyx_t_25 = __pyx_v_ii;
+        __pyx_t_26 = ((__pyx_v_offset + __pyx_v_jj) - 1);
+
+        /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":139
+ *                 result_view[ii,offset+jj]=\
+ *                     (x[ii]-ab[jj-1,0])*result_view[ii,offset+jj-1]-\
+ *                     ab[jj-1,1]*result_view[ii,offset+jj-2]+\             # <<<<<<<<<<<<<<
+ *                     deriv_num*result_view[ii,offset-num_indices+jj-1]
+ *                 result_view[ii,offset+jj] *= inv_b[jj]
+ */
+        __pyx_t_27 = (__pyx_v_jj - 1);
+        __pyx_t_28 = 1;
+        __pyx_t_29 = __pyx_v_ii;
+        __pyx_t_30 = ((__pyx_v_offset + __pyx_v_jj) - 2);
+
+        /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":140
+ *                     (x[ii]-ab[jj-1,0])*result_view[ii,offset+jj-1]-\
+ *                     ab[jj-1,1]*result_view[ii,offset+jj-2]+\
+ *                     deriv_num*result_view[ii,offset-num_indices+jj-1]             # <<<<<<<<<<<<<<
+ *                 result_view[ii,offset+jj] *= inv_b[jj]
  *     return result
  */
-    if (unlikely(__pyx_memoryview_copy_contents(__pyx_v_pd, __pyx_v_p, 2, 2, 0) < 0)) __PYX_ERR(0, 129, __pyx_L1_error)
+        __pyx_t_31 = __pyx_v_ii;
+        __pyx_t_32 = (((__pyx_v_offset - __pyx_v_num_indices) + __pyx_v_jj) - 1);
 
-    /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":130
- *         # p = pd # does not work
- *         p[:,:] = pd[:,:]
- *         result_view[:,deriv_num*num_indices:(deriv_num+1)*num_indices] = p             # <<<<<<<<<<<<<<
+        /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":137
+ *             result_view[ii,offset+deriv_num] = pd_init
+ *             for jj in range(deriv_num+1,num_indices):
+ *                 result_view[ii,offset+jj]=\             # <<<<<<<<<<<<<<
+ *                     (x[ii]-ab[jj-1,0])*result_view[ii,offset+jj-1]-\
+ *                     ab[jj-1,1]*result_view[ii,offset+jj-2]+\
+ */
+        __pyx_t_33 = __pyx_v_ii;
+        __pyx_t_34 = (__pyx_v_offset + __pyx_v_jj);
+        *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_result_view.data + __pyx_t_33 * __pyx_v_result_view.strides[0]) ) + __pyx_t_34 * __pyx_v_result_view.strides[1]) )) = (((((*((double *) ( /* dim=0 */ (__pyx_v_x.data + __pyx_t_22 * __pyx_v_x.strides[0]) ))) - (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_ab.data + __pyx_t_23 * __pyx_v_ab.strides[0]) ) + __pyx_t_24 * __pyx_v_ab.strides[1]) )))) * (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_result_view.data + __pyx_t_25 * __pyx_v_result_view.strides[0]) ) + __pyx_t_26 * __pyx_v_result_view.strides[1]) )))) - ((*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_ab.data + __pyx_t_27 * __pyx_v_ab.strides[0]) ) + __pyx_t_28 * __pyx_v_ab.strides[1]) ))) * (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_result_view.data + __pyx_t_29 * __pyx_v_result_view.strides[0]) ) + __pyx_t_30 * __pyx_v_result_view.strides[1]) ))))) + (__pyx_v_deriv_num * (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_result_view.data + __pyx_t_31 * __pyx_v_result_view.strides[0]) ) + __pyx_t_32 * __pyx_v_result_view.strides[1]) )))));
+
+        /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":141
+ *                     ab[jj-1,1]*result_view[ii,offset+jj-2]+\
+ *                     deriv_num*result_view[ii,offset-num_indices+jj-1]
+ *                 result_view[ii,offset+jj] *= inv_b[jj]             # <<<<<<<<<<<<<<
  *     return result
  * 
  */
-    __pyx_t_33.data = __pyx_v_result_view.data;
-    __pyx_t_33.memview = __pyx_v_result_view.memview;
-    __PYX_INC_MEMVIEW(&__pyx_t_33, 0);
-    __pyx_t_33.shape[0] = __pyx_v_result_view.shape[0];
-__pyx_t_33.strides[0] = __pyx_v_result_view.strides[0];
-    __pyx_t_33.suboffsets[0] = -1;
-
-__pyx_t_10 = -1;
-    if (unlikely(__pyx_memoryview_slice_memviewslice(
-    &__pyx_t_33,
-    __pyx_v_result_view.shape[1], __pyx_v_result_view.strides[1], __pyx_v_result_view.suboffsets[1],
-    1,
-    1,
-    &__pyx_t_10,
-    (__pyx_v_deriv_num * __pyx_v_num_indices),
-    ((__pyx_v_deriv_num + 1) * __pyx_v_num_indices),
-    0,
-    1,
-    1,
-    0,
-    1) < 0))
-{
-    __PYX_ERR(0, 130, __pyx_L1_error)
-}
-
-if (unlikely(__pyx_memoryview_copy_contents(__pyx_v_p, __pyx_t_33, 2, 2, 0) < 0)) __PYX_ERR(0, 130, __pyx_L1_error)
-    __PYX_XDEC_MEMVIEW(&__pyx_t_33, 1);
-    __pyx_t_33.memview = NULL;
-    __pyx_t_33.data = NULL;
+        __pyx_t_32 = __pyx_v_jj;
+        __pyx_t_31 = __pyx_v_ii;
+        __pyx_t_30 = (__pyx_v_offset + __pyx_v_jj);
+        *((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_result_view.data + __pyx_t_31 * __pyx_v_result_view.strides[0]) ) + __pyx_t_30 * __pyx_v_result_view.strides[1]) )) *= (*((double *) ( /* dim=0 */ (__pyx_v_inv_b.data + __pyx_t_32 * __pyx_v_inv_b.strides[0]) )));
+      }
+    }
+    __pyx_L5_continue:;
   }
 
-  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":131
- *         p[:,:] = pd[:,:]
- *         result_view[:,deriv_num*num_indices:(deriv_num+1)*num_indices] = p
+  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":142
+ *                     deriv_num*result_view[ii,offset-num_indices+jj-1]
+ *                 result_view[ii,offset+jj] *= inv_b[jj]
  *     return result             # <<<<<<<<<<<<<<
  * 
  * @cython.cdivision(True)     # Deactivate division by zero checking
@@ -3083,7 +3178,7 @@ if (unlikely(__pyx_memoryview_copy_contents(__pyx_v_p, __pyx_t_33, 2, 2, 0) < 0)
   __pyx_r = __pyx_v_result;
   goto __pyx_L0;
 
-  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":64
+  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":70
  * @cython.boundscheck(False)  # Deactivate bounds checking
  * @cython.wraparound(False)   # Deactivate negative indexing.
  * cpdef evaluate_orthonormal_polynomial_deriv_1d_pyx(double [:] x, int nmax, double [:,:] ab, int deriv_order):             # <<<<<<<<<<<<<<
@@ -3099,15 +3194,15 @@ if (unlikely(__pyx_memoryview_copy_contents(__pyx_v_p, __pyx_t_33, 2, 2, 0) < 0)
   __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
   __PYX_XDEC_MEMVIEW(&__pyx_t_6, 1);
-  __PYX_XDEC_MEMVIEW(&__pyx_t_19, 1);
-  __PYX_XDEC_MEMVIEW(&__pyx_t_33, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_t_8, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_t_17, 1);
   __Pyx_AddTraceback("pyapprox.cython.orthonormal_polynomials_1d.evaluate_orthonormal_polynomial_deriv_1d_pyx", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
   __Pyx_XDECREF(__pyx_v_result);
   __PYX_XDEC_MEMVIEW(&__pyx_v_result_view, 1);
-  __PYX_XDEC_MEMVIEW(&__pyx_v_pd, 1);
   __PYX_XDEC_MEMVIEW(&__pyx_v_p, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_inv_b, 1);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
@@ -3154,23 +3249,23 @@ static PyObject *__pyx_pw_8pyapprox_6cython_26orthonormal_polynomials_1d_3evalua
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_nmax)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("evaluate_orthonormal_polynomial_deriv_1d_pyx", 1, 4, 4, 1); __PYX_ERR(0, 64, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("evaluate_orthonormal_polynomial_deriv_1d_pyx", 1, 4, 4, 1); __PYX_ERR(0, 70, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
         if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_ab)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("evaluate_orthonormal_polynomial_deriv_1d_pyx", 1, 4, 4, 2); __PYX_ERR(0, 64, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("evaluate_orthonormal_polynomial_deriv_1d_pyx", 1, 4, 4, 2); __PYX_ERR(0, 70, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  3:
         if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_deriv_order)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("evaluate_orthonormal_polynomial_deriv_1d_pyx", 1, 4, 4, 3); __PYX_ERR(0, 64, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("evaluate_orthonormal_polynomial_deriv_1d_pyx", 1, 4, 4, 3); __PYX_ERR(0, 70, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "evaluate_orthonormal_polynomial_deriv_1d_pyx") < 0)) __PYX_ERR(0, 64, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "evaluate_orthonormal_polynomial_deriv_1d_pyx") < 0)) __PYX_ERR(0, 70, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 4) {
       goto __pyx_L5_argtuple_error;
@@ -3180,14 +3275,14 @@ static PyObject *__pyx_pw_8pyapprox_6cython_26orthonormal_polynomials_1d_3evalua
       values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
       values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
     }
-    __pyx_v_x = __Pyx_PyObject_to_MemoryviewSlice_ds_double(values[0], PyBUF_WRITABLE); if (unlikely(!__pyx_v_x.memview)) __PYX_ERR(0, 64, __pyx_L3_error)
-    __pyx_v_nmax = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_nmax == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 64, __pyx_L3_error)
-    __pyx_v_ab = __Pyx_PyObject_to_MemoryviewSlice_dsds_double(values[2], PyBUF_WRITABLE); if (unlikely(!__pyx_v_ab.memview)) __PYX_ERR(0, 64, __pyx_L3_error)
-    __pyx_v_deriv_order = __Pyx_PyInt_As_int(values[3]); if (unlikely((__pyx_v_deriv_order == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 64, __pyx_L3_error)
+    __pyx_v_x = __Pyx_PyObject_to_MemoryviewSlice_ds_double(values[0], PyBUF_WRITABLE); if (unlikely(!__pyx_v_x.memview)) __PYX_ERR(0, 70, __pyx_L3_error)
+    __pyx_v_nmax = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_nmax == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 70, __pyx_L3_error)
+    __pyx_v_ab = __Pyx_PyObject_to_MemoryviewSlice_dsds_double(values[2], PyBUF_WRITABLE); if (unlikely(!__pyx_v_ab.memview)) __PYX_ERR(0, 70, __pyx_L3_error)
+    __pyx_v_deriv_order = __Pyx_PyInt_As_int(values[3]); if (unlikely((__pyx_v_deriv_order == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 70, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("evaluate_orthonormal_polynomial_deriv_1d_pyx", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 64, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("evaluate_orthonormal_polynomial_deriv_1d_pyx", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 70, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("pyapprox.cython.orthonormal_polynomials_1d.evaluate_orthonormal_polynomial_deriv_1d_pyx", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -3209,9 +3304,9 @@ static PyObject *__pyx_pf_8pyapprox_6cython_26orthonormal_polynomials_1d_2evalua
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("evaluate_orthonormal_polynomial_deriv_1d_pyx", 0);
   __Pyx_XDECREF(__pyx_r);
-  if (unlikely(!__pyx_v_x.memview)) { __Pyx_RaiseUnboundLocalError("x"); __PYX_ERR(0, 64, __pyx_L1_error) }
-  if (unlikely(!__pyx_v_ab.memview)) { __Pyx_RaiseUnboundLocalError("ab"); __PYX_ERR(0, 64, __pyx_L1_error) }
-  __pyx_t_1 = __pyx_f_8pyapprox_6cython_26orthonormal_polynomials_1d_evaluate_orthonormal_polynomial_deriv_1d_pyx(__pyx_v_x, __pyx_v_nmax, __pyx_v_ab, __pyx_v_deriv_order, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 64, __pyx_L1_error)
+  if (unlikely(!__pyx_v_x.memview)) { __Pyx_RaiseUnboundLocalError("x"); __PYX_ERR(0, 70, __pyx_L1_error) }
+  if (unlikely(!__pyx_v_ab.memview)) { __Pyx_RaiseUnboundLocalError("ab"); __PYX_ERR(0, 70, __pyx_L1_error) }
+  __pyx_t_1 = __pyx_f_8pyapprox_6cython_26orthonormal_polynomials_1d_evaluate_orthonormal_polynomial_deriv_1d_pyx(__pyx_v_x, __pyx_v_nmax, __pyx_v_ab, __pyx_v_deriv_order, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 70, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -3230,7 +3325,7 @@ static PyObject *__pyx_pf_8pyapprox_6cython_26orthonormal_polynomials_1d_2evalua
   return __pyx_r;
 }
 
-/* "pyapprox/cython/orthonormal_polynomials_1d.pyx":136
+/* "pyapprox/cython/orthonormal_polynomials_1d.pyx":147
  * @cython.boundscheck(False)  # Deactivate bounds checking
  * @cython.wraparound(False)   # Deactivate negative indexing.
  * cpdef induced_measure_pyx(double x, int ii, double [:,:] ab, pdf):             # <<<<<<<<<<<<<<
@@ -3261,19 +3356,19 @@ static PyObject *__pyx_f_8pyapprox_6cython_26orthonormal_polynomials_1d_induced_
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("induced_measure_pyx", 0);
 
-  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":137
+  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":148
  * @cython.wraparound(False)   # Deactivate negative indexing.
  * cpdef induced_measure_pyx(double x, int ii, double [:,:] ab, pdf):
  *     cdef double [:] xx = np.atleast_1d(x)             # <<<<<<<<<<<<<<
  *     cdef double [:,:] val = evaluate_orthonormal_polynomial_1d_pyx(xx,ii,ab)
  *     cdef double pdf_val = pdf(xx[0])
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 137, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 148, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_atleast_1d); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 137, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_atleast_1d); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 148, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = PyFloat_FromDouble(__pyx_v_x); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 137, __pyx_L1_error)
+  __pyx_t_2 = PyFloat_FromDouble(__pyx_v_x); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 148, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_t_4 = NULL;
   if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
@@ -3288,31 +3383,31 @@ static PyObject *__pyx_f_8pyapprox_6cython_26orthonormal_polynomials_1d_induced_
   __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_t_2) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_2);
   __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 137, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 148, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_5 = __Pyx_PyObject_to_MemoryviewSlice_ds_double(__pyx_t_1, PyBUF_WRITABLE); if (unlikely(!__pyx_t_5.memview)) __PYX_ERR(0, 137, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_to_MemoryviewSlice_ds_double(__pyx_t_1, PyBUF_WRITABLE); if (unlikely(!__pyx_t_5.memview)) __PYX_ERR(0, 148, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_v_xx = __pyx_t_5;
   __pyx_t_5.memview = NULL;
   __pyx_t_5.data = NULL;
 
-  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":138
+  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":149
  * cpdef induced_measure_pyx(double x, int ii, double [:,:] ab, pdf):
  *     cdef double [:] xx = np.atleast_1d(x)
  *     cdef double [:,:] val = evaluate_orthonormal_polynomial_1d_pyx(xx,ii,ab)             # <<<<<<<<<<<<<<
  *     cdef double pdf_val = pdf(xx[0])
  *     return pdf_val*val[0,ii]*val[0,ii]
  */
-  __pyx_t_1 = __pyx_f_8pyapprox_6cython_26orthonormal_polynomials_1d_evaluate_orthonormal_polynomial_1d_pyx(__pyx_v_xx, __pyx_v_ii, __pyx_v_ab, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 138, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_8pyapprox_6cython_26orthonormal_polynomials_1d_evaluate_orthonormal_polynomial_1d_pyx(__pyx_v_xx, __pyx_v_ii, __pyx_v_ab, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 149, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_6 = __Pyx_PyObject_to_MemoryviewSlice_dsds_double(__pyx_t_1, PyBUF_WRITABLE); if (unlikely(!__pyx_t_6.memview)) __PYX_ERR(0, 138, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_to_MemoryviewSlice_dsds_double(__pyx_t_1, PyBUF_WRITABLE); if (unlikely(!__pyx_t_6.memview)) __PYX_ERR(0, 149, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_v_val = __pyx_t_6;
   __pyx_t_6.memview = NULL;
   __pyx_t_6.data = NULL;
 
-  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":139
+  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":150
  *     cdef double [:] xx = np.atleast_1d(x)
  *     cdef double [:,:] val = evaluate_orthonormal_polynomial_1d_pyx(xx,ii,ab)
  *     cdef double pdf_val = pdf(xx[0])             # <<<<<<<<<<<<<<
@@ -3320,7 +3415,7 @@ static PyObject *__pyx_f_8pyapprox_6cython_26orthonormal_polynomials_1d_induced_
  * 
  */
   __pyx_t_7 = 0;
-  __pyx_t_3 = PyFloat_FromDouble((*((double *) ( /* dim=0 */ (__pyx_v_xx.data + __pyx_t_7 * __pyx_v_xx.strides[0]) )))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 139, __pyx_L1_error)
+  __pyx_t_3 = PyFloat_FromDouble((*((double *) ( /* dim=0 */ (__pyx_v_xx.data + __pyx_t_7 * __pyx_v_xx.strides[0]) )))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 150, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_INCREF(__pyx_v_pdf);
   __pyx_t_2 = __pyx_v_pdf; __pyx_t_4 = NULL;
@@ -3336,14 +3431,14 @@ static PyObject *__pyx_f_8pyapprox_6cython_26orthonormal_polynomials_1d_induced_
   __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_4, __pyx_t_3) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 139, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 150, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_8 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_8 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 139, __pyx_L1_error)
+  __pyx_t_8 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_8 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 150, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_v_pdf_val = __pyx_t_8;
 
-  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":140
+  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":151
  *     cdef double [:,:] val = evaluate_orthonormal_polynomial_1d_pyx(xx,ii,ab)
  *     cdef double pdf_val = pdf(xx[0])
  *     return pdf_val*val[0,ii]*val[0,ii]             # <<<<<<<<<<<<<<
@@ -3355,13 +3450,13 @@ static PyObject *__pyx_f_8pyapprox_6cython_26orthonormal_polynomials_1d_induced_
   __pyx_t_9 = __pyx_v_ii;
   __pyx_t_10 = 0;
   __pyx_t_11 = __pyx_v_ii;
-  __pyx_t_1 = PyFloat_FromDouble(((__pyx_v_pdf_val * (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_val.data + __pyx_t_7 * __pyx_v_val.strides[0]) ) + __pyx_t_9 * __pyx_v_val.strides[1]) )))) * (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_val.data + __pyx_t_10 * __pyx_v_val.strides[0]) ) + __pyx_t_11 * __pyx_v_val.strides[1]) ))))); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 140, __pyx_L1_error)
+  __pyx_t_1 = PyFloat_FromDouble(((__pyx_v_pdf_val * (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_val.data + __pyx_t_7 * __pyx_v_val.strides[0]) ) + __pyx_t_9 * __pyx_v_val.strides[1]) )))) * (*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_val.data + __pyx_t_10 * __pyx_v_val.strides[0]) ) + __pyx_t_11 * __pyx_v_val.strides[1]) ))))); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 151, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":136
+  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":147
  * @cython.boundscheck(False)  # Deactivate bounds checking
  * @cython.wraparound(False)   # Deactivate negative indexing.
  * cpdef induced_measure_pyx(double x, int ii, double [:,:] ab, pdf):             # <<<<<<<<<<<<<<
@@ -3427,23 +3522,23 @@ static PyObject *__pyx_pw_8pyapprox_6cython_26orthonormal_polynomials_1d_5induce
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_ii)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("induced_measure_pyx", 1, 4, 4, 1); __PYX_ERR(0, 136, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("induced_measure_pyx", 1, 4, 4, 1); __PYX_ERR(0, 147, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
         if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_ab)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("induced_measure_pyx", 1, 4, 4, 2); __PYX_ERR(0, 136, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("induced_measure_pyx", 1, 4, 4, 2); __PYX_ERR(0, 147, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  3:
         if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pdf)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("induced_measure_pyx", 1, 4, 4, 3); __PYX_ERR(0, 136, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("induced_measure_pyx", 1, 4, 4, 3); __PYX_ERR(0, 147, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "induced_measure_pyx") < 0)) __PYX_ERR(0, 136, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "induced_measure_pyx") < 0)) __PYX_ERR(0, 147, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 4) {
       goto __pyx_L5_argtuple_error;
@@ -3453,14 +3548,14 @@ static PyObject *__pyx_pw_8pyapprox_6cython_26orthonormal_polynomials_1d_5induce
       values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
       values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
     }
-    __pyx_v_x = __pyx_PyFloat_AsDouble(values[0]); if (unlikely((__pyx_v_x == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 136, __pyx_L3_error)
-    __pyx_v_ii = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_ii == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 136, __pyx_L3_error)
-    __pyx_v_ab = __Pyx_PyObject_to_MemoryviewSlice_dsds_double(values[2], PyBUF_WRITABLE); if (unlikely(!__pyx_v_ab.memview)) __PYX_ERR(0, 136, __pyx_L3_error)
+    __pyx_v_x = __pyx_PyFloat_AsDouble(values[0]); if (unlikely((__pyx_v_x == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 147, __pyx_L3_error)
+    __pyx_v_ii = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_ii == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 147, __pyx_L3_error)
+    __pyx_v_ab = __Pyx_PyObject_to_MemoryviewSlice_dsds_double(values[2], PyBUF_WRITABLE); if (unlikely(!__pyx_v_ab.memview)) __PYX_ERR(0, 147, __pyx_L3_error)
     __pyx_v_pdf = values[3];
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("induced_measure_pyx", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 136, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("induced_measure_pyx", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 147, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("pyapprox.cython.orthonormal_polynomials_1d.induced_measure_pyx", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -3482,8 +3577,8 @@ static PyObject *__pyx_pf_8pyapprox_6cython_26orthonormal_polynomials_1d_4induce
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("induced_measure_pyx", 0);
   __Pyx_XDECREF(__pyx_r);
-  if (unlikely(!__pyx_v_ab.memview)) { __Pyx_RaiseUnboundLocalError("ab"); __PYX_ERR(0, 136, __pyx_L1_error) }
-  __pyx_t_1 = __pyx_f_8pyapprox_6cython_26orthonormal_polynomials_1d_induced_measure_pyx(__pyx_v_x, __pyx_v_ii, __pyx_v_ab, __pyx_v_pdf, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 136, __pyx_L1_error)
+  if (unlikely(!__pyx_v_ab.memview)) { __Pyx_RaiseUnboundLocalError("ab"); __PYX_ERR(0, 147, __pyx_L1_error) }
+  __pyx_t_1 = __pyx_f_8pyapprox_6cython_26orthonormal_polynomials_1d_induced_measure_pyx(__pyx_v_x, __pyx_v_ii, __pyx_v_ab, __pyx_v_pdf, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 147, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -3501,7 +3596,7 @@ static PyObject *__pyx_pf_8pyapprox_6cython_26orthonormal_polynomials_1d_4induce
   return __pyx_r;
 }
 
-/* "pyapprox/cython/orthonormal_polynomials_1d.pyx":146
+/* "pyapprox/cython/orthonormal_polynomials_1d.pyx":157
  * @cython.boundscheck(False)  # Deactivate bounds checking
  * @cython.wraparound(False)   # Deactivate negative indexing.
  * cpdef continuous_induced_measure_cdf_pyx(pdf, double [:,:] ab, int ii, double lb, double tol, double x):             # <<<<<<<<<<<<<<
@@ -3529,41 +3624,41 @@ static PyObject *__pyx_f_8pyapprox_6cython_26orthonormal_polynomials_1d_continuo
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("continuous_induced_measure_cdf_pyx", 0);
 
-  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":148
+  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":159
  * cpdef continuous_induced_measure_cdf_pyx(pdf, double [:,:] ab, int ii, double lb, double tol, double x):
  *     cdef double integral, err
  *     integral,err = integrate.quad(             # <<<<<<<<<<<<<<
  *     	induced_measure_pyx,lb,x,args=(ii,ab,pdf),epsrel=tol,epsabs=tol,
  * 	limit=100)
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_integrate); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 148, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_integrate); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 159, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_quad); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 148, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_quad); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 159, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":149
+  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":160
  *     cdef double integral, err
  *     integral,err = integrate.quad(
  *     	induced_measure_pyx,lb,x,args=(ii,ab,pdf),epsrel=tol,epsabs=tol,             # <<<<<<<<<<<<<<
  * 	limit=100)
  *     return integral
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_induced_measure_pyx); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 149, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_induced_measure_pyx); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 160, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = PyFloat_FromDouble(__pyx_v_lb); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 149, __pyx_L1_error)
+  __pyx_t_3 = PyFloat_FromDouble(__pyx_v_lb); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 160, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = PyFloat_FromDouble(__pyx_v_x); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 149, __pyx_L1_error)
+  __pyx_t_4 = PyFloat_FromDouble(__pyx_v_x); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 160, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
 
-  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":148
+  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":159
  * cpdef continuous_induced_measure_cdf_pyx(pdf, double [:,:] ab, int ii, double lb, double tol, double x):
  *     cdef double integral, err
  *     integral,err = integrate.quad(             # <<<<<<<<<<<<<<
  *     	induced_measure_pyx,lb,x,args=(ii,ab,pdf),epsrel=tol,epsabs=tol,
  * 	limit=100)
  */
-  __pyx_t_5 = PyTuple_New(3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 148, __pyx_L1_error)
+  __pyx_t_5 = PyTuple_New(3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 159, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_GIVEREF(__pyx_t_1);
   PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_1);
@@ -3575,20 +3670,20 @@ static PyObject *__pyx_f_8pyapprox_6cython_26orthonormal_polynomials_1d_continuo
   __pyx_t_3 = 0;
   __pyx_t_4 = 0;
 
-  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":149
+  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":160
  *     cdef double integral, err
  *     integral,err = integrate.quad(
  *     	induced_measure_pyx,lb,x,args=(ii,ab,pdf),epsrel=tol,epsabs=tol,             # <<<<<<<<<<<<<<
  * 	limit=100)
  *     return integral
  */
-  __pyx_t_4 = __Pyx_PyDict_NewPresized(4); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 149, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyDict_NewPresized(4); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 160, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_ii); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 149, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_ii); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 160, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_1 = __pyx_memoryview_fromslice(__pyx_v_ab, 2, (PyObject *(*)(char *)) __pyx_memview_get_double, (int (*)(char *, PyObject *)) __pyx_memview_set_double, 0);; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 149, __pyx_L1_error)
+  __pyx_t_1 = __pyx_memoryview_fromslice(__pyx_v_ab, 2, (PyObject *(*)(char *)) __pyx_memview_get_double, (int (*)(char *, PyObject *)) __pyx_memview_set_double, 0);; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 160, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_6 = PyTuple_New(3); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 149, __pyx_L1_error)
+  __pyx_t_6 = PyTuple_New(3); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 160, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_GIVEREF(__pyx_t_3);
   PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_3);
@@ -3599,26 +3694,26 @@ static PyObject *__pyx_f_8pyapprox_6cython_26orthonormal_polynomials_1d_continuo
   PyTuple_SET_ITEM(__pyx_t_6, 2, __pyx_v_pdf);
   __pyx_t_3 = 0;
   __pyx_t_1 = 0;
-  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_args, __pyx_t_6) < 0) __PYX_ERR(0, 149, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_args, __pyx_t_6) < 0) __PYX_ERR(0, 160, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = PyFloat_FromDouble(__pyx_v_tol); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 149, __pyx_L1_error)
+  __pyx_t_6 = PyFloat_FromDouble(__pyx_v_tol); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 160, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
-  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_epsrel, __pyx_t_6) < 0) __PYX_ERR(0, 149, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_epsrel, __pyx_t_6) < 0) __PYX_ERR(0, 160, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = PyFloat_FromDouble(__pyx_v_tol); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 149, __pyx_L1_error)
+  __pyx_t_6 = PyFloat_FromDouble(__pyx_v_tol); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 160, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
-  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_epsabs, __pyx_t_6) < 0) __PYX_ERR(0, 149, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_epsabs, __pyx_t_6) < 0) __PYX_ERR(0, 160, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_limit, __pyx_int_100) < 0) __PYX_ERR(0, 149, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_limit, __pyx_int_100) < 0) __PYX_ERR(0, 160, __pyx_L1_error)
 
-  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":148
+  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":159
  * cpdef continuous_induced_measure_cdf_pyx(pdf, double [:,:] ab, int ii, double lb, double tol, double x):
  *     cdef double integral, err
  *     integral,err = integrate.quad(             # <<<<<<<<<<<<<<
  *     	induced_measure_pyx,lb,x,args=(ii,ab,pdf),epsrel=tol,epsabs=tol,
  * 	limit=100)
  */
-  __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, __pyx_t_4); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 148, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, __pyx_t_4); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 159, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
@@ -3629,7 +3724,7 @@ static PyObject *__pyx_f_8pyapprox_6cython_26orthonormal_polynomials_1d_continuo
     if (unlikely(size != 2)) {
       if (size > 2) __Pyx_RaiseTooManyValuesError(2);
       else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
-      __PYX_ERR(0, 148, __pyx_L1_error)
+      __PYX_ERR(0, 159, __pyx_L1_error)
     }
     #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
     if (likely(PyTuple_CheckExact(sequence))) {
@@ -3642,15 +3737,15 @@ static PyObject *__pyx_f_8pyapprox_6cython_26orthonormal_polynomials_1d_continuo
     __Pyx_INCREF(__pyx_t_4);
     __Pyx_INCREF(__pyx_t_5);
     #else
-    __pyx_t_4 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 148, __pyx_L1_error)
+    __pyx_t_4 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 159, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_5 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 148, __pyx_L1_error)
+    __pyx_t_5 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 159, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     #endif
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
   } else {
     Py_ssize_t index = -1;
-    __pyx_t_2 = PyObject_GetIter(__pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 148, __pyx_L1_error)
+    __pyx_t_2 = PyObject_GetIter(__pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 159, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
     __pyx_t_7 = Py_TYPE(__pyx_t_2)->tp_iternext;
@@ -3658,7 +3753,7 @@ static PyObject *__pyx_f_8pyapprox_6cython_26orthonormal_polynomials_1d_continuo
     __Pyx_GOTREF(__pyx_t_4);
     index = 1; __pyx_t_5 = __pyx_t_7(__pyx_t_2); if (unlikely(!__pyx_t_5)) goto __pyx_L3_unpacking_failed;
     __Pyx_GOTREF(__pyx_t_5);
-    if (__Pyx_IternextUnpackEndCheck(__pyx_t_7(__pyx_t_2), 2) < 0) __PYX_ERR(0, 148, __pyx_L1_error)
+    if (__Pyx_IternextUnpackEndCheck(__pyx_t_7(__pyx_t_2), 2) < 0) __PYX_ERR(0, 159, __pyx_L1_error)
     __pyx_t_7 = NULL;
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     goto __pyx_L4_unpacking_done;
@@ -3666,17 +3761,17 @@ static PyObject *__pyx_f_8pyapprox_6cython_26orthonormal_polynomials_1d_continuo
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __pyx_t_7 = NULL;
     if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
-    __PYX_ERR(0, 148, __pyx_L1_error)
+    __PYX_ERR(0, 159, __pyx_L1_error)
     __pyx_L4_unpacking_done:;
   }
-  __pyx_t_8 = __pyx_PyFloat_AsDouble(__pyx_t_4); if (unlikely((__pyx_t_8 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 148, __pyx_L1_error)
+  __pyx_t_8 = __pyx_PyFloat_AsDouble(__pyx_t_4); if (unlikely((__pyx_t_8 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 159, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_9 = __pyx_PyFloat_AsDouble(__pyx_t_5); if (unlikely((__pyx_t_9 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 148, __pyx_L1_error)
+  __pyx_t_9 = __pyx_PyFloat_AsDouble(__pyx_t_5); if (unlikely((__pyx_t_9 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 159, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   __pyx_v_integral = __pyx_t_8;
   __pyx_v_err = __pyx_t_9;
 
-  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":151
+  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":162
  *     	induced_measure_pyx,lb,x,args=(ii,ab,pdf),epsrel=tol,epsabs=tol,
  * 	limit=100)
  *     return integral             # <<<<<<<<<<<<<<
@@ -3684,13 +3779,13 @@ static PyObject *__pyx_f_8pyapprox_6cython_26orthonormal_polynomials_1d_continuo
  * cpdef vector_continuous_induced_measure_cdf_pyx(pdf, double [:,:] ab, int ii, double lb, double tol, double [:] x):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_6 = PyFloat_FromDouble(__pyx_v_integral); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 151, __pyx_L1_error)
+  __pyx_t_6 = PyFloat_FromDouble(__pyx_v_integral); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 162, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __pyx_r = __pyx_t_6;
   __pyx_t_6 = 0;
   goto __pyx_L0;
 
-  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":146
+  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":157
  * @cython.boundscheck(False)  # Deactivate bounds checking
  * @cython.wraparound(False)   # Deactivate negative indexing.
  * cpdef continuous_induced_measure_cdf_pyx(pdf, double [:,:] ab, int ii, double lb, double tol, double x):             # <<<<<<<<<<<<<<
@@ -3760,35 +3855,35 @@ static PyObject *__pyx_pw_8pyapprox_6cython_26orthonormal_polynomials_1d_7contin
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_ab)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("continuous_induced_measure_cdf_pyx", 1, 6, 6, 1); __PYX_ERR(0, 146, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("continuous_induced_measure_cdf_pyx", 1, 6, 6, 1); __PYX_ERR(0, 157, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
         if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_ii)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("continuous_induced_measure_cdf_pyx", 1, 6, 6, 2); __PYX_ERR(0, 146, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("continuous_induced_measure_cdf_pyx", 1, 6, 6, 2); __PYX_ERR(0, 157, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  3:
         if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_lb)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("continuous_induced_measure_cdf_pyx", 1, 6, 6, 3); __PYX_ERR(0, 146, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("continuous_induced_measure_cdf_pyx", 1, 6, 6, 3); __PYX_ERR(0, 157, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  4:
         if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_tol)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("continuous_induced_measure_cdf_pyx", 1, 6, 6, 4); __PYX_ERR(0, 146, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("continuous_induced_measure_cdf_pyx", 1, 6, 6, 4); __PYX_ERR(0, 157, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  5:
         if (likely((values[5] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_x)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("continuous_induced_measure_cdf_pyx", 1, 6, 6, 5); __PYX_ERR(0, 146, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("continuous_induced_measure_cdf_pyx", 1, 6, 6, 5); __PYX_ERR(0, 157, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "continuous_induced_measure_cdf_pyx") < 0)) __PYX_ERR(0, 146, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "continuous_induced_measure_cdf_pyx") < 0)) __PYX_ERR(0, 157, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 6) {
       goto __pyx_L5_argtuple_error;
@@ -3801,15 +3896,15 @@ static PyObject *__pyx_pw_8pyapprox_6cython_26orthonormal_polynomials_1d_7contin
       values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
     }
     __pyx_v_pdf = values[0];
-    __pyx_v_ab = __Pyx_PyObject_to_MemoryviewSlice_dsds_double(values[1], PyBUF_WRITABLE); if (unlikely(!__pyx_v_ab.memview)) __PYX_ERR(0, 146, __pyx_L3_error)
-    __pyx_v_ii = __Pyx_PyInt_As_int(values[2]); if (unlikely((__pyx_v_ii == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 146, __pyx_L3_error)
-    __pyx_v_lb = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_lb == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 146, __pyx_L3_error)
-    __pyx_v_tol = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_tol == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 146, __pyx_L3_error)
-    __pyx_v_x = __pyx_PyFloat_AsDouble(values[5]); if (unlikely((__pyx_v_x == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 146, __pyx_L3_error)
+    __pyx_v_ab = __Pyx_PyObject_to_MemoryviewSlice_dsds_double(values[1], PyBUF_WRITABLE); if (unlikely(!__pyx_v_ab.memview)) __PYX_ERR(0, 157, __pyx_L3_error)
+    __pyx_v_ii = __Pyx_PyInt_As_int(values[2]); if (unlikely((__pyx_v_ii == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 157, __pyx_L3_error)
+    __pyx_v_lb = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_lb == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 157, __pyx_L3_error)
+    __pyx_v_tol = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_tol == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 157, __pyx_L3_error)
+    __pyx_v_x = __pyx_PyFloat_AsDouble(values[5]); if (unlikely((__pyx_v_x == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 157, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("continuous_induced_measure_cdf_pyx", 1, 6, 6, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 146, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("continuous_induced_measure_cdf_pyx", 1, 6, 6, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 157, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("pyapprox.cython.orthonormal_polynomials_1d.continuous_induced_measure_cdf_pyx", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -3831,8 +3926,8 @@ static PyObject *__pyx_pf_8pyapprox_6cython_26orthonormal_polynomials_1d_6contin
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("continuous_induced_measure_cdf_pyx", 0);
   __Pyx_XDECREF(__pyx_r);
-  if (unlikely(!__pyx_v_ab.memview)) { __Pyx_RaiseUnboundLocalError("ab"); __PYX_ERR(0, 146, __pyx_L1_error) }
-  __pyx_t_1 = __pyx_f_8pyapprox_6cython_26orthonormal_polynomials_1d_continuous_induced_measure_cdf_pyx(__pyx_v_pdf, __pyx_v_ab, __pyx_v_ii, __pyx_v_lb, __pyx_v_tol, __pyx_v_x, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 146, __pyx_L1_error)
+  if (unlikely(!__pyx_v_ab.memview)) { __Pyx_RaiseUnboundLocalError("ab"); __PYX_ERR(0, 157, __pyx_L1_error) }
+  __pyx_t_1 = __pyx_f_8pyapprox_6cython_26orthonormal_polynomials_1d_continuous_induced_measure_cdf_pyx(__pyx_v_pdf, __pyx_v_ab, __pyx_v_ii, __pyx_v_lb, __pyx_v_tol, __pyx_v_x, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 157, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -3850,7 +3945,7 @@ static PyObject *__pyx_pf_8pyapprox_6cython_26orthonormal_polynomials_1d_6contin
   return __pyx_r;
 }
 
-/* "pyapprox/cython/orthonormal_polynomials_1d.pyx":153
+/* "pyapprox/cython/orthonormal_polynomials_1d.pyx":164
  *     return integral
  * 
  * cpdef vector_continuous_induced_measure_cdf_pyx(pdf, double [:,:] ab, int ii, double lb, double tol, double [:] x):             # <<<<<<<<<<<<<<
@@ -3885,35 +3980,35 @@ static PyObject *__pyx_f_8pyapprox_6cython_26orthonormal_polynomials_1d_vector_c
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("vector_continuous_induced_measure_cdf_pyx", 0);
 
-  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":155
+  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":166
  * cpdef vector_continuous_induced_measure_cdf_pyx(pdf, double [:,:] ab, int ii, double lb, double tol, double [:] x):
  *     cdef int jj
  *     vals = np.zeros((x.shape[0]),dtype=np.double)             # <<<<<<<<<<<<<<
  *     cdef double [:] vals_view = vals
  *     for jj in range(x.shape[0]):
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 155, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 166, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_zeros); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 155, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_zeros); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 166, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyInt_FromSsize_t((__pyx_v_x.shape[0])); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 155, __pyx_L1_error)
+  __pyx_t_1 = PyInt_FromSsize_t((__pyx_v_x.shape[0])); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 166, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 155, __pyx_L1_error)
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 166, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_GIVEREF(__pyx_t_1);
   PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_1);
   __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 155, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 166, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 155, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 166, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_double); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 155, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_double); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 166, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_dtype, __pyx_t_5) < 0) __PYX_ERR(0, 155, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_dtype, __pyx_t_5) < 0) __PYX_ERR(0, 166, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_3, __pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 155, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_3, __pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 166, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -3921,19 +4016,19 @@ static PyObject *__pyx_f_8pyapprox_6cython_26orthonormal_polynomials_1d_vector_c
   __pyx_v_vals = __pyx_t_5;
   __pyx_t_5 = 0;
 
-  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":156
+  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":167
  *     cdef int jj
  *     vals = np.zeros((x.shape[0]),dtype=np.double)
  *     cdef double [:] vals_view = vals             # <<<<<<<<<<<<<<
  *     for jj in range(x.shape[0]):
  *         vals_view[jj]=continuous_induced_measure_cdf_pyx(pdf,ab,ii,lb,tol,x[jj])
  */
-  __pyx_t_6 = __Pyx_PyObject_to_MemoryviewSlice_ds_double(__pyx_v_vals, PyBUF_WRITABLE); if (unlikely(!__pyx_t_6.memview)) __PYX_ERR(0, 156, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_to_MemoryviewSlice_ds_double(__pyx_v_vals, PyBUF_WRITABLE); if (unlikely(!__pyx_t_6.memview)) __PYX_ERR(0, 167, __pyx_L1_error)
   __pyx_v_vals_view = __pyx_t_6;
   __pyx_t_6.memview = NULL;
   __pyx_t_6.data = NULL;
 
-  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":157
+  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":168
  *     vals = np.zeros((x.shape[0]),dtype=np.double)
  *     cdef double [:] vals_view = vals
  *     for jj in range(x.shape[0]):             # <<<<<<<<<<<<<<
@@ -3945,7 +4040,7 @@ static PyObject *__pyx_f_8pyapprox_6cython_26orthonormal_polynomials_1d_vector_c
   for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
     __pyx_v_jj = __pyx_t_9;
 
-    /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":158
+    /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":169
  *     cdef double [:] vals_view = vals
  *     for jj in range(x.shape[0]):
  *         vals_view[jj]=continuous_induced_measure_cdf_pyx(pdf,ab,ii,lb,tol,x[jj])             # <<<<<<<<<<<<<<
@@ -3960,11 +4055,11 @@ static PyObject *__pyx_f_8pyapprox_6cython_26orthonormal_polynomials_1d_vector_c
     } else if (unlikely(__pyx_t_10 >= __pyx_v_x.shape[0])) __pyx_t_11 = 0;
     if (unlikely(__pyx_t_11 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_11);
-      __PYX_ERR(0, 158, __pyx_L1_error)
+      __PYX_ERR(0, 169, __pyx_L1_error)
     }
-    __pyx_t_5 = __pyx_f_8pyapprox_6cython_26orthonormal_polynomials_1d_continuous_induced_measure_cdf_pyx(__pyx_v_pdf, __pyx_v_ab, __pyx_v_ii, __pyx_v_lb, __pyx_v_tol, (*((double *) ( /* dim=0 */ (__pyx_v_x.data + __pyx_t_10 * __pyx_v_x.strides[0]) ))), 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 158, __pyx_L1_error)
+    __pyx_t_5 = __pyx_f_8pyapprox_6cython_26orthonormal_polynomials_1d_continuous_induced_measure_cdf_pyx(__pyx_v_pdf, __pyx_v_ab, __pyx_v_ii, __pyx_v_lb, __pyx_v_tol, (*((double *) ( /* dim=0 */ (__pyx_v_x.data + __pyx_t_10 * __pyx_v_x.strides[0]) ))), 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 169, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_12 = __pyx_PyFloat_AsDouble(__pyx_t_5); if (unlikely((__pyx_t_12 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 158, __pyx_L1_error)
+    __pyx_t_12 = __pyx_PyFloat_AsDouble(__pyx_t_5); if (unlikely((__pyx_t_12 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 169, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     __pyx_t_10 = __pyx_v_jj;
     __pyx_t_11 = -1;
@@ -3974,11 +4069,11 @@ static PyObject *__pyx_f_8pyapprox_6cython_26orthonormal_polynomials_1d_vector_c
     } else if (unlikely(__pyx_t_10 >= __pyx_v_vals_view.shape[0])) __pyx_t_11 = 0;
     if (unlikely(__pyx_t_11 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_11);
-      __PYX_ERR(0, 158, __pyx_L1_error)
+      __PYX_ERR(0, 169, __pyx_L1_error)
     }
     *((double *) ( /* dim=0 */ (__pyx_v_vals_view.data + __pyx_t_10 * __pyx_v_vals_view.strides[0]) )) = __pyx_t_12;
 
-    /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":159
+    /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":170
  *     for jj in range(x.shape[0]):
  *         vals_view[jj]=continuous_induced_measure_cdf_pyx(pdf,ab,ii,lb,tol,x[jj])
  *         if vals_view[jj]>1 and vals_view[jj]-1<tol:             # <<<<<<<<<<<<<<
@@ -3993,7 +4088,7 @@ static PyObject *__pyx_f_8pyapprox_6cython_26orthonormal_polynomials_1d_vector_c
     } else if (unlikely(__pyx_t_14 >= __pyx_v_vals_view.shape[0])) __pyx_t_11 = 0;
     if (unlikely(__pyx_t_11 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_11);
-      __PYX_ERR(0, 159, __pyx_L1_error)
+      __PYX_ERR(0, 170, __pyx_L1_error)
     }
     __pyx_t_15 = (((*((double *) ( /* dim=0 */ (__pyx_v_vals_view.data + __pyx_t_14 * __pyx_v_vals_view.strides[0]) ))) > 1.0) != 0);
     if (__pyx_t_15) {
@@ -4009,14 +4104,14 @@ static PyObject *__pyx_f_8pyapprox_6cython_26orthonormal_polynomials_1d_vector_c
     } else if (unlikely(__pyx_t_14 >= __pyx_v_vals_view.shape[0])) __pyx_t_11 = 0;
     if (unlikely(__pyx_t_11 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_11);
-      __PYX_ERR(0, 159, __pyx_L1_error)
+      __PYX_ERR(0, 170, __pyx_L1_error)
     }
     __pyx_t_15 = ((((*((double *) ( /* dim=0 */ (__pyx_v_vals_view.data + __pyx_t_14 * __pyx_v_vals_view.strides[0]) ))) - 1.0) < __pyx_v_tol) != 0);
     __pyx_t_13 = __pyx_t_15;
     __pyx_L6_bool_binop_done:;
     if (__pyx_t_13) {
 
-      /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":160
+      /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":171
  *         vals_view[jj]=continuous_induced_measure_cdf_pyx(pdf,ab,ii,lb,tol,x[jj])
  *         if vals_view[jj]>1 and vals_view[jj]-1<tol:
  *             vals_view[jj]=1.             # <<<<<<<<<<<<<<
@@ -4031,11 +4126,11 @@ static PyObject *__pyx_f_8pyapprox_6cython_26orthonormal_polynomials_1d_vector_c
       } else if (unlikely(__pyx_t_14 >= __pyx_v_vals_view.shape[0])) __pyx_t_11 = 0;
       if (unlikely(__pyx_t_11 != -1)) {
         __Pyx_RaiseBufferIndexError(__pyx_t_11);
-        __PYX_ERR(0, 160, __pyx_L1_error)
+        __PYX_ERR(0, 171, __pyx_L1_error)
       }
       *((double *) ( /* dim=0 */ (__pyx_v_vals_view.data + __pyx_t_14 * __pyx_v_vals_view.strides[0]) )) = 1.;
 
-      /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":159
+      /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":170
  *     for jj in range(x.shape[0]):
  *         vals_view[jj]=continuous_induced_measure_cdf_pyx(pdf,ab,ii,lb,tol,x[jj])
  *         if vals_view[jj]>1 and vals_view[jj]-1<tol:             # <<<<<<<<<<<<<<
@@ -4045,7 +4140,7 @@ static PyObject *__pyx_f_8pyapprox_6cython_26orthonormal_polynomials_1d_vector_c
     }
   }
 
-  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":161
+  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":172
  *         if vals_view[jj]>1 and vals_view[jj]-1<tol:
  *             vals_view[jj]=1.
  *     return vals             # <<<<<<<<<<<<<<
@@ -4056,7 +4151,7 @@ static PyObject *__pyx_f_8pyapprox_6cython_26orthonormal_polynomials_1d_vector_c
   __pyx_r = __pyx_v_vals;
   goto __pyx_L0;
 
-  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":153
+  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":164
  *     return integral
  * 
  * cpdef vector_continuous_induced_measure_cdf_pyx(pdf, double [:,:] ab, int ii, double lb, double tol, double [:] x):             # <<<<<<<<<<<<<<
@@ -4128,35 +4223,35 @@ static PyObject *__pyx_pw_8pyapprox_6cython_26orthonormal_polynomials_1d_9vector
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_ab)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("vector_continuous_induced_measure_cdf_pyx", 1, 6, 6, 1); __PYX_ERR(0, 153, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("vector_continuous_induced_measure_cdf_pyx", 1, 6, 6, 1); __PYX_ERR(0, 164, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
         if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_ii)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("vector_continuous_induced_measure_cdf_pyx", 1, 6, 6, 2); __PYX_ERR(0, 153, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("vector_continuous_induced_measure_cdf_pyx", 1, 6, 6, 2); __PYX_ERR(0, 164, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  3:
         if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_lb)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("vector_continuous_induced_measure_cdf_pyx", 1, 6, 6, 3); __PYX_ERR(0, 153, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("vector_continuous_induced_measure_cdf_pyx", 1, 6, 6, 3); __PYX_ERR(0, 164, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  4:
         if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_tol)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("vector_continuous_induced_measure_cdf_pyx", 1, 6, 6, 4); __PYX_ERR(0, 153, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("vector_continuous_induced_measure_cdf_pyx", 1, 6, 6, 4); __PYX_ERR(0, 164, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  5:
         if (likely((values[5] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_x)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("vector_continuous_induced_measure_cdf_pyx", 1, 6, 6, 5); __PYX_ERR(0, 153, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("vector_continuous_induced_measure_cdf_pyx", 1, 6, 6, 5); __PYX_ERR(0, 164, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "vector_continuous_induced_measure_cdf_pyx") < 0)) __PYX_ERR(0, 153, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "vector_continuous_induced_measure_cdf_pyx") < 0)) __PYX_ERR(0, 164, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 6) {
       goto __pyx_L5_argtuple_error;
@@ -4169,15 +4264,15 @@ static PyObject *__pyx_pw_8pyapprox_6cython_26orthonormal_polynomials_1d_9vector
       values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
     }
     __pyx_v_pdf = values[0];
-    __pyx_v_ab = __Pyx_PyObject_to_MemoryviewSlice_dsds_double(values[1], PyBUF_WRITABLE); if (unlikely(!__pyx_v_ab.memview)) __PYX_ERR(0, 153, __pyx_L3_error)
-    __pyx_v_ii = __Pyx_PyInt_As_int(values[2]); if (unlikely((__pyx_v_ii == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 153, __pyx_L3_error)
-    __pyx_v_lb = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_lb == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 153, __pyx_L3_error)
-    __pyx_v_tol = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_tol == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 153, __pyx_L3_error)
-    __pyx_v_x = __Pyx_PyObject_to_MemoryviewSlice_ds_double(values[5], PyBUF_WRITABLE); if (unlikely(!__pyx_v_x.memview)) __PYX_ERR(0, 153, __pyx_L3_error)
+    __pyx_v_ab = __Pyx_PyObject_to_MemoryviewSlice_dsds_double(values[1], PyBUF_WRITABLE); if (unlikely(!__pyx_v_ab.memview)) __PYX_ERR(0, 164, __pyx_L3_error)
+    __pyx_v_ii = __Pyx_PyInt_As_int(values[2]); if (unlikely((__pyx_v_ii == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 164, __pyx_L3_error)
+    __pyx_v_lb = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_lb == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 164, __pyx_L3_error)
+    __pyx_v_tol = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_tol == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 164, __pyx_L3_error)
+    __pyx_v_x = __Pyx_PyObject_to_MemoryviewSlice_ds_double(values[5], PyBUF_WRITABLE); if (unlikely(!__pyx_v_x.memview)) __PYX_ERR(0, 164, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("vector_continuous_induced_measure_cdf_pyx", 1, 6, 6, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 153, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("vector_continuous_induced_measure_cdf_pyx", 1, 6, 6, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 164, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("pyapprox.cython.orthonormal_polynomials_1d.vector_continuous_induced_measure_cdf_pyx", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -4199,9 +4294,9 @@ static PyObject *__pyx_pf_8pyapprox_6cython_26orthonormal_polynomials_1d_8vector
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("vector_continuous_induced_measure_cdf_pyx", 0);
   __Pyx_XDECREF(__pyx_r);
-  if (unlikely(!__pyx_v_ab.memview)) { __Pyx_RaiseUnboundLocalError("ab"); __PYX_ERR(0, 153, __pyx_L1_error) }
-  if (unlikely(!__pyx_v_x.memview)) { __Pyx_RaiseUnboundLocalError("x"); __PYX_ERR(0, 153, __pyx_L1_error) }
-  __pyx_t_1 = __pyx_f_8pyapprox_6cython_26orthonormal_polynomials_1d_vector_continuous_induced_measure_cdf_pyx(__pyx_v_pdf, __pyx_v_ab, __pyx_v_ii, __pyx_v_lb, __pyx_v_tol, __pyx_v_x, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 153, __pyx_L1_error)
+  if (unlikely(!__pyx_v_ab.memview)) { __Pyx_RaiseUnboundLocalError("ab"); __PYX_ERR(0, 164, __pyx_L1_error) }
+  if (unlikely(!__pyx_v_x.memview)) { __Pyx_RaiseUnboundLocalError("x"); __PYX_ERR(0, 164, __pyx_L1_error) }
+  __pyx_t_1 = __pyx_f_8pyapprox_6cython_26orthonormal_polynomials_1d_vector_continuous_induced_measure_cdf_pyx(__pyx_v_pdf, __pyx_v_ab, __pyx_v_ii, __pyx_v_lb, __pyx_v_tol, __pyx_v_x, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 164, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -18116,7 +18211,7 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {0, 0, 0, 0, 0, 0, 0}
 };
 static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 51, __pyx_L1_error)
+  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 50, __pyx_L1_error)
   __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(1, 133, __pyx_L1_error)
   __pyx_builtin_MemoryError = __Pyx_GetBuiltinName(__pyx_n_s_MemoryError); if (!__pyx_builtin_MemoryError) __PYX_ERR(1, 148, __pyx_L1_error)
   __pyx_builtin_enumerate = __Pyx_GetBuiltinName(__pyx_n_s_enumerate); if (!__pyx_builtin_enumerate) __PYX_ERR(1, 151, __pyx_L1_error)
@@ -18759,24 +18854,24 @@ if (!__Pyx_RefNanny) {
   if (PyDict_SetItem(__pyx_d, __pyx_n_s_np, __pyx_t_1) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":142
+  /* "pyapprox/cython/orthonormal_polynomials_1d.pyx":153
  *     return pdf_val*val[0,ii]*val[0,ii]
  * 
  * from scipy import integrate             # <<<<<<<<<<<<<<
  * @cython.cdivision(True)     # Deactivate division by zero checking
  * @cython.boundscheck(False)  # Deactivate bounds checking
  */
-  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 142, __pyx_L1_error)
+  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 153, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_INCREF(__pyx_n_s_integrate);
   __Pyx_GIVEREF(__pyx_n_s_integrate);
   PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_integrate);
-  __pyx_t_2 = __Pyx_Import(__pyx_n_s_scipy, __pyx_t_1, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 142, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_Import(__pyx_n_s_scipy, __pyx_t_1, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 153, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_integrate); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 142, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_integrate); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 153, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_integrate, __pyx_t_1) < 0) __PYX_ERR(0, 142, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_integrate, __pyx_t_1) < 0) __PYX_ERR(0, 153, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
@@ -45,15 +45,21 @@ cpdef evaluate_orthonormal_polynomial_1d_pyx(double [:] x, int nmax, double [:,:
     p = np.zeros((x.shape[0],nmax+1),dtype=np.double)
     cdef double [:,:] p_view = p
 
-    p_view[:,0] = 1/ab[0,1]
+    # compute the divisions once instead of once per sample
+    cdef double [:] inv_b = np.empty((nmax+1),dtype=np.double)
+    for jj in range(nmax+1):
+        inv_b[jj] = 1.0/ab[jj,1]
 
-    if nmax > 0:
-        for ii in range(npoints):
-            p_view[ii,1] = 1/ab[1,1] * ( (x[ii] - ab[0,0])*p_view[ii,0] )
+    # p is stored in row major order so run the entire recurrence for
+    # one sample before moving to the next. This accesses p contiguously
+    for ii in range(npoints):
+        p_view[ii,0] = inv_b[0]
 
-    for jj in range(2, nmax+1):
-        for ii in range(npoints):
-            p_view[ii,jj] = 1.0/ab[jj,1]*((x[ii]-ab[jj-1,0])*p_view[ii,jj-1]-ab[jj-1,1]*p_view[ii,jj-2])
+        if nmax > 0:
+            p_view[ii,1] = inv_b[1] * ( (x[ii] - ab[0,0])*p_view[ii,0] )
+
+        for jj in range(2, nmax+1):
+            p_view[ii,jj] = inv_b[jj]*((x[ii]-ab[jj-1,0])*p_view[ii,jj-1]-ab[jj-1,1]*p_view[ii,jj-2])
 
     return p
 
@@ -98,36 +104,41 @@ cpdef evaluate_orthonormal_polynomial_deriv_1d_pyx(double [:] x, int nmax, doubl
        The values of the s-th derivative of the polynomials
     """
 
-    cdef int ii,jj,deriv_num
+    cdef int ii,jj,deriv_num,offset
     cdef int num_samples = x.shape[0]
     cdef int num_indices = nmax+1
     result = np.empty((num_samples,num_indices*(deriv_order+1)))
     cdef double [:,:] result_view = result
-    cdef double [:,:] pd = np.zeros((num_samples,num_indices),dtype=float)
-    cdef double bsum=0
+    cdef double bsum=0, pd_init
 
     cdef double [:,:] p = evaluate_orthonormal_polynomial_1d_pyx(x, nmax, ab)
     result_view[:,:num_indices] = p
 
+    cdef double [:] inv_b = np.empty((num_indices),dtype=np.double)
+    for jj in range(num_indices):
+        inv_b[jj] = 1.0/ab[jj,1]
+
+    # the derivatives are written directly into result and the derivatives
+    # of the previous order are read from result
+    # bsum is the running sum of log(b_j**2) for j<=deriv_num
+    bsum = log(ab[0,1]**2)
     for deriv_num in range(1,deriv_order+1):
-        pd[:,:] = 0
-        for jj in range(deriv_num,num_indices):
-            if (jj == deriv_num):
-                bsum = 0
-                for ii in range(jj+1):
-                    bsum += log(ab[ii,1]**2)
-                # use following expression to avoid overflow issues when
-                # computing oveflow
-                pd[:,jj] = exp(gammaln(deriv_num+1)-0.5*bsum)
-            else:
-                for ii in range(num_samples):
-                    pd[ii,jj]=\
-			(x[ii]-ab[jj-1,0])*pd[ii,jj-1]-\
-			ab[jj-1,1]*pd[ii,jj-2]+deriv_num*p[ii,jj-1]
-                    pd[ii,jj] *= 1.0/ab[jj,1]
-        # p = pd # does not work
-        p[:,:] = pd[:,:]
-        result_view[:,deriv_num*num_indices:(deriv_num+1)*num_indices] = p
+        offset = deriv_num*num_indices
+        result_view[:,offset:offset+min(deriv_num,num_indices)] = 0
+        if deriv_num >= num_indices:
+            continue
+        bsum += log(ab[deriv_num,1]**2)
+        # use following expression to avoid overflow issues when
+        # computing oveflow
+        pd_init = exp(gammaln(deriv_num+1)-0.5*bsum)
+        for ii in range(num_samples):
+            result_view[ii,offset+deriv_num] = pd_init
+            for jj in range(deriv_num+1,num_indices):
+                result_view[ii,offset+jj]=\
+                    (x[ii]-ab[jj-1,0])*result_view[ii,offset+jj-1]-\
+                    ab[jj-1,1]*result_view[ii,offset+jj-2]+\
+                    deriv_num*result_view[ii,offset-num_indices+jj-1]
+                result_view[ii,offset+jj] *= inv_b[jj]
     return result
 
 @cython.cdivision(True)     # Deactivate division by zero checking
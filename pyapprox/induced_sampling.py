@@ -300,7 +300,9 @@ def idist_jacobi(x, n, alph, bet, M=10):
     if x[xreflect].shape[0]>0:
         F[xreflect] = 1 - idist_jacobi(-x[xreflect], n, bet, alph, M)
 
-    recursion_coeffs = jacobi_recurrence(n+1, alph, bet, True)
+    # n may be a one element array. Pass integers to jacobi_recurrence so
+    # its cached coefficients are reused
+    recursion_coeffs = jacobi_recurrence(int(n)+1, alph, bet, True)
     # All functions that accept b assume they are receiving b
     # but recusion_coeffs:,1=np.sqrt(b)
     a = recursion_coeffs[:,0]; b = recursion_coeffs[:,1]**2
@@ -315,6 +317,8 @@ def idist_jacobi(x, n, alph, bet, M=10):
     
         kn_factor = np.exp(-1./n*np.sum(np.log(b)))
         
+    # Recurrence coefficients for quadrature rule
+    quad_recursion_coeffs = jacobi_recurrence(int(2*n+A+M+1), 0, bet, True)
 
     for xq in range(x.shape[0]):
 
@@ -325,11 +329,9 @@ def idist_jacobi(x, n, alph, bet, M=10):
         if xreflect[xq]:
             continue
 
-        # Recurrence coefficients for quadrature rule
-        recursion_coeffs = jacobi_recurrence(2*n+A+M+1, 0, bet, True)
         # All functions that accept b assume they are receiving b
         # but recusion_coeffs:,1=np.sqrt(b)
-        a = recursion_coeffs[:,0:1]; b = recursion_coeffs[:,1:]**2
+        a = quad_recursion_coeffs[:,0:1]; b = quad_recursion_coeffs[:,1:]**2
         assert b[0] == 1 # To make it a probability measure
 
         if n > 0:
@@ -551,7 +553,7 @@ def idistinv_jacobi(u, n, alph, bet):
 
         # Need 2*n + K coefficients, where K is the size of the
         # Markov-Stiltjies binning procedure
-        recursion_coeffs = jacobi_recurrence(2*n + 400, alph, bet)
+        recursion_coeffs = jacobi_recurrence(2*n[0] + 400, alph, bet)
         # All functions that accept b assume they are receiving b
         # but recusion_coeffs:,1=np.sqrt(b)
         a = recursion_coeffs[:,0:1]; b = recursion_coeffs[:,1:]**2
@@ -769,7 +771,7 @@ def demo_multivariate_sampling_jacobi():
     plt.show()
 
 def discrete_inverse_transform_sampling_1d(probability_mesh,probability_masses,
-                                           num_samples):
+                                           num_samples,random_state=None):
     """
     probability_mesh : np.ndarray (num_discrete_masses)
         The locations of non-zero probability mass. 
@@ -777,9 +779,15 @@ def discrete_inverse_transform_sampling_1d(probability_mesh,probability_masses,
 
     probability_masses : np.ndarray (num_discrete_masses)
         The non-zero probability masses at the locations in probability_mesh
+
+    random_state : np.random.RandomState
+        The random number generator. If None the global numpy generator 
+        is used
     """
     assert probability_mesh.shape[0] == probability_masses.shape[0]
-    u_samples = np.random.uniform(0.,1.,(num_samples))
+    if random_state is None:
+        random_state = np.random
+    u_samples = random_state.uniform(0.,1.,(num_samples))
     sample_indices = np.searchsorted(probability_masses,u_samples)
     samples = probability_mesh[sample_indices]
     return samples
@@ -792,7 +800,10 @@ def basis_matrix_generator_1d(pce,nmax,dd,samples):
 
 def discrete_induced_sampling(basis_matrix_generator_1d,basis_indices,
                               probability_mesh_list,
-                              probability_masses_list,num_samples):
+                              probability_masses_list,num_samples,
+                              random_state=None):
+    if random_state is None:
+        random_state = np.random
 
     num_vars = len(probability_masses_list)
     assert len(probability_mesh_list)==num_vars
@@ -813,7 +824,7 @@ def discrete_induced_sampling(basis_matrix_generator_1d,basis_indices,
 
     
     # Selects random samples on 0, 1, 2, ..., num_indices-1
-    mixture_indices = np.random.randint(0,num_basis_indices,(num_samples))
+    mixture_indices = random_state.randint(0,num_basis_indices,(num_samples))
     unique_mixture_indices, mixture_indices_counts = np.unique(
         mixture_indices,return_counts=True)
 
@@ -825,10 +836,10 @@ def discrete_induced_sampling(basis_matrix_generator_1d,basis_indices,
             samples[dd,idx1:idx2] = discrete_inverse_transform_sampling_1d(
                 probability_mesh_list[dd],
                 basis_cdfs[dd][:,basis_indices[dd,unique_mixture_indices[ii]]],
-                mixture_indices_counts[ii])
+                mixture_indices_counts[ii],random_state)
         idx1 = idx2
     # shuffle so that not all samples from one mixture are next to eachother
-    return samples[:,np.random.permutation(np.arange(num_samples))]
+    return samples[:,random_state.permutation(np.arange(num_samples))]
 
 def basis_matrix_generator_1d_active_vars_wrapper(
         basis_matrix_generator,active_vars,dd,samples):
@@ -899,6 +910,119 @@ def continuous_induced_measure_cdf(pdf,ab,ii,lb,ub,tol,x):
             vals[jj]=1.
     return vals
 
+def chebyshev_induced_measure_cdf(pdf,ab,ii,lb,ub,tol,max_degree=512):
+    """
+    Approximate the CDF of the induced measure of a bounded variable with 
+    a Chebyshev series.
+
+    The induced density :math:`p_{ii}^2(x)\\rho(x)` is interpolated at the
+    Chebyshev points of the first kind, which do not include the end points 
+    of the domain where the density may be singular, and the interpolant 
+    is integrated exactly. The degree of the interpolant is doubled until 
+    the trailing Chebyshev coefficients are negligible.
+
+    Parameters
+    ----------
+    pdf : callable
+        The probability density function of the variable on [lb,ub]
+
+    ab : np.ndarray (num_recursion_coeffs,2)
+        The recursion coefficients of the orthonormal polynomials
+
+    ii : integer
+        The degree of the polynomial defining the induced measure
+
+    lb : float
+        The lower bound of the variable
+
+    ub : float
+        The upper bound of the variable
+
+    tol : float
+        The relative size of the trailing Chebyshev coefficients needed to 
+        accept the interpolant
+
+    max_degree : integer
+        The maximum degree of the interpolant
+
+    Returns
+    -------
+    cdf : np.polynomial.Chebyshev
+        The approximation of the CDF on [lb,ub]. None is returned if the 
+        induced density could not be resolved with a polynomial of degree 
+        max_degree.
+    """
+    def induced_density(x):
+        return evaluate_orthonormal_polynomial_1d(
+            x,ii,ab)[:,-1]**2*pdf(x)
+    
+    degree = max(2*ii+16,32)
+    while degree<=max_degree:
+        density = np.polynomial.Chebyshev.interpolate(
+            induced_density,degree,domain=[lb,ub])
+        if np.all(np.isfinite(density.coef)) and (
+                np.absolute(density.coef[-3:]).max()<=
+                tol*np.absolute(density.coef).max()):
+            cdf = density.integ(lbnd=lb)
+            return cdf/cdf(ub)
+        degree *= 2
+    return None
+
+def invert_monotone_chebyshev_series(cdf,bounds,u_samples,tol,maxiters=100):
+    """
+    Invert a monotonically increasing Chebyshev series using Newton's method
+    safeguarded by bisection.
+
+    Parameters
+    ----------
+    cdf : np.polynomial.Chebyshev
+        A monotone increasing Chebyshev series
+
+    bounds : iterable
+        The lower and upper bounds of the interval containing the roots
+
+    u_samples : np.ndarray (num_samples)
+        The values of the series at the roots
+
+    tol : float
+        The tolerance on the size of the Newton steps
+
+    maxiters : integer
+        The maximum number of iterations
+
+    Returns
+    -------
+    samples : np.ndarray (num_samples)
+        The roots cdf(samples)=u_samples
+    """
+    lb,ub = bounds
+    pdf = cdf.deriv()
+    u_samples = np.atleast_1d(u_samples)
+    # Use linear interpolation of the series on a grid as initial guess
+    xx = np.linspace(lb,ub,max(cdf.degree()+1,101))
+    cdf_vals = np.maximum.accumulate(cdf(xx))
+    samples = np.interp(u_samples,cdf_vals,xx)
+    lower = np.full(u_samples.shape,lb,dtype=float)
+    upper = np.full(u_samples.shape,ub,dtype=float)
+    active = np.arange(u_samples.shape[0])
+    for it in range(maxiters):
+        x = samples[active]
+        residual = cdf(x)-u_samples[active]
+        # the root is bracketed by [lower,upper]
+        I = residual<0
+        lower[active[I]] = x[I]
+        upper[active[~I]] = x[~I]
+        with np.errstate(divide='ignore',invalid='ignore'):
+            x_new = x-residual/pdf(x)
+        # take bisection steps when Newton steps leave the bracket
+        J = ~((x_new>lower[active])&(x_new<upper[active]))
+        x_new[J] = (lower[active[J]]+upper[active[J]])/2
+        samples[active] = x_new
+        active = active[np.absolute(x_new-x)>tol]
+        if active.shape[0]==0:
+            break
+    return samples
+
 from pyapprox.random_variable_algebra import invert_monotone_function
 from pyapprox.variables import get_distribution_info
 def continuous_induced_measure_ppf(var,ab,ii,u_samples,
@@ -920,6 +1044,12 @@ def continuous_induced_measure_ppf(var,ab,ii,u_samples,
         #print('x',x,(x-loc)/scale,vals)
         return  vals
     #pdf = var.pdf
+    if np.isfinite(lb) and np.isfinite(ub):
+        cdf = chebyshev_induced_measure_cdf(pdf,ab,ii,lb,ub,quad_tol)
+        if cdf is not None:
+            return invert_monotone_chebyshev_series(
+                cdf,[lb,ub],u_samples,opt_tol)
+    # fall back to bisection on the CDF computed with adaptive quadrature
     #func = partial(continuous_induced_measure_cdf,pdf,ab,ii,lb,ub,quad_tol)
     from pyapprox.cython.orthonormal_polynomials_1d import\
         continuous_induced_measure_cdf_pyx
@@ -945,51 +1075,73 @@ def inverse_transform_sampling_1d(var,ab,ii,u_samples):
         raise Exception(msg)
     return samples
 
-def generate_induced_samples(pce,num_samples):
+def generate_induced_samples(pce,num_samples,random_state=None):
+    """
+    Generate samples from the induced measure of a polynomial chaos 
+    expansion by sampling from the mixture of the induced measures of each 
+    basis function.
+
+    Parameters
+    ----------
+    pce : PolynomialChaosExpansion
+        The polynomial chaos expansion defining the induced measure
+
+    num_samples : integer
+        The number of samples to generate
+
+    random_state : np.random.RandomState
+        The random number generator. If None the global numpy generator 
+        is used
+
+    Returns
+    -------
+    samples : np.ndarray (num_vars,num_samples)
+        Samples in the canonical domain of the polynomial
+    """
+    if random_state is None:
+        random_state = np.random
     num_vars,num_basis_indices = pce.indices.shape
     
     # Selects random samples on 0, 1, 2, ..., num_indices-1
-    mixture_indices = np.random.randint(0,num_basis_indices,(num_samples))
-    unique_mixture_indices, mixture_indices_counts = np.unique(
-        mixture_indices,return_counts=True)
+    mixture_indices = random_state.randint(0,num_basis_indices,(num_samples))
     
-    idx1 = 0
+    # The mixture components sharing the degree of a variable share its
+    # univariate induced measure, so invert that measure once per degree 
+    # for all the samples of those components. The samples are already in
+    # random order because the mixture indices are.
     samples = np.empty((num_vars,num_samples))
-    for ii in range(unique_mixture_indices.shape[0]):
-        idx2 = idx1 + mixture_indices_counts[ii]
-        for jj in range(pce.var_trans.variable.nunique_vars):
-            var = pce.var_trans.variable.unique_variables[jj]
-            for dd in pce.var_trans.variable.unique_variable_indices[jj]:
-                kk = pce.indices[dd,unique_mixture_indices[ii]]
-                u_samples = np.random.uniform(
-                    0.,1.,(mixture_indices_counts[ii]))
-                samples[dd,idx1:idx2] = inverse_transform_sampling_1d(
+    for jj in range(pce.var_trans.variable.nunique_vars):
+        var = pce.var_trans.variable.unique_variables[jj]
+        for dd in pce.var_trans.variable.unique_variable_indices[jj]:
+            degrees = pce.indices[dd,mixture_indices]
+            u_samples = random_state.uniform(0.,1.,(num_samples))
+            for kk in np.unique(degrees):
+                I = np.where(degrees==kk)[0]
+                samples[dd,I] = inverse_transform_sampling_1d(
                     var,pce.recursion_coeffs[pce.basis_type_index_map[dd]],
-                    kk,u_samples)
-        idx1 = idx2
-    # shuffle so that not all samples from one mixture are next to eachother
-    return samples[:,np.random.permutation(np.arange(num_samples))]
+                    kk,u_samples[I])
+    return samples
 
 def generate_induced_samples_migliorati(pce,num_samples_per_index):
     num_vars,num_indices = pce.indices.shape
 
-    idx1 = 0
-    samples = np.empty((num_vars,num_indices*num_samples_per_index))
-    for ii in range(num_indices):
-        idx2 = idx1 + num_samples_per_index
-        for jj in range(pce.var_trans.variable.nunique_vars):
-            var = pce.var_trans.variable.unique_variables[jj]
-            for dd in pce.var_trans.variable.unique_variable_indices[jj]:
-                kk = pce.indices[dd,ii]
-                u_samples = np.random.uniform(0.,1.,(num_samples_per_index))
+    num_samples = num_indices*num_samples_per_index
+    samples = np.empty((num_vars,num_samples))
+    for jj in range(pce.var_trans.variable.nunique_vars):
+        var = pce.var_trans.variable.unique_variables[jj]
+        for dd in pce.var_trans.variable.unique_variable_indices[jj]:
+            # invert the univariate induced measure once per degree
+            degrees = np.repeat(pce.indices[dd],num_samples_per_index)
+            u_samples = np.random.uniform(0.,1.,(num_samples))
+            for kk in np.unique(degrees):
+                I = np.where(degrees==kk)[0]
                 if kk>0:
-                    samples[dd,idx1:idx2] = inverse_transform_sampling_1d(
+                    samples[dd,I] = inverse_transform_sampling_1d(
                         var,pce.recursion_coeffs[pce.basis_type_index_map[dd]],
-                        kk,u_samples)
+                        kk,u_samples[I])
                 else:
-                    samples[dd,idx1:idx2]=var.rvs(size=(1,num_samples_per_index))
+                    samples[dd,I]=var.rvs(size=I.shape[0])
                     
-        idx1=idx2
     # shuffle so that not all samples from one mixture are next to eachother
     return samples[:,np.random.permutation(np.arange(samples.shape[1]))]
 
@@ -1068,10 +1220,16 @@ def random_induced_measure_sampling(num_samples,num_vars,
                                     probability_density,
                                     proposal_density, 
                                     generate_proposal_samples,
-                                    envelope_factor):
+                                    envelope_factor,random_state=None):
     """
     Draw independent samples from the induced measure.
 
+    Parameters
+    ----------
+    random_state : np.random.RandomState
+        The random number generator used to accept or reject the proposal
+        samples. If None the global numpy generator is used
+
     Returns
     -------
     samples : np.ndarray (num_vars,num_samples)
@@ -1091,7 +1249,8 @@ def random_induced_measure_sampling(num_samples,num_vars,
         
     samples = rejection_sampling(
         target_density, proposal_density, generate_proposal_samples,
-        envelope_factor, num_vars, num_samples, verbose=False)
+        envelope_factor, num_vars, num_samples, verbose=False,
+        random_state=random_state)
 
     return samples
 
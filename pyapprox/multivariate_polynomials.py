@@ -84,7 +84,10 @@ def evaluate_multivariate_orthonormal_polynomial(
     #    basis_vals_1d[dd,:,:basis_vals_1d_dd.shape[1]] = basis_vals_1d_dd
 
     num_samples = samples.shape[1]
-    values = np.zeros(((1+deriv_order*num_vars)*num_samples,num_indices))
+    # the values are computed one column at a time so store them in
+    # column major order. This is also the order used by LAPACK
+    values = np.zeros(((1+deriv_order*num_vars)*num_samples,num_indices),
+                      order='F')
     for ii in range(num_indices):
         index = indices[:,ii]
         values[:num_samples,ii]=basis_vals_1d[0][:,index[0]]
@@ -2,7 +2,91 @@ from __future__ import (absolute_import, division,
                         print_function, unicode_literals)
 import numpy as np
 from scipy import special as sp
-
+import warnings
+from functools import lru_cache, wraps
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # numba is an optional dependency
+    NUMBA_AVAILABLE = False
+
+# resolve the cython extensions once instead of on every call
+# filter out cython warnings.
+warnings.filterwarnings("ignore", message="numpy.ufunc size changed")
+#warnings.filterwarnings("ignore", message="numpy.dtype size changed")
+#warnings.filterwarnings("ignore", message="numpy.ndarray size changed")
+try:
+    from pyapprox.cython.orthonormal_polynomials_1d import \
+        evaluate_orthonormal_polynomial_1d_pyx, \
+        evaluate_orthonormal_polynomial_deriv_1d_pyx
+    CYTHON_AVAILABLE = True
+except ImportError:
+    CYTHON_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def evaluate_monic_polynomial_1d_numba(x,nmax,ab,p):
+        """
+        Evaluate the monic three-term recurrence one sample at a time so
+        no temporary arrays are created. The values are written into p.
+        """
+        for ii in range(x.shape[0]):
+            p[ii,0] = 1/ab[0,1]
+            if nmax > 0:
+                p[ii,1] = (x[ii]-ab[0,0])*p[ii,0]
+            for jj in range(2, nmax+1):
+                p[ii,jj] = (x[ii]-ab[jj-1,0])*p[ii,jj-1]-ab[jj-1,1]*p[ii,jj-2]
+
+    @njit(cache=True)
+    def evaluate_three_term_recurrence_polynomial_1d_numba(abc,nmax,x,p):
+        """
+        Evaluate the three-term recurrence one sample at a time so
+        no temporary arrays are created. The values are written into p.
+        """
+        for ii in range(x.shape[0]):
+            p[ii,0] = abc[0,0]
+            if nmax > 0:
+                p[ii,1] = (abc[1,0]*x[ii] - abc[1,1])*p[ii,0]
+            for jj in range(2, nmax+1):
+                p[ii,jj] = (abc[jj,0]*x[ii]-abc[jj,1])*p[ii,jj-1]-\
+                    abc[jj,2]*p[ii,jj-2]
+
+    @njit(cache=True)
+    def convert_orthonormal_polynomials_to_monomials_1d_numba(
+            ab,nmax,inv_b,monomial_coefs):
+        """
+        Compute the monomial coefficients of the orthonormal polynomials
+        of degree 2,...,nmax from those of degree 0 and 1 already stored in
+        monomial_coefs. Each coefficient is computed in a single pass.
+        """
+        for jj in range(2,nmax+1):
+            for kk in range(jj+1):
+                val = 0.
+                if kk < jj:
+                    val = (-ab[jj-1,0]*monomial_coefs[jj-1,kk]
+                           -ab[jj-1,1]*monomial_coefs[jj-2,kk])*inv_b[jj]
+                if kk > 0:
+                    val += monomial_coefs[jj-1,kk-1]*inv_b[jj]
+                monomial_coefs[jj,kk] = val
+
+def cache_recursion_coefficients(recurrence):
+    """
+    Memoize a function that computes recursion coefficients from hashable
+    parameters. Each call returns a copy of the cached coefficients so 
+    callers can modify them.
+    """
+    cached_recurrence = lru_cache(maxsize=64)(recurrence)
+    @wraps(recurrence)
+    def copy_cached_recurrence(*args,**kwargs):
+        try:
+            return cached_recurrence(*args,**kwargs).copy()
+        except TypeError:
+            # parameters such as np.ndarray cannot be hashed
+            return recurrence(*args,**kwargs)
+    return copy_cached_recurrence
+
+@cache_recursion_coefficients
 def charlier_recurrence(N, a):
     r"""
     Compute the recursion coefficients of the polynomials which are 
@@ -32,18 +116,16 @@ def charlier_recurrence(N, a):
     if N < 1:
         return np.ones((0,2))
 
-    ab = np.zeros((N+1,2))
-    ab[0,0] = a
-    ab[0,1] = 1
-    for i in range(1,N+1):
-        ab[i,0] = a + i
-        ab[i,1] = a * i
-
+    ab = np.empty((N+1,2))
+    ab[0] = a, 1
+    idx = np.arange(1., N+1)
+    ab[1:,0] = a + idx
     # orthonormal
-    ab[:,1] = np.sqrt(ab[:,1])
+    ab[1:,1] = np.sqrt(a*idx)
 
     return ab
 
+@cache_recursion_coefficients
 def discrete_chebyshev_recurrence(N, Ntrials):
     r"""
     Compute the recursion coefficients of the polynomials which are 
@@ -72,18 +154,15 @@ def discrete_chebyshev_recurrence(N, Ntrials):
     if N < 1:
         return np.ones((0,2))
 
-    ab = np.zeros((N,2))
+    ab = np.empty((N,2))
     ab[:,0] = 0.5 * Ntrials * (1. - 1./Ntrials)
-    ab[0,1] = Ntrials
-    for i in range(1,N):
-        ab[i,1] = 0.25 * Ntrials**2 * (1-(i * 1./Ntrials)**2)/(4-1./i**2)
-
-    ab[:,1] = np.sqrt(ab[:,1])
-
+    i = np.arange(1., N)
+    ab[1:,1] = np.sqrt(0.25 * Ntrials**2 * (1-(i/Ntrials)**2)/(4-1./i**2))
     ab[0,1] = 1.0
 
     return ab
 
+@cache_recursion_coefficients
 def hahn_recurrence(Nterms, N, alphaPoly, betaPoly):
     r"""
     Compute the recursion coefficients of the polynomials which are 
@@ -123,28 +202,22 @@ def hahn_recurrence(Nterms, N, alphaPoly, betaPoly):
     if Nterms < 1:
         return np.ones((0,2))
 
-    An = np.zeros(Nterms)
-    Cn = np.zeros(Nterms)
-    for n in range(Nterms):
-        numA = (alphaPoly+n+1) * (N-n) * (n+alphaPoly+betaPoly+1)
-        numC = n * (betaPoly+n) * (N+alphaPoly+betaPoly+n+1)
-        denA = (alphaPoly+betaPoly+2*n+1) * (alphaPoly+betaPoly+2*n+2)
-        denC = (alphaPoly+betaPoly+2*n+1) * (alphaPoly+betaPoly+2*n  )
-        An[n] = numA / denA
-        Cn[n] = numC / denC
-
-    if Nterms==1:
-        return np.array([[An[0]+Cn[0],1]])
-
-    ab = np.array(
-        [[An[0]+Cn[0],1]]+[[An[n]+Cn[n],An[n-1]*Cn[n]] for n in range(1,Nterms)])
-
-    ab[:,1] = np.sqrt(ab[:,1])
+    n = np.arange(Nterms, dtype=float)
+    s = alphaPoly+betaPoly
+    An = (alphaPoly+n+1) * (N-n) * (n+s+1) / ((s+2*n+1) * (s+2*n+2))
+    # numC is zero when n=0 but denC can also be zero
+    with np.errstate(divide='ignore', invalid='ignore'):
+        Cn = n * (betaPoly+n) * (N+s+n+1) / ((s+2*n+1) * (s+2*n))
+    Cn[0] = 0.
 
+    ab = np.empty((Nterms,2))
+    ab[:,0] = An+Cn
     ab[0,1] = 1.0
+    ab[1:,1] = np.sqrt(An[:-1]*Cn[1:])
 
     return ab
 
+@cache_recursion_coefficients
 def krawtchouk_recurrence(Nterms, Ntrials, p):
     """
     Compute the recursion coefficients of the polynomials which are 
@@ -177,11 +250,10 @@ def krawtchouk_recurrence(Nterms, Ntrials, p):
     if Nterms < 1:
         return np.ones((0,2))
 
-    ab = np.array(
-        [[p*(Ntrials-n)+n*(1-p), p*(1-p)*n*(Ntrials-n+1)]
-         for n in range(Nterms)])
-
-    ab[:,1] = np.sqrt(ab[:,1])
+    n = np.arange(Nterms, dtype=float)
+    ab = np.empty((Nterms,2))
+    ab[:,0] = p*(Ntrials-n)+n*(1-p)
+    ab[:,1] = np.sqrt(p*(1-p)*n*(Ntrials-n+1))
 
     ab[0,1] = 1.0
 
@@ -191,6 +263,7 @@ def krawtchouk_recurrence(Nterms, Ntrials, p):
 
     return ab
 
+@cache_recursion_coefficients
 def jacobi_recurrence(N, alpha=0., beta=0., probability=False):
     r"""
     Compute the recursion coefficients of Jacobi polynomials which are 
@@ -218,24 +291,25 @@ def jacobi_recurrence(N, alpha=0., beta=0., probability=False):
     if N < 1:
         return np.ones((0,2))
 
-    ab = np.ones((N,2)) * np.array([beta**2.- alpha**2., 1.])
+    ab = np.empty((N,2))
 
     # Special cases
     ab[0,0] = (beta - alpha) / (alpha + beta + 2.)
+    # 2**(alpha+beta+1)*B(alpha+1,beta+1)
     ab[0,1] = np.exp( (alpha + beta + 1.) * np.log(2.) +
-                      sp.gammaln(alpha + 1.) + sp.gammaln(beta + 1.) -
-                      sp.gammaln(alpha + beta + 2.)
-                    )
+                      sp.betaln(alpha + 1., beta + 1.) )
 
     if N > 1:
-        ab[1,0] /= (2. + alpha + beta) * (4. + alpha + beta)
+        ab[1,0] = (beta**2.- alpha**2.) / (
+            (2. + alpha + beta) * (4. + alpha + beta))
         ab[1,1] = 4. * (alpha + 1.) * (beta + 1.) / (
                    (alpha + beta + 2.)**2 * (alpha + beta + 3.) )
 
     inds = np.arange(2.,N)
-    ab[2:,0] /= (2. * inds + alpha + beta) * (2 * inds + alpha + beta + 2.)
+    s = 2. * inds + alpha + beta
+    ab[2:,0] = (beta**2.- alpha**2.) / (s * (s + 2.))
     ab[2:,1] = 4 * inds * (inds + alpha) * (inds + beta) * (inds + alpha + beta)
-    ab[2:,1] /= (2. * inds + alpha + beta)**2 * (2. * inds + alpha + beta + 1.) * (2. * inds + alpha + beta - 1)
+    ab[2:,1] /= s**2 * (s + 1.) * (s - 1)
 
     ab[:,1] = np.sqrt(ab[:,1])
 
@@ -244,6 +318,7 @@ def jacobi_recurrence(N, alpha=0., beta=0., probability=False):
 
     return ab
 
+@cache_recursion_coefficients
 def hermite_recurrence(Nterms, rho=0., probability=False):
     r""" 
     Compute the recursion coefficients of for the Hermite
@@ -272,14 +347,12 @@ def hermite_recurrence(Nterms, rho=0., probability=False):
 
 
     if rho==0 and probability:
-        ab[1:,1] = np.arange(1., Nterms)
+        ab[1:,1] = np.sqrt(np.arange(1., Nterms))
     else:
         ab[1:,1] = 0.5*np.arange(1., Nterms)
-
-        
-    ab[np.arange(Nterms) % 2 == 1,1] += rho
-
-    ab[:,1] = np.sqrt(ab[:,1])
+        if rho != 0:
+            ab[1::2,1] += rho
+        ab[:,1] = np.sqrt(ab[:,1])
 
     if probability:
         ab[0,1] = 1.
@@ -308,19 +381,31 @@ def evaluate_monic_polynomial_1d(x,nmax,ab):
     p : np.ndarray (num_samples, nmax+1)
        The values of the polynomials
     """
-    p = np.zeros((x.shape[0],nmax+1),dtype=float)
+    if NUMBA_AVAILABLE:
+        p = np.empty((x.shape[0],nmax+1),dtype=float)
+        evaluate_monic_polynomial_1d_numba(
+            np.asarray(x,dtype=float),nmax,ab,p)
+        return p
+
+    # store the polynomials of each degree contiguously so that each step
+    # of the recurrence does not use strided memory access
+    p = np.zeros((nmax+1,x.shape[0]),dtype=float)
 
-    p[:,0] = 1/ab[0,1]
+    p[0] = 1/ab[0,1]
 
     if nmax > 0:
-        p[:,1] =(x - ab[0,0])*p[:,0]
+        p[1] =(x - ab[0,0])*p[0]
 
     for jj in range(2, nmax+1):
-        p[:,jj] = (x-ab[jj-1,0])*p[:,jj-1]-ab[jj-1,1]*p[:,jj-2]
+        p[jj] = (x-ab[jj-1,0])*p[jj-1]-ab[jj-1,1]*p[jj-2]
 
-    return p
+    # return the same C ordered layout as the numba implementation
+    return np.ascontiguousarray(p.T)
     
 
+# the number of samples processed at a time by the numpy implementation of
+# evaluate_orthonormal_polynomial_1d
+ORTHONORMAL_POLYNOMIAL_BLOCK_SIZE = 16384
 def evaluate_orthonormal_polynomial_1d(x, nmax, ab):
     r""" 
     Evaluate univariate orthonormal polynomials using their
@@ -357,29 +442,36 @@ def evaluate_orthonormal_polynomial_1d(x, nmax, ab):
     assert ab.shape[1]==2
     assert nmax < ab.shape[0]
 
-    try:
-        # necessary when discrete variables are define on integers
-        x = np.asarray(x,dtype=float)
-        from pyapprox.cython.orthonormal_polynomials_1d import \
-            evaluate_orthonormal_polynomial_1d_pyx
-        return evaluate_orthonormal_polynomial_1d_pyx(x, nmax, ab)
-        # from pyapprox.weave import c_evaluate_orthonormal_polynomial
-        # return c_evaluate_orthonormal_polynomial_1d(x, nmax, ab)
-    except Exception as e:
-        print ('evaluate_orthornormal_polynomial_1d extension failed')
+    # necessary when discrete variables are define on integers
+    x = np.asarray(x,dtype=float)
+    if CYTHON_AVAILABLE:
+        try:
+            return evaluate_orthonormal_polynomial_1d_pyx(x, nmax, ab)
+            # from pyapprox.weave import c_evaluate_orthonormal_polynomial
+            # return c_evaluate_orthonormal_polynomial_1d(x, nmax, ab)
+        except Exception as e:
+            print ('evaluate_orthornormal_polynomial_1d extension failed')
 
-    p = np.zeros((x.shape[0],nmax+1),dtype=float)
+    # store the polynomials of each degree contiguously so that each step
+    # of the recurrence does not use strided memory access
+    p = np.zeros((nmax+1,x.shape[0]),dtype=float)
+    a = ab[:,0]; b = ab[:,1]; inv_b = 1.0/b[:nmax+1]
 
-    p[:,0] = 1/ab[0,1]
+    p[0] = inv_b[0]
 
-    if nmax > 0:
-        p[:,1] = 1/ab[1,1] * ( (x - ab[0,0])*p[:,0] )
+    # run the entire recurrence on blocks of samples so the rows being
+    # updated and the temporaries stay in cache
+    for lb in range(0, x.shape[0], ORTHONORMAL_POLYNOMIAL_BLOCK_SIZE):
+        ub = lb+ORTHONORMAL_POLYNOMIAL_BLOCK_SIZE
+        xb = x[lb:ub]; pb = p[:,lb:ub]
+        if nmax > 0:
+            pb[1] = inv_b[1] * ( (xb - a[0])*pb[0] )
 
-    for jj in range(2, nmax+1):
-        #p[:,jj] = ((x-ab[jj-1,0])*p[:,jj-1]-ab[jj-1,1]*p[:,jj-2])
-        p[:,jj] = 1.0/ab[jj,1]*((x-ab[jj-1,0])*p[:,jj-1]-ab[jj-1,1]*p[:,jj-2])
+        for jj in range(2, nmax+1):
+            pb[jj] = inv_b[jj]*((xb-a[jj-1])*pb[jj-1]-b[jj-1]*pb[jj-2])
 
-    return p
+    # return the same C ordered layout as the cython implementation
+    return np.ascontiguousarray(p.T)
 
 
 def evaluate_orthonormal_polynomial_deriv_1d(x, nmax, ab, deriv_order):
@@ -419,48 +511,44 @@ def evaluate_orthonormal_polynomial_deriv_1d(x, nmax, ab, deriv_order):
        The values of the s-th derivative of the polynomials
     """
 
-    # filter out cython warnings.
-    import warnings
-    warnings.filterwarnings("ignore", message="numpy.ufunc size changed")
-    #warnings.filterwarnings("ignore", message="numpy.dtype size changed")
-    #warnings.filterwarnings("ignore", message="numpy.ndarray size changed")
-
-    try:
-        # necessary when discrete variables are define on integers
-        x = np.asarray(x,dtype=float)
-        from pyapprox.cython.orthonormal_polynomials_1d import \
-            evaluate_orthonormal_polynomial_deriv_1d_pyx
-        return evaluate_orthonormal_polynomial_deriv_1d_pyx(
-            x, nmax, ab, deriv_order)
-    except:
-        print ('evaluate_orthonormal_polynomial_deriv_1d_pyx extension failed')
+    # necessary when discrete variables are define on integers
+    x = np.asarray(x,dtype=float)
+    if CYTHON_AVAILABLE:
+        try:
+            return evaluate_orthonormal_polynomial_deriv_1d_pyx(
+                x, nmax, ab, deriv_order)
+        except:
+            print ('evaluate_orthonormal_polynomial_deriv_1d_pyx extension failed')
 
     num_samples = x.shape[0]
     num_indices = nmax+1
-    a = ab[:,0]; b = ab[:,1]
+    a = ab[:,0]; b = ab[:,1]; inv_b = 1.0/b[:num_indices]
+    log_b_cumsum = np.cumsum(np.log(b[:num_indices]**2))
     result = np.empty((num_samples,num_indices*(deriv_order+1)))
     p = evaluate_orthonormal_polynomial_1d(x, nmax, ab)
     result[:,:num_indices] = p
 
     for deriv_num in range(1,deriv_order+1):
-        pd = np.zeros((num_samples,num_indices),dtype=float)
+        # write the derivatives directly into result. p is a view of the
+        # derivatives of the previous order
+        pd = result[:,deriv_num*num_indices:(deriv_num+1)*num_indices]
+        pd[:,:deriv_num] = 0.
         for jj in range(deriv_num,num_indices):
 
             if (jj == deriv_num):
                 # use following expression to avoid overflow issues when
                 # computing oveflow
                 pd[:,jj] = np.exp(
-                    sp.gammaln(deriv_num+1)-0.5*np.sum(np.log(b[:jj+1]**2)))
+                    sp.gammaln(deriv_num+1)-0.5*log_b_cumsum[jj])
             else:
                 
                 pd[:,jj]=\
                   (x-a[jj-1])*pd[:,jj-1]-b[jj-1]*pd[:,jj-2]+deriv_num*p[:,jj-1]
-                pd[:,jj] *= 1.0/b[jj]
+                pd[:,jj] *= inv_b[jj]
         p = pd
-        result[:,deriv_num*num_indices:(deriv_num+1)*num_indices] = p
     return result
 
-from scipy.sparse import diags as sparse_diags
+from scipy.linalg import eigh_tridiagonal
 def gauss_quadrature(recursion_coeffs,N):
     r"""Computes Gauss quadrature from recurrence coefficients
     
@@ -491,9 +579,11 @@ def gauss_quadrature(recursion_coeffs,N):
 
     a = recursion_coeffs[:,0]; b = recursion_coeffs[:,1];
 
-    # Form Jacobi matrix
-    J = np.diag(a[:N],0)+np.diag(b[1:N],1)+np.diag(b[1:N],-1)
-    x, __ = np.linalg.eigh(J)
+    # The nodes are the eigenvalues of the symmetric tridiagonal Jacobi
+    # matrix. The weights are computed from the Christoffel function
+    # rather than the eigenvectors because the latter loses the relative
+    # accuracy of very small weights
+    x = eigh_tridiagonal(a[:N],b[1:N],eigvals_only=True)
 
     w = evaluate_orthonormal_polynomial_1d(x, N-1, recursion_coeffs)
     w = 1./np.sum(w**2,axis=1)
@@ -522,17 +612,23 @@ def convert_orthonormal_polynomials_to_monomials_1d(ab,nmax):
     assert nmax < ab.shape[0]
     
     monomial_coefs = np.zeros((nmax+1,nmax+1))
+    inv_b = 1.0/ab[:nmax+1,1]
 
-    monomial_coefs[0,0] = 1/ab[0,1]
+    monomial_coefs[0,0] = inv_b[0]
 
     if nmax > 0:
-        monomial_coefs[1,:2]=np.array([-ab[0,0],1])*monomial_coefs[0,0]/ab[1,1]
+        monomial_coefs[1,:2]=np.array([-ab[0,0],1])*monomial_coefs[0,0]*inv_b[1]
+
+    if NUMBA_AVAILABLE:
+        convert_orthonormal_polynomials_to_monomials_1d_numba(
+            ab,nmax,inv_b,monomial_coefs)
+        return monomial_coefs
     
     for jj in range(2,nmax+1):
         monomial_coefs[jj,:jj]+=(
             -ab[jj-1,0]*monomial_coefs[jj-1,:jj]
-            -ab[jj-1,1]*monomial_coefs[jj-2,:jj])/ab[jj,1]
-        monomial_coefs[jj,1:jj+1]+=monomial_coefs[jj-1,:jj]/ab[jj,1]
+            -ab[jj-1,1]*monomial_coefs[jj-2,:jj])*inv_b[jj]
+        monomial_coefs[jj,1:jj+1]+=monomial_coefs[jj-1,:jj]*inv_b[jj]
     return monomial_coefs
 
     
@@ -560,18 +656,32 @@ def evaluate_three_term_recurrence_polynomial_1d(abc,nmax,x):
        The values of the polynomials at the samples
     """
     assert nmax < abc.shape[0]
+
+    if NUMBA_AVAILABLE:
+        p = np.empty((x.shape[0],nmax+1),dtype=float)
+        evaluate_three_term_recurrence_polynomial_1d_numba(
+            abc,nmax,np.asarray(x,dtype=float),p)
+        return p
     
-    p = np.zeros((x.shape[0],nmax+1),dtype=float)
+    # store the polynomials of each degree contiguously and update them in
+    # place to avoid creating temporaries
+    p = np.zeros((nmax+1,x.shape[0]),dtype=float)
+    scratch = np.empty(x.shape[0],dtype=float)
 
-    p[:,0] = abc[0,0]
+    p[0] = abc[0,0]
 
     if nmax > 0:
-        p[:,1] = (abc[1,0]*x - abc[1,1])*p[:,0]
+        p[1] = (abc[1,0]*x - abc[1,1])*p[0]
 
     for jj in range(2, nmax+1):
-        p[:,jj] = (abc[jj,0]*x-abc[jj,1])*p[:,jj-1]-abc[jj,2]*p[:,jj-2]
-
-    return p
+        np.multiply(abc[jj,0],x,out=p[jj])
+        p[jj] -= abc[jj,1]
+        p[jj] *= p[jj-1]
+        np.multiply(abc[jj,2],p[jj-2],out=scratch)
+        p[jj] -= scratch
+
+    # return the same C ordered layout as the numba implementation
+    return np.ascontiguousarray(p.T)
     
 
 def convert_orthonormal_recurence_to_three_term_recurence(recursion_coefs):
@@ -649,3 +759,55 @@ def convert_orthonormal_expansion_to_monomial_expansion_1d(ortho_coef,ab,
     # shift to desired domain
     mono_coefs =  shift_momomial_expansion(mono_coefs,shift,scale)
     return mono_coefs
+
+def evaluate_orthonormal_expansion_1d(coef,ab,x):
+    r"""
+    Evaluate a univariate orthonormal polynomial expansion
+
+    .. math:: f(x)=\sum_{k=0}^{N-1} c_k\phi_k(x)
+
+    using Clenshaw's algorithm. Unlike evaluating the basis with 
+    :func:`evaluate_orthonormal_polynomial_1d` the values of the 
+    individual basis functions are never stored.
+
+    Parameters
+    ----------
+    coef : np.ndarray (N) or (N,nqoi)
+        The expansion coeficients :math:`c_k`
+
+    ab : np.ndarray (num_recursion_coeffs,2)
+       The recursion coefficients of the polynomial family :math:`\phi_k`. 
+       num_recursion_coeffs>=N
+
+    x : np.ndarray (num_samples)
+       The samples at which to evaluate the expansion
+
+    Returns
+    -------
+    vals : np.ndarray (num_samples) or (num_samples,nqoi)
+        The values of the expansion at the samples
+    """
+    assert coef.ndim<=2
+    num_terms = coef.shape[0]
+    assert num_terms <= ab.shape[0]
+    coef_2d = coef.reshape(num_terms,-1)
+    x = np.asarray(x,dtype=float)[:,np.newaxis]
+    a = ab[:,0]; b = ab[:,1]
+    # the reverse recurrence is
+    # y_k = c_k + (x-a_k)/b_{k+1}*y_{k+1} - b_{k+1}/b_{k+2}*y_{k+2}
+    # with y_N = y_{N+1} = 0. Only y_{k+1} and y_{k+2} are stored
+    y1 = np.zeros((x.shape[0],coef_2d.shape[1]))
+    y2 = np.zeros_like(y1)
+    for kk in range(num_terms-1,-1,-1):
+        # y2 is overwritten with y_k
+        if kk < num_terms-2:
+            y2 *= -b[kk+1]/b[kk+2]
+        if kk < num_terms-1:
+            y2 += (x-a[kk])/b[kk+1]*y1
+        y2 += coef_2d[kk]
+        y1, y2 = y2, y1
+    # f(x) = y_0*p_0(x)
+    vals = y1/b[0]
+    if coef.ndim==1:
+        return vals[:,0]
+    return vals
@@ -23,7 +23,8 @@ def christoffel_function(samples,basis_matrix_generator,normalize=False):
                 if x are Gauss quadrature points
     """
     basis_matrix = basis_matrix_generator(samples)
-    vals =  1./christoffel_weights(basis_matrix)
+    # sum the squares of each row without forming basis_matrix**2
+    vals = np.einsum('ij,ij->i',basis_matrix,basis_matrix)
     if normalize:
         vals /= basis_matrix.shape[1]
     return vals
@@ -33,7 +34,7 @@ def christoffel_weights(basis_matrix):
     Evaluate the 1/K(x),from a basis matrix, where K(x) is the 
     Christoffel function.
     """
-    return 1./np.sum(basis_matrix**2,axis=1)
+    return 1./np.einsum('ij,ij->i',basis_matrix,basis_matrix)
 
 def christoffel_preconditioner(basis_matrix,samples):
     return christoffel_weights(basis_matrix)
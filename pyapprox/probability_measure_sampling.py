@@ -177,7 +177,7 @@ def generate_independent_random_samples(variable,num_samples,
 def rejection_sampling( target_density, proposal_density, 
                         generate_proposal_samples, envelope_factor,
                         num_vars, num_samples, verbose=False,
-                        batch_size=None):
+                        batch_size=None,random_state=None):
     """
     Obtain samples from a density f(x) using samples from a proposal 
     distribution g(x).
@@ -210,6 +210,10 @@ def rejection_sampling( target_density, proposal_density,
         The number of evaluations of each density to be performed in a batch.
         Almost always we should set batch_size=num_samples
 
+    random_state : np.random.RandomState
+        The random number generator used to accept or reject the proposal
+        samples. If None the global numpy generator is used
+
     Returns
     -------
     samples : np.ndarray (num_vars, num_samples)
@@ -217,6 +221,8 @@ def rejection_sampling( target_density, proposal_density,
     """
     if batch_size is None:
         batch_size = num_samples
+    if random_state is None:
+        random_state = np.random
     
     cntr = 0
     num_proposal_samples = 0
@@ -227,20 +233,19 @@ def rejection_sampling( target_density, proposal_density,
         proposal_density_vals = proposal_density(proposal_samples)
         assert target_density_vals.shape[0]==batch_size
         assert proposal_density_vals.shape[0]==batch_size
-        urand = np.random.uniform(0.,1.,(batch_size))
+        urand = random_state.uniform(0.,1.,(batch_size))
+        envelope_density_vals = envelope_factor*proposal_density_vals
+        acceptance_ratios = target_density_vals/envelope_density_vals
 
         # ensure envelop_factor is large enough
-        if np.any(target_density_vals>(envelope_factor*proposal_density_vals)):
-            I = np.argmax(
-                target_density_vals/(envelope_factor*proposal_density_vals))
+        if np.any(acceptance_ratios>1):
+            I = np.argmax(acceptance_ratios)
             msg = 'proposal_density*envelop factor does not bound target '
             msg += 'density: %f,%f'%(
-                target_density_vals[I],
-                (envelope_factor*proposal_density_vals)[I])
+                target_density_vals[I],envelope_density_vals[I])
             raise Exception(msg)
         
-        I = np.where(
-            urand<target_density_vals/(envelope_factor*proposal_density_vals))[0]
+        I = np.flatnonzero(urand<acceptance_ratios)
 
         num_batch_samples_accepted = min(I.shape[0],num_samples-cntr)
         I = I[:num_batch_samples_accepted]
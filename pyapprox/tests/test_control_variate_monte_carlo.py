@@ -6,6 +6,12 @@ from pyapprox.configure_plots import *
 from pyapprox.control_variate_monte_carlo import *
 from scipy.stats import uniform,norm,lognorm
 from functools import partial
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # numba is an optional dependency
+    NUMBA_AVAILABLE = False
 
 skiptest = unittest.skipIf(
     not use_torch, reason="active_subspace package missing")
@@ -66,6 +72,30 @@ class PolynomialModelEnsemble(object):
         cov = np.cov(vals,aweights=w,rowvar=False,ddof=0)
         return cov
 
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def evaluate_tunable_model_numba(samples,A,cos_theta,sin_theta,power,
+                                     shift,vals):
+        """
+        Evaluate A*(cos(theta)*x**power+sin(theta)*y**power)+shift one
+        sample at a time. The values are written into vals.
+        """
+        for ii in range(samples.shape[1]):
+            vals[ii,0] = A*(cos_theta*samples[0,ii]**power+
+                            sin_theta*samples[1,ii]**power)+shift
+
+def evaluate_tunable_model(samples,A,theta,power,shift):
+    assert samples.shape[0]==2
+    if NUMBA_AVAILABLE:
+        vals = np.empty((samples.shape[1],1))
+        evaluate_tunable_model_numba(
+            np.asarray(samples,dtype=float),A,np.cos(theta),np.sin(theta),
+            power,shift,vals)
+        return vals
+    x,y=samples[0,:],samples[1,:]
+    return (A*(np.cos(theta) * x**power + np.sin(theta) * y**power)+
+            shift)[:,np.newaxis]
+
 class TunableModelEnsemble(object):
     
     def __init__(self,theta1,shifts=None):
@@ -100,22 +130,15 @@ class TunableModelEnsemble(object):
 
         
     def m0(self,samples):
-        assert samples.shape[0]==2
-        x,y=samples[0,:],samples[1,:]
-        return (self.A0*(np.cos(self.theta0) * x**5 + np.sin(self.theta0) *
-                         y**5))[:,np.newaxis]
+        return evaluate_tunable_model(samples,self.A0,self.theta0,5,0.)
     
     def m1(self,samples):
-        assert samples.shape[0]==2
-        x,y=samples[0,:],samples[1,:]
-        return (self.A1*(np.cos(self.theta1) * x**3 + np.sin(self.theta1) *
-                         y**3)+self.shifts[0])[:,np.newaxis]
+        return evaluate_tunable_model(
+            samples,self.A1,self.theta1,3,float(self.shifts[0]))
     
     def m2(self,samples):
-        assert samples.shape[0]==2
-        x,y=samples[0,:],samples[1,:]
-        return (self.A2*(np.cos(self.theta2) * x + np.sin(self.theta2) *
-                         y)+self.shifts[1])[:,np.newaxis]
+        return evaluate_tunable_model(
+            samples,self.A2,self.theta2,1,float(self.shifts[1]))
 
     def get_covariance_matrix(self):
         cov = np.eye(self.nmodels)
@@ -67,17 +67,18 @@ class TestInducedSampling(unittest.TestCase):
         pce.set_indices(indices)
 
         num_samples = int(1e4)
-        np.random.seed(1)
-        canonical_samples = generate_induced_samples(pce,num_samples)
+        random_state = np.random.RandomState(1)
+        canonical_samples = generate_induced_samples(
+            pce,num_samples,random_state=random_state)
         samples = var_trans.map_from_canonical_space(canonical_samples)
 
-        np.random.seed(1)
+        random_state = np.random.RandomState(1)
         canonical_xk = [get_distribution_info(var1)[2]['xk'],
                         get_distribution_info(var2)[2]['xk']]
         basis_matrix_generator = partial(basis_matrix_generator_1d,pce,degree)
         canonical_samples1 = discrete_induced_sampling(
             basis_matrix_generator,pce.indices,canonical_xk,
-            [var1.dist.pk,var2.dist.pk],num_samples)
+            [var1.dist.pk,var2.dist.pk],num_samples,random_state)
         samples1 = var_trans.map_from_canonical_space(canonical_samples1)
 
         def density(x):
@@ -85,7 +86,9 @@ class TestInducedSampling(unittest.TestCase):
         
         envelope_factor = 30
         def generate_proposal_samples(n):
-            samples = np.vstack([var1.rvs(n),var2.rvs(n)])
+            samples = np.empty((2,n))
+            samples[0,:] = random_state.choice(mass_locations1,n,p=masses1)
+            samples[1,:] = random_state.choice(mass_locations2,n,p=masses2)
             return samples
         proposal_density = density
 
@@ -94,7 +97,8 @@ class TestInducedSampling(unittest.TestCase):
         # densities must be mapped to this space also which can be difficult
         samples2 = random_induced_measure_sampling(
             num_samples,pce.num_vars(),pce.basis_matrix,density,
-            proposal_density, generate_proposal_samples,envelope_factor)
+            proposal_density, generate_proposal_samples,envelope_factor,
+            random_state=random_state)
         
         def induced_density(x):
             vals = density(x)*christoffel_function(
@@ -123,9 +127,9 @@ class TestInducedSampling(unittest.TestCase):
         #print(samples.mean(axis=1))
         #print(samples1.mean(axis=1)-true_induced_mean,true_induced_mean*rtol)
         #print(samples2.mean(axis=1))
-        assert np.allclose(samples.mean(axis=1),true_induced_mean,rtol=rtol)
-        assert np.allclose(samples1.mean(axis=1),true_induced_mean,rtol=rtol)
-        assert np.allclose(samples2.mean(axis=1),true_induced_mean,rtol=rtol)
+        for samples_ii in [samples,samples1,samples2]:
+            np.testing.assert_allclose(
+                samples_ii.mean(axis=1),true_induced_mean,rtol=rtol,atol=1e-8)
         
 
     def test_multivariate_sampling_jacobi(self):
@@ -136,8 +140,8 @@ class TestInducedSampling(unittest.TestCase):
         num_samples = 10
         indices = np.ones((2,num_samples),dtype=int)*degree
         indices[1,:] = degree-1
-        xx = np.tile(
-            np.linspace(0.01,0.99,(num_samples))[np.newaxis,:],(num_vars,1))
+        xx = np.broadcast_to(
+            np.linspace(0.01,0.99,(num_samples)),(num_vars,num_samples))
         samples = univ_inv(xx, indices)
         
         var_trans = AffineRandomVariableTransformation(
@@ -202,12 +206,21 @@ class TestInducedSampling(unittest.TestCase):
         cond_tol = 1e2
         samples = generate_induced_samples_migliorati_tolerance(pce,cond_tol)
 
-        for dd in range(2,degree):
+        # store the indices of all levels in one preallocated array
+        level_indices = [compute_hyperbolic_level_indices(num_vars, dd, 1.)
+                         for dd in range(2,degree)]
+        all_indices = np.empty(
+            (num_vars,indices.shape[1]+sum(
+                [idx.shape[1] for idx in level_indices])),dtype=int)
+        nindices = indices.shape[1]
+        all_indices[:,:nindices] = indices
+        for new_indices in level_indices:
             num_prev_samples = samples.shape[1]
-            new_indices = compute_hyperbolic_level_indices(num_vars, dd, 1.)
             samples = increment_induced_samples_migliorati(
-                pce,cond_tol,samples,indices,new_indices)
-            indices = np.hstack((indices,new_indices))
+                pce,cond_tol,samples,all_indices[:,:nindices],new_indices)
+            all_indices[:,nindices:nindices+new_indices.shape[1]]=new_indices
+            nindices += new_indices.shape[1]
+            indices = all_indices[:,:nindices]
             pce.set_indices(indices)
             new_samples = samples[:,num_prev_samples:]
             prev_samples = samples[:,:num_prev_samples]
@@ -295,6 +295,66 @@ class TestOrthonormalPolynomials1D(unittest.TestCase):
             ortho_coef,ab,mu,sigma)
         true_mono_coefs = np.array([-mu**3,3*mu**2,-3*mu,1])/sigma**3
         assert np.allclose(mono_coefs,true_mono_coefs)
+
+    def test_evaluate_monic_polynomial_1d(self):
+        degree = 6
+        ab = jacobi_recurrence(degree+1,alpha=1,beta=2,probability=True)
+        x = np.linspace(-1,1,11)
+        # the monic recurrence uses the orthogonal recursion coefficients
+        ab_monic = ab.copy(); ab_monic[:,1] = ab[:,1]**2
+        p_monic = evaluate_monic_polynomial_1d(x,degree,ab_monic)
+        # the orthonormal polynomial p_n is the monic polynomial divided
+        # by b_1*...*b_n
+        p_ortho = evaluate_orthonormal_polynomial_1d(x,degree,ab)
+        scales = np.cumprod(np.concatenate([[1],ab[1:degree+1,1]]))
+        assert np.allclose(p_monic,p_ortho*scales)
+        # integer samples are supported
+        assert np.allclose(
+            evaluate_monic_polynomial_1d(np.arange(3),degree,ab_monic),
+            evaluate_monic_polynomial_1d(np.arange(3.),degree,ab_monic))
+
+    def test_polynomial_memory_layout(self):
+        import pyapprox.orthonormal_polynomials_1d as module
+        degree = 4
+        ab = jacobi_recurrence(degree+1,alpha=1,beta=2,probability=True)
+        abc = convert_orthonormal_recurence_to_three_term_recurence(ab)
+        x = np.linspace(-1,1,11)
+        flags = (module.NUMBA_AVAILABLE,module.CYTHON_AVAILABLE)
+        values = []
+        try:
+            # compare the compiled and the numpy implementations
+            for available in [flags,(False,False)]:
+                module.NUMBA_AVAILABLE,module.CYTHON_AVAILABLE = available
+                values.append([
+                    evaluate_monic_polynomial_1d(x,degree,ab),
+                    evaluate_orthonormal_polynomial_1d(x,degree,ab),
+                    evaluate_three_term_recurrence_polynomial_1d(
+                        abc,degree,x)])
+        finally:
+            module.NUMBA_AVAILABLE,module.CYTHON_AVAILABLE = flags
+        for vals1, vals2 in zip(*values):
+            assert vals1.flags['C_CONTIGUOUS']
+            assert vals2.flags['C_CONTIGUOUS']
+            assert np.allclose(vals1,vals2)
+
+    def test_cache_recursion_coefficients(self):
+        ab = jacobi_recurrence(5,alpha=1,beta=2,probability=True)
+        # modifying the returned coefficients does not modify the cache
+        ab_copy = ab.copy()
+        ab[:,1] = ab[:,1]**2
+        assert np.allclose(
+            jacobi_recurrence(5,alpha=1,beta=2,probability=True),ab_copy)
+
+    def test_evaluate_orthonormal_expansion_1d(self):
+        ab = jacobi_recurrence(10,alpha=1,beta=2,probability=True)
+        x = np.linspace(-1,1,11)
+        for num_terms in range(1,ab.shape[0]+1):
+            coef = np.random.normal(0,1,(num_terms,2))
+            basis_mat = evaluate_orthonormal_polynomial_1d(x,num_terms-1,ab)
+            vals = evaluate_orthonormal_expansion_1d(coef,ab,x)
+            assert np.allclose(vals,basis_mat.dot(coef))
+            vals = evaluate_orthonormal_expansion_1d(coef[:,0],ab,x)
+            assert np.allclose(vals,basis_mat.dot(coef[:,0]))
         
 
 if __name__ == "__main__":
@@ -3,9 +3,13 @@ from pyapprox.cvar_regression import *
 from pyapprox.stochastic_dominance import *
 from scipy.special import erf, erfinv, factorial
 from scipy.stats import truncnorm as truncnorm_rv, triang as triangle_rv, \
-    lognorm as lognormal_rv
+    lognorm as lognormal_rv, norm as normal_rv
 from pyapprox.configure_plots import *
 from pyapprox.optimization import check_gradients
+import scipy
+# the HiGHS solvers were added in scipy 1.6
+HIGHS_AVAILABLE = tuple(
+    int(v) for v in scipy.__version__.split('.')[:2])>=(1,6)
 
 def plot_1d_functions_and_statistics(
             functions,labels,samples,values,stat_function,eta):
@@ -552,6 +556,13 @@ class TestRiskMeasures(unittest.TestCase):
         assert np.allclose(cvar3,CVaR(alpha))
         assert np.allclose(cvar4,CVaR(alpha))
 
+        # start the optimizer at a grid estimate of the VaR
+        value_at_risk5,cvar5 = compute_cvar_from_univariate_function(
+            f,partial(normal_rv.pdf,loc=mu,scale=sigma),lbx,ubx,alpha,None,
+            tol=1e-7)
+        assert np.allclose(cvar5,CVaR(alpha))
+        assert np.allclose(value_at_risk5,VaR(alpha),atol=1e-3)
+
     def test_second_order_stochastic_dominance(self):
         np.random.seed(4)
         solver = partial(solve_SSD_constrained_least_squares,return_full=True)
@@ -698,6 +709,18 @@ class TestRiskMeasures(unittest.TestCase):
         #print(cvar_exact,ecvar)
         assert np.allclose(cvar_exact,ecvar)
 
+    @unittest.skipIf(not NUMBA_AVAILABLE, "numba not installed")
+    def test_conditional_value_at_risk_sorted_numba(self):
+        nsamples = 101
+        xx = np.sort(np.random.normal(0,1,nsamples))
+        ww = np.random.uniform(0,1,nsamples)
+        ww /= ww.sum()
+        for alpha in [0,0.5,0.9]:
+            VaR,index = value_at_risk(xx,alpha,ww,samples_sorted=True)
+            CVaR = VaR+1/(1-alpha)*np.sum((xx[index+1:]-VaR)*ww[index+1:])
+            assert np.allclose(conditional_value_at_risk_sorted_numba(
+                xx,ww,alpha),[CVaR,VaR])
+
     def test_conditional_value_at_risk_gradient(self):
         N = 6
         p = np.ones(N)/N
@@ -715,6 +738,80 @@ class TestRiskMeasures(unittest.TestCase):
         cvar_grad_fd = approx_jacobian(func,X)
         assert np.allclose(cvar_grad,cvar_grad_fd,atol=1e-7)
         
+    def test_cvar_regression_constraints(self):
+        nsamples, nbasis, nuvars = 7, 3, 4
+        basis_matrix = np.random.normal(0,1,(nsamples,nbasis))
+        nvconstraints = nsamples*nuvars
+        Iv = np.identity(nvconstraints)
+        constraints_1 = np.hstack((
+            -np.tile(basis_matrix,(nuvars,1)),
+            -np.repeat(np.identity(nuvars),nsamples,axis=0),
+            -Iv,np.zeros((nvconstraints,1))))
+        constraints_2 = np.hstack((
+            -basis_matrix,np.zeros((nsamples,nuvars+nvconstraints)),
+            -np.ones((nsamples,1))))
+        constraints_3 = np.hstack((
+            np.zeros((nvconstraints,nbasis+nuvars)),-Iv,
+            np.zeros((nvconstraints,1))))
+        G_arr = np.vstack((constraints_1,constraints_2,constraints_3))
+        G = get_cvar_regression_constraints(basis_matrix,nuvars)
+        assert np.allclose(G.toarray(),G_arr)
+
+        # regression of a function in the span of the basis is exact
+        samples = np.random.uniform(-1,1,20)
+        basis_matrix = np.vstack([samples**k for k in range(4)]).T
+        coef = np.array([1.,2.,3.,4.])
+        assert np.allclose(cvar_regression(
+            basis_matrix,basis_matrix.dot(coef),0.8,verbosity=0),coef)
+
+    def test_cvar_regression_ru(self):
+        np.random.seed(1)
+        nsamples, alpha = 40, 0.8
+        samples = np.random.uniform(-1,1,nsamples)
+        basis_matrix = np.vstack([samples**k for k in range(4)]).T
+        coef = np.array([1.,2.,3.,4.])
+        assert np.allclose(cvar_regression_ru(
+            basis_matrix,basis_matrix.dot(coef),alpha,verbosity=0),coef)
+        # check the column scaling of the LP when the basis is large
+        large_basis_matrix = basis_matrix*np.array([1,1e1,1e2,1e3])
+        assert np.allclose(cvar_regression_ru(
+            large_basis_matrix,large_basis_matrix.dot(coef),alpha,
+            verbosity=0),coef)
+
+        values = np.cos(2*samples)+0.1*np.random.normal(0,1,nsamples)
+        def cvar_deviation(coef):
+            residuals = values-basis_matrix[:,1:].dot(coef[1:])
+            return conditional_value_at_risk(
+                residuals,alpha)-residuals.mean()
+        coef = cvar_regression_ru(basis_matrix,values,alpha,verbosity=0)
+        residuals = values-basis_matrix[:,1:].dot(coef[1:])
+        assert np.allclose(
+            coef[0],conditional_value_at_risk(residuals,alpha))
+        # the LP minimizes the CVaR deviation exactly
+        from scipy.optimize import minimize
+        result = minimize(
+            lambda c: cvar_deviation(np.hstack([0,c])),coef[1:]+0.1,
+            method='Nelder-Mead',
+            options={'xatol':1e-10,'fatol':1e-12,'maxiter':20000})
+        assert cvar_deviation(coef)<=result.fun+1e-7
+
+    @unittest.skipIf(not HIGHS_AVAILABLE, "scipy HiGHS solvers not available")
+    def test_cvar_regression_highs(self):
+        np.random.seed(1)
+        samples = np.random.uniform(-1,1,40)
+        basis_matrix = np.vstack([samples**k for k in range(4)]).T
+        values = np.cos(2*samples)+0.1*np.random.normal(0,1,40)
+        coef = cvar_regression(basis_matrix,values,0.8,verbosity=0)
+        for solver_name in ['highs','highs-ds']:
+            assert np.allclose(cvar_regression(
+                basis_matrix,values,0.8,verbosity=0,solver_name=solver_name),
+                               coef,atol=1e-6)
+        coef = cvar_regression_quadrature(
+            basis_matrix,values,0.8,5,verbosity=0)
+        assert np.allclose(cvar_regression_quadrature(
+            basis_matrix,values,0.8,5,verbosity=0,solver_name='highs-ds'),
+                           coef,atol=1e-6)
+
     def test_conditional_value_at_risk_using_opitmization_formula(self):
         """
         Compare value obtained via optimization and analytical formula
@@ -36,6 +36,10 @@ class TestUtilities(unittest.TestCase):
         output = outer_product( [s1] )
         assert np.allclose( output, s1 )
 
+        # the result must not share memory with the inputs
+        output[:] = -1
+        assert np.allclose( s1, np.arange( 0, 3 ) )
+
         
     def test_truncated_pivoted_lu_factorization(self):
         np.random.seed(2)
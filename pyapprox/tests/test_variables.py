@@ -164,6 +164,11 @@ class TestVariables(unittest.TestCase):
         samples = var1.rvs(size=(1,num_samples))
         assert np.allclose(samples.mean(),var1.moment(1),atol=1e-2)
 
+        # the samples are drawn from the random_state when provided
+        samples1 = var1.rvs(size=10,random_state=np.random.RandomState(2))
+        samples2 = var1.rvs(size=10,random_state=2)
+        assert np.allclose(samples1,samples2)
+
         #import matplotlib.pyplot as plt
         #xx = np.linspace(0,33,301)
         #plt.plot(mass_locations1,np.cumsum(masses1),'rss')
@@ -139,13 +139,28 @@ def cartesian_product(input_sets, elem_size=1):
         where sizes[ii] = len(input_sets[ii]), ii=0,..,num_sets-1.
         result.dtype will be set to the first entry of the first input_set
     """
-    import itertools
-    out = []
-    ## ::-1 reverse order to be backwards compatiable with old
-    ## function below
-    for r in itertools.product(*input_sets[::-1]):
-        out.append(r)
-    out = np.asarray(out).T[::-1,:]
+    input_arrays = [np.asarray(s) for s in input_sets]
+    if any([s.ndim!=1 for s in input_arrays]):
+        import itertools
+        out = []
+        ## ::-1 reverse order to be backwards compatiable with old
+        ## function below
+        for r in itertools.product(*input_sets[::-1]):
+            out.append(r)
+        out = np.asarray(out).T[::-1,:]
+        return out
+
+    # The entries of the first set vary fastest. Viewing each row of the
+    # result as a tensor with the axes of the sets in reverse order allows
+    # each set to be broadcast directly into the result
+    num_sets = len(input_arrays)
+    sizes = [s.shape[0] for s in input_arrays][::-1]
+    out = np.empty(
+        (num_sets,np.prod(sizes,dtype=int)),dtype=np.result_type(*input_arrays))
+    for jj in range(num_sets):
+        shape = [1]*num_sets
+        shape[num_sets-1-jj] = sizes[num_sets-1-jj]
+        out[jj].reshape(sizes)[...] = input_arrays[jj].reshape(shape)
     return out
    
     try:
@@ -215,8 +230,13 @@ def outer_product(input_sets):
        The outer product of the sets.
        result.dtype will be set to the first entry of the first input_set
     """
-    out = cartesian_product(input_sets)
-    return np.prod(out,axis=0)
+    # The entries of the first set vary fastest. Copy the first set so
+    # in-place updates of the result, e.g. by
+    # get_tensor_product_quadrature_rule, do not modify the input
+    out = np.array(input_sets[0],copy=True)
+    for ii in range(1,len(input_sets)):
+        out = np.outer(input_sets[ii],out).ravel()
+    return out
     
     try:
         from pyapprox.cython.utilities import outer_product_pyx
@@ -87,7 +87,10 @@ def get_unique_variables(variables):
     for ii in range(1,nvars):
         found = False
         for jj in range(len(unique_variables)):
-            if variables_equivalent(variables[ii],unique_variables[jj]):
+            # lists such as [rv]*nvars contain the same object many times so
+            # check identity before the more expensive equivalence test
+            if (variables[ii] is unique_variables[jj] or
+                variables_equivalent(variables[ii],unique_variables[jj])):
                 unique_var_indices[jj].append(ii)
                 found=True
                 break
@@ -243,6 +246,18 @@ class IndependentMultivariateRandomVariable(object):
         
      
 from scipy.stats._distn_infrastructure import rv_sample
+
+def _check_random_state(random_state):
+    """
+    Turn random_state into a np.random.RandomState. None returns the global
+    numpy generator and an integer seeds a new generator.
+    """
+    if random_state is None:
+        return np.random.mtrand._rand
+    if isinstance(random_state,(int,np.integer)):
+        return np.random.RandomState(random_state)
+    return random_state
+
 class float_rv_discrete(rv_sample):
     """Discrete distribution defined on locations represented as floats.
 
@@ -263,7 +278,7 @@ class float_rv_discrete(rv_sample):
         return super(float_rv_discrete, cls).__new__(cls)
     
     def _rvs(self):
-        samples = np.random.choice(self.xk,size=self._size,p=self.pk)
+        samples = self._random_state.choice(self.xk,size=self._size,p=self.pk)
         return samples
 
     def rvs(self, *args, **kwds):
@@ -305,7 +320,7 @@ class float_rv_discrete(rv_sample):
         # extra gymnastics needed for a custom random_state
         if rndm is not None:
             random_state_saved = self._random_state
-            self._random_state = check_random_state(rndm)
+            self._random_state = _check_random_state(rndm)
 
         # `size` should just be an argument to _rvs(), but for, um,
         # historical reasons, it is made an attribute that is read
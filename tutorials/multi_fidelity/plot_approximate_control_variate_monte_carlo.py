@@ -142,45 +142,67 @@ print('ACVMC difference squared =',(acv_mean-exact_integral_f0)**2)
 
 #%%
 #Now lets compute the variance reduction for different sample sizes
-def compute_acv_two_model_variance_reduction(nsample_ratios,functions):
+def compute_acv_two_model_variance_reduction(nsample_ratios,functions,
+                                             values_shared=None):
     M = len(nsample_ratios) # number of lower fidelity models
     assert len(functions)==M+1
     
     ntrials=int(1e3)
     means = np.empty((ntrials,2))
-    for ii in range(ntrials):
-        samples_shared = model.generate_samples(nhf_samples)
-        # length M
-        samples_lf_only =[
-            model.generate_samples(nhf_samples*r-nhf_samples)
-            for r in nsample_ratios]
-        values_lf_only  =  [
-            f(s) for f,s in zip(functions[1:],samples_lf_only)]
-        # length M+1
-        values_shared  = [f(samples_shared) for f in functions]
-        #cov_mc  = np.cov(values_shared,rowvar=False)
-        # compute mean using only hf data
-        hf_mean = values_shared[0].mean()
-        means[ii,0]= hf_mean
-        # compute ACV mean
-        gamma=1-(nsample_ratios[0]-1)/nsample_ratios[0]*cov[0,1]**2/(
-            cov[0,0]*cov[1,1])
-        eta = -cov[0,1]/cov[1,1]
-        means[ii,1]=hf_mean+eta*(values_shared[1].mean()-
-            np.concatenate([values_shared[1],values_lf_only[0]]).mean())
+    # draw the samples of every trial at once and evaluate each model on
+    # all of them with a single call. Entry [ii,jj] of each array below
+    # holds the value at the jj-th sample of trial ii
+    # The values at the shared samples do not depend on the sample ratios
+    # so can be reused by experiments with different ratios
+    if values_shared is None:
+        samples_shared = model.generate_samples(nhf_samples*ntrials)
+        values_shared = np.empty((M+1,ntrials,nhf_samples))
+        for kk in range(M+1):
+            values_shared[kk] = functions[kk](samples_shared)[:,0].reshape(
+                ntrials,nhf_samples)
+        # the sample covariance of the models for each trial, computed for
+        # all trials at once. Their average approaches the exact covariance
+        centered_values = values_shared-values_shared.mean(
+            axis=2,keepdims=True)
+        covs_mc = np.einsum(
+            'mti,nti->tmn',centered_values,centered_values)/(nhf_samples-1)
+        print("Exact covariance\n",cov[:M+1,:M+1])
+        print("Mean of the sample covariances\n",covs_mc.mean(axis=0))
+    # the number of low fidelity only samples can differ between models so
+    # use one array per model. length M
+    values_lf_only = []
+    for kk in range(M):
+        nlf_only_samples = nhf_samples*nsample_ratios[kk]-nhf_samples
+        samples_lf_only = model.generate_samples(nlf_only_samples*ntrials)
+        values_lf_only.append(functions[kk+1](samples_lf_only)[:,0].reshape(
+            ntrials,nlf_only_samples))
+    shared_means = values_shared.mean(axis=2)
+    # compute mean using only hf data
+    means[:,0]= shared_means[0]
+    # compute ACV mean
+    eta = -cov[0,1]/cov[1,1]
+    # the mean of the low fidelity model over all rN samples is the
+    # weighted sum of the means over the shared and the low fidelity only
+    # samples
+    nlf_samples = nhf_samples*nsample_ratios[0]
+    lf_means = (nhf_samples*shared_means[1]+(nlf_samples-nhf_samples)*
+                values_lf_only[0].mean(axis=1))/nlf_samples
+    means[:,1]=shared_means[0]+eta*(shared_means[1]-lf_means)
 
     print("Theoretical ACV variance reduction",
           1-(nsample_ratios[0]-1)/nsample_ratios[0]*cov[0,1]**2/(
               cov[0,0]*cov[1,1]))
     print("Achieved ACV variance reduction",
          means[:,1].var(axis=0)/means[:,0].var(axis=0))
-    return means
+    return means, values_shared
 
 r1,r2=10,100
 print(f'Two model: r={r1}')
-means1 = compute_acv_two_model_variance_reduction([r1],[model.m0,model.m1])
+means1, values_shared = compute_acv_two_model_variance_reduction(
+    [r1],[model.m0,model.m1])
 print(f'Three model: r={r2}')
-means2 = compute_acv_two_model_variance_reduction([r2],[model.m0,model.m1])
+means2 = compute_acv_two_model_variance_reduction(
+    [r2],[model.m0,model.m1],values_shared)[0]
 print("Theoretical CV variance reduction",1-cov[0,1]**2/(cov[0,0]*cov[1,1]))
 
 #%%